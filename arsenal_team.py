@@ -1,154 +1,154 @@
-arsenal_players = {
-    'Aaron Ramsdale': {
-        'Number': 1,
-        'Position': 'Goalkeeper',
-        'Age': 25,
-        'Height': 1.88,
-        'Weight': 87,
-        'Nationality': 'England'
-    },
-    'William Saliba': {
-        'Number': 2,
-        'Position': 'Defender',
-        'Age': 22,
-        'Height': 1.93,
-        'Weight': 92,
-        'Nationality': 'France'
-    },
-    'Benjamin White': {
-        'Number': 4,
-        'Position': 'Defender',
-        'Age': 26,
-        'Height': 1.85,
-        'Weight': 76,
-        'Nationality': 'England'
-    },
-    'Gabriel Magalhaes': {
-        'Number': 6,
-        'Position': 'Defender',
-        'Age': 25,
-        'Height': 1.91,
-        'Weight': 78,
-        'Nationality': 'Brazil'
-    },
-    'Jurrien Timber': {
-        'Number': 12,
-        'Position': 'Defender',
-        'Age': 22,
-        'Height': 1.78,
-        'Weight': 78,
-        'Nationality': 'Netherlands'
-    },
-    'Jakub Kiwior': {
-        'Number': 15,
-        'Position': 'Defender',
-        'Age': 23,
-        'Height': 1.88,
-        'Weight': 73,
-        'Nationality': 'Poland'
-    },
-    'Takehiro Tomiyasu': {
-        'Number': 18,
-        'Position': 'Defender',
-        'Age': 25,
-        'Height': 1.88,
-        'Weight': 68,
-        'Nationality': 'Japan'
-    },
-    'Oleksandr Zinchenko': {
-        'Number': 35,
-        'Position': 'Defender',
-        'Age': 26,
-        'Height': 1.75,
-        'Weight': 63,
-        'Nationality': 'Ukraine'
-    },
-    'Thomas Partey': {
-        'Number': 5,
-        'Position': 'Midfielder',
-        'Age': 30,
-        'Height': 1.85,
-        'Weight': 77,
-        'Nationality': 'Ghana'
-    },
-    'Martin Odegaard': {
-        'Number': 8,
-        'Position': 'Midfielder',
-        'Age': 24,
-        'Height': 1.78,
-        'Weight': 68,
-        'Nationality': 'Norway'
-    },
-    'Emile Smith Rowe': {
-        'Number': 10,
-        'Position': 'Midfielder',
-        'Age': 23,
-        'Height': 1.83,
-        'Weight': 78,
-        'Nationality': 'England'
-    },
-    'Fabio Vieira': {
-        'Number': 21,
-        'Position': 'Midfielder',
-        'Age': 23,
-        'Height': 1.7,
-        'Weight': 58,
-        'Nationality': 'Portugal'
-    },
-    'Reiss Nelson': {
-        'Number': 24,
-        'Position': 'Forward',
-        'Age': 23,
-        'Height': 1.75,
-        'Weight': 71,
-        'Nationality': 'England'
-    },
-    'Mohamed Elneny': {
-        'Number': 25,
-        'Position': 'Midfielder',
-        'Age': 31,
-        'Height': 1.78,
-        'Weight': 72,
-        'Nationality': 'Egypt'
-    },
-    'Bukayo Saka': {
-        'Number': 7,
-        'Position': 'Forward',
-        'Age': 22,
-        'Height': 1.78,
-        'Weight': 72,
-        'Nationality': 'England'
-    },
-    'Gabriel Jesus': {
-        'Number': 9,
-        'Position': 'Forward',
-        'Age': 26,
-        'Height': 1.75,
-        'Weight': 73,
-        'Nationality': 'Brazil'
-    },
-    'Gabriel Martinelli': {
-        'Number': 11,
-        'Position': 'Forward',
-        'Age': 22,
-        'Height': 1.78,
-        'Weight': 73,
-        'Nationality': 'Brazil'
-    },
-    'Eddie Nketiah': {
-        'Number': 14,
-        'Position': 'Forward',
-        'Age': 24,
-        'Height': 1.75,
-        'Weight': 72,
-        'Nationality': 'England'
-    },
-    'Leandro Trossard': {
-        'Number': 19,
-        'Position': 'Forward',
-        'Age': 28,
-        'Height': 1.73,
-        'Weight': 59,
-        'Nationality': 'Belgium'
-    }
+arsenal_players = {
+    'Aaron Ramsdale': {
+        'Number': 1,
+        'Position': 'Goalkeeper',
+        'Age': 25,
+        'Height': 1.88,
+        'Weight': 87,
+        'Nationality': 'England'
+    },
+    'William Saliba': {
+        'Number': 2,
+        'Position': 'Defender',
+        'Age': 22,
+        'Height': 1.93,
+        'Weight': 92,
+        'Nationality': 'France'
+    },
+    'Benjamin White': {
+        'Number': 4,
+        'Position': 'Defender',
+        'Age': 26,
+        'Height': 1.85,
+        'Weight': 76,
+        'Nationality': 'England'
+    },
+    'Gabriel Magalhaes': {
+        'Number': 6,
+        'Position': 'Defender',
+        'Age': 25,
+        'Height': 1.91,
+        'Weight': 78,
+        'Nationality': 'Brazil'
+    },
+    'Jurrien Timber': {
+        'Number': 12,
+        'Position': 'Defender',
+        'Age': 22,
+        'Height': 1.78,
+        'Weight': 78,
+        'Nationality': 'Netherlands'
+    },
+    'Jakub Kiwior': {
+        'Number': 15,
+        'Position': 'Defender',
+        'Age': 23,
+        'Height': 1.88,
+        'Weight': 73,
+        'Nationality': 'Poland'
+    },
+    'Takehiro Tomiyasu': {
+        'Number': 18,
+        'Position': 'Defender',
+        'Age': 25,
+        'Height': 1.88,
+        'Weight': 68,
+        'Nationality': 'Japan'
+    },
+    'Oleksandr Zinchenko': {
+        'Number': 35,
+        'Position': 'Defender',
+        'Age': 26,
+        'Height': 1.75,
+        'Weight': 63,
+        'Nationality': 'Ukraine'
+    },
+    'Thomas Partey': {
+        'Number': 5,
+        'Position': 'Midfielder',
+        'Age': 30,
+        'Height': 1.85,
+        'Weight': 77,
+        'Nationality': 'Ghana'
+    },
+    'Martin Odegaard': {
+        'Number': 8,
+        'Position': 'Midfielder',
+        'Age': 24,
+        'Height': 1.78,
+        'Weight': 68,
+        'Nationality': 'Norway'
+    },
+    'Emile Smith Rowe': {
+        'Number': 10,
+        'Position': 'Midfielder',
+        'Age': 23,
+        'Height': 1.83,
+        'Weight': 78,
+        'Nationality': 'England'
+    },
+    'Fabio Vieira': {
+        'Number': 21,
+        'Position': 'Midfielder',
+        'Age': 23,
+        'Height': 1.7,
+        'Weight': 58,
+        'Nationality': 'Portugal'
+    },
+    'Reiss Nelson': {
+        'Number': 24,
+        'Position': 'Forward',
+        'Age': 23,
+        'Height': 1.75,
+        'Weight': 71,
+        'Nationality': 'England'
+    },
+    'Mohamed Elneny': {
+        'Number': 25,
+        'Position': 'Midfielder',
+        'Age': 31,
+        'Height': 1.78,
+        'Weight': 72,
+        'Nationality': 'Egypt'
+    },
+    'Bukayo Saka': {
+        'Number': 7,
+        'Position': 'Forward',
+        'Age': 22,
+        'Height': 1.78,
+        'Weight': 72,
+        'Nationality': 'England'
+    },
+    'Gabriel Jesus': {
+        'Number': 9,
+        'Position': 'Forward',
+        'Age': 26,
+        'Height': 1.75,
+        'Weight': 73,
+        'Nationality': 'Brazil'
+    },
+    'Gabriel Martinelli': {
+        'Number': 11,
+        'Position': 'Forward',
+        'Age': 22,
+        'Height': 1.78,
+        'Weight': 73,
+        'Nationality': 'Brazil'
+    },
+    'Eddie Nketiah': {
+        'Number': 14,
+        'Position': 'Forward',
+        'Age': 24,
+        'Height': 1.75,
+        'Weight': 72,
+        'Nationality': 'England'
+    },
+    'Leandro Trossard': {
+        'Number': 19,
+        'Position': 'Forward',
+        'Age': 28,
+        'Height': 1.73,
+        'Weight': 59,
+        'Nationality': 'Belgium'
+    }
 }
\ No newline at end of file
@@ -0,0 +1,477 @@
+import argparse
+import math
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from chunked_stack import ChunkedStack
+from concurrent_hash import ConcurrentLinkedHash
+from linked_hash import ENGINES, LinkedHash, create_hash
+from linked_list import LinkedList
+from linked_stack import LinkedStack
+from persistent_stack import PersistentStack
+from sharded_hash import ShardedHash
+from snapshot import dump, load
+from unrolled_list import UnrolledLinkedList
+
+
+def _per_op(start: float, count: int) -> float:
+    """
+    Converts the time elapsed since start into nanoseconds per operation.
+
+    Preconditions: count > 0
+    Input:
+        - start, a time.perf_counter() reading taken before the operations ran.
+        - count, the number of operations that ran.
+    Output: The mean cost of one operation in nanoseconds.
+    """
+    return (time.perf_counter() - start) * 1e9 / count
+
+
+def bench_hash_engines(min_exp: int, max_exp: int) -> None:
+    """
+    Times insert, hit lookup and miss lookup for every hash engine at sizes 10**min_exp .. 10**max_exp.
+
+    Preconditions: 1 <= min_exp <= max_exp
+    Output: Prints one row per engine and size, in nanoseconds per operation.
+    """
+    print(f"{'engine':<8} {'n':>10} {'insert':>10} {'hit':>10} {'miss':>10}")
+    for exp in range(min_exp, max_exp + 1):
+        n = 10 ** exp
+        keys = [f"key{i}" for i in range(n)]
+        misses = [f"miss{i}" for i in range(n)]
+        for engine in ENGINES:
+            table = create_hash(engine)
+            start = time.perf_counter()
+            for key in keys:
+                table.associate(key, key)
+            insert = _per_op(start, n)
+            start = time.perf_counter()
+            for key in keys:
+                table.get(key)
+            hit = _per_op(start, n)
+            start = time.perf_counter()
+            for key in misses:
+                table.has(key)
+            miss = _per_op(start, n)
+            print(f"{engine:<8} {n:>10} {insert:>10.0f} {hit:>10.0f} {miss:>10.0f}")
+
+
+def bench_value_index(min_exp: int, max_exp: int) -> None:
+    """
+    Compares scanning with the LinkedList value index for find_first and find_all.
+
+    Each list holds n ints drawn from n // 10 distinct values. Appends, tail insertions and deletions, and
+    replacements update the index in place; only an insertion or deletion in the middle of the list marks it
+    stale, to be rebuilt by the next lookup. The break-even column is the number of lookups between such
+    changes needed to repay one rebuild.
+
+    Preconditions: 1 <= min_exp <= max_exp
+    Output: Prints one row per size: scan and indexed lookup cost in nanoseconds, rebuild cost in microseconds.
+    """
+    print(f"{'n':>10} {'scan':>12} {'indexed':>10} {'rebuild':>10} {'break-even':>11}")
+    for exp in range(min_exp, max_exp + 1):
+        n = 10 ** exp
+        distinct = max(n // 10, 1)
+        values = [i % distinct for i in range(n)]
+        queries = [(i * 7919) % distinct for i in range(min(n, 1000))]
+        plain = LinkedList()
+        plain.from_array(values)
+        indexed = LinkedList(indexed=True)
+        indexed.from_array(values)
+        start = time.perf_counter()
+        for value in queries:
+            plain.find_first(value)
+            plain.find_all(value)
+        scan = _per_op(start, len(queries))
+        start = time.perf_counter()
+        indexed._index_stale = True
+        indexed.find_first(queries[0])
+        rebuild = _per_op(start, 1)
+        start = time.perf_counter()
+        for value in queries:
+            indexed.find_first(value)
+            indexed.find_all(value)
+        lookup = _per_op(start, len(queries))
+        break_even = rebuild / max(scan - lookup, 1)
+        print(f"{n:>10} {scan:>12.0f} {lookup:>10.0f} {rebuild / 1000:>10.0f} {break_even:>11.1f}")
+
+
+def bench_sort(min_exp: int, max_exp: int) -> None:
+    """
+    Compares LinkedList.sort and merge with sorting a copied array.
+
+    For each size, sorts n random integers in place with LinkedList.sort, and with and without a key. It then
+    takes the old route of create_array(), sorted() and from_array() into a fresh list, and times sorted() on
+    its own. Last, merges two sorted lists of n // 2 items against sorted() on their concatenated arrays.
+
+    Output: Prints one row per size, in milliseconds.
+    """
+    print(f"{'n':>10} {'sort':>9} {'sort key':>9} {'copy+sorted':>12} {'sorted()':>9} {'merge':>9} {'sorted(a+b)':>12}")
+    for exp in range(min_exp, max_exp + 1):
+        n = 10 ** exp
+        rng = random.Random(exp)
+        data = [rng.randrange(n) for _ in range(n)]
+        linked_list = LinkedList()
+        linked_list.extend(data)
+        start = time.perf_counter()
+        linked_list.sort()
+        in_place = (time.perf_counter() - start) * 1000
+        linked_list = LinkedList()
+        linked_list.extend(data)
+        start = time.perf_counter()
+        linked_list.sort(key=abs, reverse=True)
+        with_key = (time.perf_counter() - start) * 1000
+        linked_list = LinkedList()
+        linked_list.extend(data)
+        start = time.perf_counter()
+        LinkedList().from_array(sorted(linked_list.create_array()))
+        copied = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        sorted(data)
+        builtin = (time.perf_counter() - start) * 1000
+        left, right = LinkedList(), LinkedList()
+        left.extend(sorted(data[:n // 2]))
+        right.extend(sorted(data[n // 2:]))
+        start = time.perf_counter()
+        left.merge(right)
+        merged = (time.perf_counter() - start) * 1000
+        halves = sorted(data[:n // 2]), sorted(data[n // 2:])
+        start = time.perf_counter()
+        sorted(halves[0] + halves[1])
+        builtin_merge = (time.perf_counter() - start) * 1000
+        print(f"{n:>10} {in_place:>9.1f} {with_key:>9.1f} {copied:>12.1f} {builtin:>9.1f} {merged:>9.1f} {builtin_merge:>12.1f}")
+
+
+def bench_stacks(min_exp: int, max_exp: int) -> None:
+    """
+    Measures push and pop throughput of LinkedStack against ChunkedStack, item by item and in batches.
+
+    Preconditions: 1 <= min_exp <= max_exp
+    Output: Prints one row per stack variant and size, in nanoseconds per item pushed or popped.
+    """
+    print(f"{'stack':<22} {'n':>10} {'push':>8} {'pop':>8}")
+    for exp in range(min_exp, max_exp + 1):
+        n = 10 ** exp
+        items = list(range(n))
+        for name, stack_class in (("LinkedStack", LinkedStack), ("ChunkedStack", ChunkedStack)):
+            stack = stack_class()
+            start = time.perf_counter()
+            for item in items:
+                stack.push(item)
+            push = _per_op(start, n)
+            start = time.perf_counter()
+            for _ in items:
+                stack.pop()
+            pop = _per_op(start, n)
+            print(f"{name:<22} {n:>10} {push:>8.0f} {pop:>8.0f}")
+        stack = ChunkedStack()
+        start = time.perf_counter()
+        stack.push_many(items)
+        push = _per_op(start, n)
+        start = time.perf_counter()
+        stack.pop_many(n)
+        pop = _per_op(start, n)
+        print(f"{'ChunkedStack (batch)':<22} {n:>10} {push:>8.0f} {pop:>8.0f}")
+
+
+def bench_snapshots(min_exp: int, max_exp: int) -> None:
+    """
+    Measures the memory and time of keeping 10,000 stack snapshots, persistent versus copied.
+
+    Starting from a stack of n items, 10,000 random pushes and pops (half each) are applied and a snapshot is
+    kept after each one: a PersistentStack version, a copied LinkedStack, or a copied Python list. n runs over
+    10**1 .. 10**min(max_exp, 3), since copying larger stacks 10,000 times exhausts memory. min_exp is unused.
+
+    Output: Prints one row per approach and size, with the memory held by the snapshots and the elapsed time.
+    """
+    steps = 10_000
+
+    def persistent(n, moves):
+        stack = PersistentStack(range(n))
+        snapshots = []
+        for move in moves:
+            stack = stack.push(move) if move is not None or stack.is_empty() else stack.pop()
+            snapshots.append(stack)
+        return snapshots
+
+    def copied_linked_stack(n, moves):
+        stack = LinkedStack()
+        for item in range(n):
+            stack.push(item)
+        snapshots = []
+        for move in moves:
+            if move is not None or stack.is_empty():
+                stack.push(move)
+            else:
+                stack.pop()
+            copy = LinkedStack()
+            for item in reversed(list(stack)):
+                copy.push(item)
+            snapshots.append(copy)
+        return snapshots
+
+    def copied_list(n, moves):
+        stack = list(range(n))
+        snapshots = []
+        for move in moves:
+            if move is not None or not stack:
+                stack.append(move)
+            else:
+                stack.pop()
+            snapshots.append(stack.copy())
+        return snapshots
+
+    print(f"{'snapshots of':<20} {'n':>6} {'MB':>9} {'seconds':>9}")
+    for exp in range(1, min(max_exp, 3) + 1):
+        n = 10 ** exp
+        rng = random.Random(exp)
+        moves = [step if rng.random() < 0.5 else None for step in range(steps)]
+        for name, take_snapshots in (("PersistentStack", persistent), ("LinkedStack copy", copied_linked_stack),
+                                     ("list copy", copied_list)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            snapshots = take_snapshots(n, moves)
+            elapsed = time.perf_counter() - start
+            held = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del snapshots
+            print(f"{name:<20} {n:>6} {held / 1e6:>9.2f} {elapsed:>9.2f}")
+
+
+def bench_unrolled(min_exp: int, max_exp: int) -> None:
+    """
+    Compares random positional reads and inserts on LinkedList, UnrolledLinkedList and the built-in list.
+
+    Preconditions: 1 <= min_exp <= max_exp
+    Output: Prints one row per structure and size, in nanoseconds per operation.
+    """
+    print(f"{'structure':<22} {'n':>10} {'get':>10} {'insert':>10}")
+    for exp in range(min_exp, max_exp + 1):
+        n = 10 ** exp
+        rng = random.Random(exp)
+        reads = [rng.randrange(n) for _ in range(1000)]
+        inserts = [rng.randrange(n) for _ in range(1000)]
+        root = max(int(math.sqrt(n)), 2)
+        candidates = (
+            ("LinkedList", LinkedList),
+            ("Unrolled (64)", UnrolledLinkedList),
+            (f"Unrolled ({root})", lambda: UnrolledLinkedList(block_size=root)),
+        )
+        for name, factory in candidates:
+            structure = factory()
+            structure.from_array(list(range(n)))
+            start = time.perf_counter()
+            for index in reads:
+                structure.get_position(index)
+            get = _per_op(start, len(reads))
+            start = time.perf_counter()
+            for index in inserts:
+                structure.insert(index, index)
+            insert = _per_op(start, len(inserts))
+            print(f"{name:<22} {n:>10} {get:>10.0f} {insert:>10.0f}")
+        array = list(range(n))
+        start = time.perf_counter()
+        for index in reads:
+            array[index]
+        get = _per_op(start, len(reads))
+        start = time.perf_counter()
+        for index in inserts:
+            array.insert(index, index)
+        insert = _per_op(start, len(inserts))
+        print(f"{'list':<22} {n:>10} {get:>10.0f} {insert:>10.0f}")
+
+
+class _GloballyLockedHash:
+    """
+    A LinkedHash behind one lock, the baseline that ConcurrentLinkedHash is measured against.
+    """
+
+    def __init__(self):
+        self._table = LinkedHash()
+        self._lock = threading.Lock()
+
+    def associate(self, key, value):
+        with self._lock:
+            self._table.associate(key, value)
+
+    def get(self, key):
+        with self._lock:
+            return self._table.get(key)
+
+
+def bench_concurrent(min_exp: int, max_exp: int) -> None:
+    """
+    Measures mixed read/write throughput of ConcurrentLinkedHash against a globally locked LinkedHash.
+
+    A table of 10**max_exp keys is shared by 1, 2, 4 and 8 threads, which between them perform
+    10**max_exp operations: 80% get and 20% associate on random keys. min_exp is unused.
+
+    Output: Prints one row per table and thread count, in thousands of operations per second.
+    """
+    n = 10 ** max_exp
+    print(f"{'table':<22} {'threads':>8} {'kops/s':>10}")
+    for name, factory in (("global lock", _GloballyLockedHash), ("striped locks", ConcurrentLinkedHash)):
+        for threads in (1, 2, 4, 8):
+            table = factory()
+            for key in range(n):
+                table.associate(key, key)
+
+            def work(seed, count=n // threads, table=table):
+                rng = random.Random(seed)
+                for _ in range(count):
+                    key = rng.randrange(n)
+                    if rng.random() < 0.8:
+                        table.get(key)
+                    else:
+                        table.associate(key, seed)
+
+            workers = [threading.Thread(target=work, args=(seed,)) for seed in range(threads)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<22} {threads:>8} {n / elapsed / 1000:>10.0f}")
+
+
+def bench_sharded(min_exp: int, max_exp: int) -> None:
+    """
+    Times ShardedHash.build and get_many over 10**max_exp integer keys with 0 (in-process), 1, 2, 4 and 8 workers.
+
+    The build time includes partitioning the pairs and shipping them to the workers. Tens of millions of keys
+    need --max-exp 7 and several gigabytes of memory. min_exp is unused.
+
+    Output: Prints one row per worker count, with build and get_many times in seconds.
+    """
+    n = 10 ** max_exp
+    pairs = [(key, key) for key in range(n)]
+    print(f"{'workers':>8} {'build s':>10} {'get_many s':>12}")
+    for workers in (0, 1, 2, 4, 8):
+        start = time.perf_counter()
+        with ShardedHash.build(pairs, workers=workers) as table:
+            build = time.perf_counter() - start
+            start = time.perf_counter()
+            table.get_many(range(n))
+            lookup = time.perf_counter() - start
+        print(f"{workers:>8} {build:>10.2f} {lookup:>12.2f}")
+
+
+def _synthetic_players(n: int) -> dict:
+    """
+    Builds n player records shaped like arsenal_team.arsenal_players.
+    """
+    rng = random.Random(n)
+    positions = ["Goalkeeper", "Defender", "Midfielder", "Forward"]
+    nations = ["England", "France", "Brazil", "Norway", "Ghana", "Japan", "Spain", "Portugal"]
+    return {f"Player {i}": {"Number": i % 99 + 1, "Position": rng.choice(positions), "Age": rng.randint(17, 38),
+                            "Height": round(rng.uniform(1.6, 2.0), 2), "Weight": rng.randint(60, 95),
+                            "Nationality": rng.choice(nations)}
+            for i in range(n)}
+
+
+def bench_columnar(min_exp: int, max_exp: int) -> None:
+    """
+    Compares ColumnarTable queries with Python loops over a dict of synthetic player records.
+
+    The queries are "defenders over 1.85m", a sort by Age then Height, and mean Age/Height/Weight by Position.
+    Requires NumPy, which only this benchmark imports.
+
+    Output: Prints one row per size and query, with the loop and vectorised times in milliseconds.
+    """
+    from columnar_table import ColumnarTable
+
+    numeric = ["Age", "Height", "Weight"]
+
+    def loop_group(players):
+        sums = {}
+        for record in players.values():
+            total = sums.setdefault(record["Position"], [0, 0.0, 0.0, 0.0])
+            total[0] += 1
+            for i, name in enumerate(numeric, 1):
+                total[i] += record[name]
+        return {position: [value / total[0] for value in total[1:]] for position, total in sums.items()}
+
+    print(f"{'n':>10} {'query':<10} {'loop ms':>10} {'numpy ms':>10}")
+    for exp in range(min_exp, max_exp + 1):
+        n = 10 ** exp
+        players = _synthetic_players(n)
+        start = time.perf_counter()
+        table = ColumnarTable.from_records(players)
+        print(f"{n:>10} {'load':<10} {'':>10} {(time.perf_counter() - start) * 1000:>10.1f}")
+        queries = (
+            ("filter",
+             lambda: [name for name, record in players.items()
+                      if record["Position"] == "Defender" and record["Height"] > 1.85],
+             lambda: table.filter(table.mask("Position", "==", "Defender") & table.mask("Height", ">", 1.85))),
+            ("sort",
+             lambda: sorted(players.items(), key=lambda item: (item[1]["Age"], item[1]["Height"])),
+             lambda: table.sort(["Age", "Height"])),
+            ("group-by",
+             lambda: loop_group(players),
+             lambda: table.group_by("Position", numeric)),
+        )
+        for name, loop, vectorised in queries:
+            start = time.perf_counter()
+            loop()
+            loop_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            vectorised()
+            numpy_ms = (time.perf_counter() - start) * 1000
+            print(f"{n:>10} {name:<10} {loop_ms:>10.1f} {numpy_ms:>10.1f}")
+
+
+def bench_snapshot(min_exp: int, max_exp: int) -> None:
+    """
+    Compares starting up from a snapshot with rebuilding from a dict of player records.
+
+    For each size, times LinkedList.from_dict and LinkedHash.from_mapping against snapshot.load followed by
+    one key lookup. The snapshot file is in the page cache, so this measures decoding rather than disk reads.
+
+    Output: Prints one row per size, in milliseconds, and the snapshot size in megabytes.
+    """
+    print(f"{'n':>10} {'from_dict':>10} {'from_mapping':>13} {'load+get':>10} {'file MB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "players.snapshot")
+        for exp in range(min_exp, max_exp + 1):
+            n = 10 ** exp
+            players = _synthetic_players(n)
+            start = time.perf_counter()
+            LinkedList().from_dict(players)
+            from_dict = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            LinkedHash.from_mapping(players)
+            from_mapping = (time.perf_counter() - start) * 1000
+            dump(players, path)
+            start = time.perf_counter()
+            with load(path) as snapshot:
+                snapshot.get(f"Player {n // 2}")
+            cold = (time.perf_counter() - start) * 1000
+            print(f"{n:>10} {from_dict:>10.1f} {from_mapping:>13.1f} {cold:>10.2f} {os.path.getsize(path) / 1e6:>8.1f}")
+
+
+BENCHMARKS = {
+    "columnar": bench_columnar,
+    "concurrent": bench_concurrent,
+    "hash": bench_hash_engines,
+    "sharded": bench_sharded,
+    "snapshot": bench_snapshot,
+    "snapshots": bench_snapshots,
+    "sort": bench_sort,
+    "stack": bench_stacks,
+    "unrolled": bench_unrolled,
+    "value-index": bench_value_index,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the data structures in this repository.")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest size, as a power of ten")
+    parser.add_argument("--max-exp", type=int, default=6, help="largest size, as a power of ten")
+    args = parser.parse_args()
+    BENCHMARKS[args.benchmark](args.min_exp, args.max_exp)
@@ -0,0 +1,226 @@
+class ChunkedStack:
+    """
+    A stack data structure implementing LIFO (Last In First Out) behavior using linked, fixed-size array chunks.
+
+    Items are stored in preallocated arrays of chunk_size slots, each linked to the chunk below it, so the
+    stack allocates one chunk per chunk_size pushes instead of one node per push. One emptied chunk is kept
+    spare so that pushes and pops alternating across a chunk boundary do not allocate.
+    """
+
+    class Chunk:
+        """
+        A fixed-size block of stack slots.
+
+        Attributes:
+            items (list): The slots of the chunk, filled from index 0 upwards.
+            below (Chunk): The chunk underneath this one, or None if this is the bottom chunk.
+        """
+
+        __slots__ = ("items", "below")
+
+        def __init__(self, chunk_size: int, below):
+            """
+            Initialise a new, empty chunk.
+
+            Preconditions: chunk_size > 0
+            Input:
+                - chunk_size, the number of slots in the chunk.
+                - below, the chunk underneath this one, or None.
+            Postconditions: The chunk has chunk_size empty slots and sits on top of below.
+            """
+            self.items = [None] * chunk_size
+            self.below = below
+
+    def __init__(self, chunk_size: int = 64):
+        """
+        Initialise a new, empty ChunkedStack.
+
+        Preconditions: chunk_size > 0
+        Input: chunk_size, the number of items each chunk holds.
+        Postconditions: An empty ChunkedStack is created with no chunks allocated.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.chunk_size = chunk_size
+        self._top = None
+        self._fill = 0
+        self._spare = None
+        self._size = 0
+
+    def __iter__(self):
+        """
+        Iterates over the items in the stack from top to bottom, without copying them.
+
+        Preconditions: The stack is not modified while the iteration is in progress.
+        Output: A generator yielding each item, starting with the top of the stack.
+        """
+        chunk = self._top
+        fill = self._fill
+        while chunk is not None:
+            items = chunk.items
+            for i in range(fill - 1, -1, -1):
+                yield items[i]
+            chunk = chunk.below
+            fill = self.chunk_size
+
+    def __len__(self):
+        """
+        Returns the number of items in the stack.
+        """
+        return self._size
+
+    def _new_chunk(self) -> None:
+        """
+        Puts an empty chunk on top of the stack, reusing the spare chunk if there is one.
+
+        Preconditions: The top chunk, if any, is full.
+        Postconditions: The top chunk is empty.
+        """
+        chunk = self._spare
+        if chunk is None:
+            chunk = self.Chunk(self.chunk_size, self._top)
+        else:
+            self._spare = None
+            chunk.below = self._top
+        self._top = chunk
+        self._fill = 0
+
+    def _drop_chunk(self) -> None:
+        """
+        Removes the empty top chunk, keeping it as the spare.
+
+        Preconditions: The top chunk is empty.
+        Postconditions: The chunk below is on top, and full.
+        """
+        chunk = self._top
+        self._top = chunk.below
+        chunk.below = None
+        self._spare = chunk
+        self._fill = self.chunk_size
+
+    def push(self, data):
+        """
+        Adds a data item to the top of the stack.
+
+        Preconditions: True
+        Input: data, the data to be pushed onto the stack.
+        Postconditions: The data is added to the top of the stack.
+        """
+        if self._top is None or self._fill == self.chunk_size:
+            self._new_chunk()
+        self._top.items[self._fill] = data
+        self._fill += 1
+        self._size += 1
+
+    def push_many(self, iterable):
+        """
+        Adds every item of an iterable to the top of the stack, filling whole chunks at a time.
+
+        Preconditions: True
+        Input: iterable, the items to push, in push order.
+        Postconditions: The stack is as if each item had been pushed in turn; the last item is on top.
+        """
+        items = list(iterable)
+        position = 0
+        while position < len(items):
+            if self._top is None or self._fill == self.chunk_size:
+                self._new_chunk()
+            count = min(self.chunk_size - self._fill, len(items) - position)
+            self._top.items[self._fill:self._fill + count] = items[position:position + count]
+            self._fill += count
+            position += count
+        self._size += len(items)
+
+    def pop(self):
+        """
+        Removes and returns the top item from the stack.
+
+        Preconditions: The stack is not empty.
+        Output: The data that was at the top of the stack.
+        Postconditions: The top item is removed from the stack. If the stack was empty, raises IndexError.
+        """
+        if self.is_empty():
+            raise IndexError("Pop from empty stack")
+        self._fill -= 1
+        items = self._top.items
+        value = items[self._fill]
+        items[self._fill] = None
+        self._size -= 1
+        if self._fill == 0 and self._top.below is not None:
+            self._drop_chunk()
+        return value
+
+    def pop_many(self, k: int):
+        """
+        Removes and returns the top k items from the stack, emptying whole chunks at a time.
+
+        Preconditions: 0 <= k <= size()
+        Input: k, the number of items to pop.
+        Output: A list of the popped items, in pop order (the old top first).
+        Postconditions: The top k items are removed. If the stack holds fewer than k items, raises IndexError
+                        and the stack is unchanged.
+        """
+        if k < 0:
+            raise ValueError("Cannot pop a negative number of items")
+        if k > self._size:
+            raise IndexError("Pop from empty stack")
+        popped = []
+        remaining = k
+        while remaining:
+            if self._fill == 0:
+                self._drop_chunk()
+            count = min(self._fill, remaining)
+            items = self._top.items
+            start = self._fill - count
+            popped.extend(items[self._fill - 1:start - 1 if start else None:-1])
+            items[start:self._fill] = [None] * count
+            self._fill = start
+            remaining -= count
+        self._size -= k
+        if self._fill == 0 and self._top is not None and self._top.below is not None:
+            self._drop_chunk()
+        return popped
+
+    def peek(self):
+        """
+        Returns the top item from the stack without removing it.
+
+        Preconditions: The stack is not empty.
+        Output: The data that is at the top of the stack.
+        Postconditions: The top item of the stack is returned, but the stack remains unchanged. If the stack is empty, raises IndexError.
+        """
+        if self.is_empty():
+            raise IndexError("Peek from empty stack")
+        return self._top.items[self._fill - 1]
+
+    def is_empty(self):
+        """
+        Checks whether the stack is empty.
+
+        Preconditions: True
+        Output: Returns True if the stack is empty; otherwise, False.
+        Postconditions: The stack remains unchanged.
+        """
+        return self._size == 0
+
+    def size(self):
+        """
+        Returns the number of items in the stack.
+
+        Preconditions: True
+        Output: The size of the stack as an integer.
+        Postconditions: The stack remains unchanged.
+        """
+        return self._size
+
+    def print_stack(self):
+        """
+        Prints the items in the stack from top to bottom.
+
+        Preconditions: True
+        Output: The items in the stack are printed to the console.
+        Postconditions: The stack remains unchanged.
+        """
+        for data in self:
+            print(data, end=" -> ")
+        print("None")
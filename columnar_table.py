@@ -0,0 +1,239 @@
+import operator
+
+import numpy as np
+
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_AGGREGATIONS = ("mean", "sum", "min", "max")
+
+
+class ColumnarTable:
+    """
+    A table of records stored column by column in typed NumPy arrays, for vectorised queries.
+
+    Numeric and boolean fields become int64, float64 or bool columns. Any other field is dictionary-encoded:
+    the column holds int32 codes into a list of distinct values, so equality tests and group-by work on
+    small integers instead of Python objects. Filtering and sorting return new tables that share the
+    dictionaries of the original.
+
+    Attributes:
+        size (int): The number of rows in the table.
+        columns (list): The column names, in order.
+    """
+
+    def __init__(self, columns: dict, categories: dict):
+        """
+        Initialise a table from prepared columns. Use from_records() rather than calling this directly.
+
+        Preconditions: Every column is a one-dimensional array of the same length. Each encoded column
+                       has an entry in categories holding the object array its codes index into.
+        Postconditions: The table holds the given columns.
+        """
+        self._columns = columns
+        self._categories = categories
+        self.columns = list(columns)
+        self.size = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_records(cls, records: dict, key_column: str = "Name"):
+        """
+        Loads a mapping of records, such as arsenal_team.arsenal_players, into columns.
+
+        Preconditions: Every record is a dictionary with the same fields.
+        Input:
+            - records, a dictionary mapping each key to a record dictionary.
+            - key_column, the name of the column holding the keys.
+        Output: A new ColumnarTable with the key column first, then one column per record field.
+        Postconditions: If the input is not a dictionary, raises TypeError.
+        """
+        if not isinstance(records, dict):
+            raise TypeError("Expected a dictionary")
+        rows = list(records.values())
+        fields = list(rows[0]) if rows else []
+        raw = {key_column: list(records)}
+        for field in fields:
+            raw[field] = [row[field] for row in rows]
+        columns = {}
+        categories = {}
+        for name, values in raw.items():
+            column = np.array(values)
+            if column.dtype.kind in "biuf":
+                columns[name] = column.astype(np.float64 if column.dtype.kind == "f" else
+                                              np.bool_ if column.dtype.kind == "b" else np.int64)
+                continue
+            lookup = {}
+            codes = np.fromiter((lookup.setdefault(value, len(lookup)) for value in values),
+                                dtype=np.int32, count=len(values))
+            columns[name] = codes
+            distinct = np.empty(len(lookup), dtype=object)
+            distinct[:] = list(lookup)
+            categories[name] = distinct
+        return cls(columns, categories)
+
+    def __len__(self):
+        """
+        Returns the number of rows in the table.
+        """
+        return self.size
+
+    def _take(self, rows):
+        """
+        Builds a table from a selection of rows.
+
+        Input: rows, a boolean mask or an integer index array.
+        Output: A new table holding the selected rows, sharing this table's dictionaries.
+        """
+        return ColumnarTable({name: column[rows] for name, column in self._columns.items()}, self._categories)
+
+    def _check_column(self, name: str) -> None:
+        if name not in self._columns:
+            raise KeyError(f"Column '{name}' not found in table.")
+
+    def column(self, name: str):
+        """
+        Returns the values of a column, decoding dictionary-encoded columns.
+
+        Preconditions: name is a column of the table.
+        Output: A NumPy array of the column's values. If the column is absent, raises KeyError.
+        """
+        self._check_column(name)
+        if name in self._categories:
+            return self._categories[name][self._columns[name]]
+        return self._columns[name]
+
+    def mask(self, name: str, op: str, value):
+        """
+        Compares every value of a column with a constant, without a Python loop over the rows.
+
+        Preconditions: name is a column of the table.
+        Input:
+            - name, the column to test.
+            - op, one of "==", "!=", "<", "<=", ">", ">=" or "in" (value is then a collection).
+            - value, the constant to compare with.
+        Output: A boolean array with one entry per row, for filter(). Masks combine with &, | and ~.
+        Postconditions: If the column is absent, raises KeyError; if op is unknown, raises ValueError.
+        """
+        self._check_column(name)
+        if op != "in" and op not in _COMPARISONS:
+            raise ValueError(f"Unknown comparison '{op}'")
+        column = self._columns[name]
+        if name not in self._categories:
+            if op == "in":
+                return np.isin(column, list(value))
+            return _COMPARISONS[op](column, value)
+        # Evaluate the test once per distinct value, then spread the answers over the rows by code.
+        distinct = self._categories[name]
+        if op == "in":
+            wanted = set(value)
+            answers = np.fromiter((item in wanted for item in distinct), dtype=np.bool_, count=len(distinct))
+        else:
+            compare = _COMPARISONS[op]
+            answers = np.fromiter((compare(item, value) for item in distinct), dtype=np.bool_, count=len(distinct))
+        return answers[column]
+
+    def filter(self, mask):
+        """
+        Selects the rows where a mask is True.
+
+        Preconditions: mask is a boolean array with one entry per row, usually built with mask().
+        Output: A new table holding the selected rows in their original order.
+        """
+        mask = np.asarray(mask, dtype=np.bool_)
+        if mask.shape != (self.size,):
+            raise ValueError("Mask length does not match the table")
+        return self._take(mask)
+
+    def _sort_key(self, name: str):
+        """
+        Returns an array that orders rows the way a column's values do.
+        """
+        self._check_column(name)
+        column = self._columns[name]
+        if name not in self._categories:
+            return column
+        distinct = self._categories[name]
+        ranks = np.empty(len(distinct), dtype=np.int32)
+        ranks[sorted(range(len(distinct)), key=distinct.__getitem__)] = np.arange(len(distinct), dtype=np.int32)
+        return ranks[column]
+
+    def sort(self, by, reverse: bool = False):
+        """
+        Sorts the rows by one or more columns. The sort is stable.
+
+        Preconditions: Every name in by is a column of the table.
+        Input:
+            - by, a column name or a list of column names, most significant first.
+            - reverse, whether to sort in descending order.
+        Output: A new table holding the rows in sorted order. Rows with equal sort keys keep their relative order.
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        if not names:
+            raise ValueError("Expected at least one column to sort by")
+        keys = [self._sort_key(name) for name in names]
+        if reverse:
+            # Sorting the reversed rows and mapping back keeps equal rows in their original order.
+            keys = [key[::-1] for key in keys]
+            order = np.lexsort(keys[::-1])[::-1]
+            order = self.size - 1 - order
+        else:
+            order = np.lexsort(keys[::-1])
+        return self._take(order)
+
+    def group_by(self, by: str, columns, how: str = "mean") -> dict:
+        """
+        Aggregates numeric columns over the groups of rows sharing a value in another column.
+
+        Preconditions: by is a column of the table; every name in columns is a numeric column.
+        Input:
+            - by, the column whose values define the groups.
+            - columns, a list of numeric columns to aggregate.
+            - how, one of "mean", "sum", "min" or "max".
+        Output: A dictionary mapping each group value to a dictionary with "count" and one aggregate per column.
+                Groups appear in sorted order.
+        """
+        if how not in _AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation '{how}'")
+        for name in columns:
+            self._check_column(name)
+            if name in self._categories:
+                raise TypeError(f"Column '{name}' is not numeric")
+        self._check_column(by)
+        if by in self._categories:
+            used, codes = np.unique(self._columns[by], return_inverse=True)
+            groups = self._categories[by][used]
+        else:
+            groups, codes = np.unique(self._columns[by], return_inverse=True)
+        counts = np.bincount(codes, minlength=len(groups))
+        results = {}
+        for name in columns:
+            values = self._columns[name]
+            if how in ("mean", "sum"):
+                totals = np.bincount(codes, weights=values, minlength=len(groups))
+                results[name] = totals / counts if how == "mean" else totals
+            else:
+                order = np.argsort(codes, kind="stable")
+                starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+                reduce = np.minimum if how == "min" else np.maximum
+                results[name] = reduce.reduceat(values[order], starts) if len(groups) else values[:0]
+        order = sorted(range(len(groups)), key=lambda group: groups[group])
+        return {groups[group].item() if isinstance(groups[group], np.generic) else groups[group]:
+                dict({"count": int(counts[group])}, **{name: results[name][group].item() for name in columns})
+                for group in order}
+
+    def to_records(self, key_column: str = "Name") -> dict:
+        """
+        Converts the table back into a mapping of records, as accepted by from_records().
+
+        Preconditions: key_column is a column of the table.
+        Output: A dictionary mapping each key to a record dictionary of plain Python values.
+        """
+        decoded = {name: self.column(name).tolist() for name in self.columns}
+        keys = decoded.pop(key_column)
+        names = list(decoded)
+        return {key: {name: decoded[name][row] for name in names} for row, key in enumerate(keys)}
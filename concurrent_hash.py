@@ -0,0 +1,233 @@
+import threading
+
+from linked_hash import LinkedHash
+from linked_list import LinkedList
+
+_MISSING = object()
+
+
+class ConcurrentLinkedHash:
+    """
+    A thread-safe hash table using separate chaining, with buckets guarded by striped locks.
+
+    The bucket count is always a multiple of the stripe count, so bucket i is guarded by lock
+    i % stripes no matter how often the table resizes. Operations on keys in different stripes never
+    wait for each other. A resize takes a coordinating lock, so only one thread resizes at a time, then
+    every stripe lock in order before swapping in the new bucket array, so no reader can see a table
+    being replaced.
+
+    Attributes:
+        stripes (int): The number of locks guarding the buckets (a power of two).
+    """
+
+    def __init__(self, stripes: int = 16):
+        """
+        Initialise a new, empty ConcurrentLinkedHash.
+
+        Preconditions: stripes is a power of two.
+        Input: stripes, the number of locks to spread the buckets over.
+        Postconditions: An empty table is created with one bucket per stripe.
+        """
+        if stripes <= 0 or stripes & (stripes - 1):
+            raise ValueError("Stripe count must be a power of two")
+        self.stripes = stripes
+        self.hash_linked = [None] * stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._counts = [0] * stripes
+        self._resize_lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of buckets in the table.
+        """
+        return len(self.hash_linked)
+
+    @property
+    def total_elements(self) -> int:
+        """
+        The number of key-value pairs in the table. Concurrent writers may change it at any moment.
+        """
+        return sum(self._counts)
+
+    def __len__(self):
+        """
+        Returns the number of key-value pairs in the table.
+        """
+        return sum(self._counts)
+
+    def __contains__(self, key):
+        """
+        Checks if a key is present in the table, as has() does.
+        """
+        return self.has(key)
+
+    def __iter__(self):
+        """
+        Iterates over a consistent snapshot of the (key, value) pairs in the table.
+
+        Preconditions: True
+        Output: An iterator over (key, value) tuples, taken with every stripe locked.
+        """
+        self._lock_all()
+        try:
+            pairs = [(entry.key, entry.value) for bucket in self.hash_linked if bucket is not None for entry in bucket]
+        finally:
+            self._unlock_all()
+        return iter(pairs)
+
+    def _lock_all(self) -> None:
+        """
+        Acquires every stripe lock, always in the same order so that two callers cannot deadlock.
+        """
+        for lock in self._locks:
+            lock.acquire()
+
+    def _unlock_all(self) -> None:
+        """
+        Releases every stripe lock.
+        """
+        for lock in reversed(self._locks):
+            lock.release()
+
+    def associate(self, key: object, value: object) -> None:
+        """
+        Associate a key with a value in the hash table.
+
+        Preconditions: key is hashable
+        Input:
+            - key, the key to associate with the value.
+            - value, the value to be associated with the key.
+        Postconditions: The key-value pair is added to the hash table, replacing the old value if the key already exists.
+        """
+        key_hash = hash(key)
+        stripe = key_hash & (self.stripes - 1)
+        with self._locks[stripe]:
+            table = self.hash_linked
+            index = key_hash & (len(table) - 1)
+            node = LinkedHash._probe(table[index], key, key_hash)
+            if node is not None:
+                node.data.value = value
+                return
+            bucket = table[index]
+            if bucket is None:
+                bucket = table[index] = LinkedList()
+            bucket.append(LinkedHash.Entry(key_hash, key, value))
+            self._counts[stripe] += 1
+            capacity = len(table)
+        if sum(self._counts) > capacity * LinkedHash.GROW_LOAD_FACTOR:
+            self._resize(capacity, capacity * 2)
+
+    def get(self, key: object) -> object:
+        """
+        Retrieves the value associated with a given key, if it exists.
+
+        Preconditions: key is hashable
+        Input: key, the key whose associated value is to be returned.
+        Output: The value associated with the given key. If the key is absent, raises KeyError.
+        """
+        key_hash = hash(key)
+        with self._locks[key_hash & (self.stripes - 1)]:
+            table = self.hash_linked
+            node = LinkedHash._probe(table[key_hash & (len(table) - 1)], key, key_hash)
+            if node is not None:
+                return node.data.value
+        raise KeyError(f"Key '{key}' not found in ConcurrentLinkedHash.")
+
+    def has(self, key: object) -> bool:
+        """
+        Checks if a key is present in the hash table.
+
+        Preconditions: key is hashable
+        Returns: True if the key is in the hash table; False otherwise.
+        """
+        key_hash = hash(key)
+        with self._locks[key_hash & (self.stripes - 1)]:
+            table = self.hash_linked
+            return LinkedHash._probe(table[key_hash & (len(table) - 1)], key, key_hash) is not None
+
+    def remove(self, key: object) -> None:
+        """
+        Removes a key and its value from the hash table.
+
+        Preconditions: key is hashable
+        Input: key, the key to be removed.
+        Postconditions: The key is no longer in the hash table, which may shrink. If the key is absent, raises KeyError.
+        """
+        self.pop(key)
+
+    def pop(self, key: object, default: object = _MISSING) -> object:
+        """
+        Removes a key from the hash table and returns its value.
+
+        Preconditions: key is hashable
+        Input:
+            - key, the key to be removed.
+            - default, the value to return if the key is absent.
+        Output: The value that was associated with the key, or default if the key is absent.
+        Postconditions: The key is no longer in the hash table, which may shrink.
+                        If the key is absent and no default is given, raises KeyError.
+        """
+        key_hash = hash(key)
+        stripe = key_hash & (self.stripes - 1)
+        with self._locks[stripe]:
+            table = self.hash_linked
+            entry = LinkedHash._unlink(table, key, key_hash)
+            if entry is not None:
+                self._counts[stripe] -= 1
+            capacity = len(table)
+        if entry is None:
+            if default is _MISSING:
+                raise KeyError(f"Key '{key}' not found in ConcurrentLinkedHash.")
+            return default
+        if capacity > self.stripes and sum(self._counts) < capacity * LinkedHash.SHRINK_LOAD_FACTOR:
+            self._resize(capacity, capacity // 2)
+        return entry.value
+
+    def _resize(self, expected_capacity: int, new_capacity: int) -> None:
+        """
+        Moves every entry into a bucket array of a new capacity, with all stripes locked.
+
+        Preconditions: new_capacity is a power of two, at least the stripe count.
+        Input:
+            - expected_capacity, the capacity the caller saw; if another thread has resized since, nothing happens.
+            - new_capacity, the number of buckets in the new array.
+        Postconditions: If the table still had expected_capacity buckets, it now has new_capacity buckets
+                        holding the same entries. Nodes are relinked, not copied.
+        """
+        with self._resize_lock:
+            if len(self.hash_linked) != expected_capacity:
+                return
+            self._lock_all()
+            try:
+                new_hash = [None] * new_capacity
+                for bucket in self.hash_linked:
+                    if bucket is None:
+                        continue
+                    node = bucket.head
+                    while node is not None:
+                        following = node.next
+                        LinkedHash._move_node(node, new_hash)
+                        node = following
+                self.hash_linked = new_hash
+            finally:
+                self._unlock_all()
+
+    def print(self):
+        """
+        Prints out the elements in each bucket of the hash array.
+
+        Preconditions: True
+        Output: Prints the contents of each slot in the hash table.
+        Postconditions: The contents of the hash table are printed to the console.
+        """
+        self._lock_all()
+        try:
+            for i, linked_list in enumerate(self.hash_linked):
+                print(f"Slot {i}: ", end="")
+                if linked_list is None:
+                    print("None")
+                else:
+                    linked_list.print()
+        finally:
+            self._unlock_all()
@@ -0,0 +1,359 @@
+class DoublyLinkedList:
+    """
+    A doubly linked list with head and tail sentinels.
+
+    Every insertion returns the new node as a handle. Because each node knows both of its neighbours,
+    a handle can be removed or moved to the front in O(1), without searching for its predecessor, which
+    makes the list suitable for queues and LRU orderings.
+
+    Attributes:
+        size (int): The number of data nodes in the list (the sentinels are not counted).
+    """
+
+    class Node:
+        """
+        A node for use in a doubly linked list.
+
+        Attributes:
+            data (object): The data stored in the node.
+            prev (Node): The previous node, or None once the node has been removed from its list.
+            next (Node): The next node, or None once the node has been removed from its list.
+        """
+
+        __slots__ = ("data", "prev", "next")
+
+        def __init__(self, data: object):
+            """
+            Initialise a new, unlinked node with data.
+
+            Preconditions: True.
+            Input: data, an object to be stored in the node.
+            Postconditions: The node is created with the given data and no neighbours.
+            """
+            self.data = data
+            self.prev = None
+            self.next = None
+
+    def __init__(self):
+        """
+        Initialise a new, empty doubly linked list.
+
+        Preconditions: True.
+        Postconditions: An empty list is created whose head and tail sentinels point at each other, with size 0.
+        """
+        self._head = self.Node(None)
+        self._tail = self.Node(None)
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self.size = 0
+
+    def __iter__(self):
+        """
+        Iterates over the data in the list, from front to back, without copying it.
+
+        Preconditions: The list is not modified while the iteration is in progress.
+        Output: A generator yielding the data of each node in order.
+        """
+        node = self._head.next
+        while node is not self._tail:
+            yield node.data
+            node = node.next
+
+    def __len__(self):
+        """
+        Returns the number of nodes in the list.
+        """
+        return self.size
+
+    def __contains__(self, data):
+        """
+        Checks whether any node in the list holds the given data.
+
+        Preconditions: True
+        Output: True if the data is found; otherwise, False.
+        """
+        for item in self:
+            if item == data:
+                return True
+        return False
+
+    def _link_before(self, node, successor) -> None:
+        """
+        Links a node in immediately before another node.
+
+        Preconditions: node is unlinked; successor is in this list (possibly the tail sentinel).
+        Postconditions: node sits between successor.prev and successor, and size is updated.
+        """
+        predecessor = successor.prev
+        node.prev = predecessor
+        node.next = successor
+        predecessor.next = node
+        successor.prev = node
+        self.size += 1
+
+    def _unlink(self, node) -> None:
+        """
+        Unlinks a data node from the list.
+
+        Preconditions: node is a data node in this list.
+        Postconditions: node's neighbours point at each other, node has no neighbours, and size is updated.
+        """
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = None
+        node.next = None
+        self.size -= 1
+
+    def _node_at(self, index: int):
+        """
+        Walks to the node at a given position, from whichever end is nearer.
+
+        Preconditions: 0 <= index < size
+        Output: The node at that position.
+        """
+        if index < self.size // 2:
+            node = self._head.next
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self._tail.prev
+            for _ in range(self.size - 1 - index):
+                node = node.prev
+        return node
+
+    def push_left(self, data):
+        """
+        Adds data at the front of the list.
+
+        Preconditions: True
+        Input: data, the object to be added.
+        Output: The new node, which can later be passed to remove or move_to_front.
+        """
+        node = self.Node(data)
+        self._link_before(node, self._head.next)
+        return node
+
+    def push_right(self, data):
+        """
+        Adds data at the back of the list.
+
+        Preconditions: True
+        Input: data, the object to be added.
+        Output: The new node, which can later be passed to remove or move_to_front.
+        """
+        node = self.Node(data)
+        self._link_before(node, self._tail)
+        return node
+
+    def append(self, data):
+        """
+        Append a node to the end of the list, as push_right does.
+
+        Preconditions: True
+        Input: data, an object to be appended to the list.
+        Output: The new node.
+        """
+        return self.push_right(data)
+
+    def insert(self, index, data):
+        """
+        Inserts data at a specified index in the list.
+
+        Preconditions: True
+        Input:
+            - index, an integer specifying the position in the list where the data should be inserted.
+            - data, the object to be inserted in the list.
+        Output: The new node.
+        Postconditions: The data is inserted at the specified position, or an error is raised if the index is invalid.
+        """
+        if index < 0:
+            raise IndexError("Position < 0")
+        if index > self.size:
+            raise ValueError("Position > size of list")
+        successor = self._tail if index == self.size else self._node_at(index)
+        node = self.Node(data)
+        self._link_before(node, successor)
+        return node
+
+    def remove(self, node):
+        """
+        Removes a node from the list in O(1).
+
+        Preconditions: node was returned by an insertion into this list.
+        Input: node, the handle of the node to be removed.
+        Output: The data that was stored in the node.
+        Postconditions: The node is no longer in the list. If it had already been removed, raises ValueError.
+        """
+        if node.prev is None:
+            raise ValueError("Node is not in the list")
+        self._unlink(node)
+        return node.data
+
+    def move_to_front(self, node) -> None:
+        """
+        Moves a node to the front of the list in O(1).
+
+        Preconditions: node is in this list.
+        Input: node, the handle of the node to be moved.
+        Postconditions: The node is first in the list and every other node keeps its relative order.
+                        If the node is not in a list, raises ValueError.
+        """
+        if node.prev is None:
+            raise ValueError("Node is not in the list")
+        if node.prev is self._head:
+            return
+        self._unlink(node)
+        self._link_before(node, self._head.next)
+
+    def move_to_back(self, node) -> None:
+        """
+        Moves a node to the back of the list in O(1).
+
+        Preconditions: node is in this list.
+        Input: node, the handle of the node to be moved.
+        Postconditions: The node is last in the list and every other node keeps its relative order.
+                        If the node is not in a list, raises ValueError.
+        """
+        if node.prev is None:
+            raise ValueError("Node is not in the list")
+        if node.next is self._tail:
+            return
+        self._unlink(node)
+        self._link_before(node, self._tail)
+
+    def first(self):
+        """
+        Returns the node at the front of the list, or None if the list is empty.
+        """
+        return None if self.size == 0 else self._head.next
+
+    def last(self):
+        """
+        Returns the node at the back of the list, or None if the list is empty.
+        """
+        return None if self.size == 0 else self._tail.prev
+
+    def pop_left(self):
+        """
+        Removes and returns the data at the front of the list.
+
+        Preconditions: The list is not empty.
+        Output: The data that was first in the list.
+        Postconditions: The first node is removed. If the list was empty, raises IndexError.
+        """
+        if self.size == 0:
+            raise IndexError("Pop from empty list")
+        node = self._head.next
+        self._unlink(node)
+        return node.data
+
+    def pop_right(self):
+        """
+        Removes and returns the data at the back of the list.
+
+        Preconditions: The list is not empty.
+        Output: The data that was last in the list.
+        Postconditions: The last node is removed. If the list was empty, raises IndexError.
+        """
+        if self.size == 0:
+            raise IndexError("Pop from empty list")
+        node = self._tail.prev
+        self._unlink(node)
+        return node.data
+
+    def get_position(self, index: int):
+        """
+        Retrieves the data at the specified index in the list, walking from the nearer end.
+
+        Preconditions: True
+        Input: index, an integer specifying the position in the list.
+        Output: The data object at the specified index.
+        Postconditions: Returns the data at the specified index if it exists, or raises IndexError.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        return self._node_at(index).data
+
+    def from_array(self, array):
+        """
+        Converts an array into a doubly linked list.
+
+        Preconditions: True
+        Input: array, a list of objects to be converted into a linked list.
+        Postconditions: The list represents the sequence of elements in the array.
+                        If the input is not a list, raises TypeError.
+        """
+        if not isinstance(array, list):
+            raise TypeError("Expected a list")
+        for data in array:
+            self.push_right(data)
+
+    def from_dict(self, input_dict):
+        """
+        Creates a doubly linked list from the key-value pairs of a given dictionary.
+
+        Preconditions: True
+        Input: input_dict, a dictionary whose key-value pairs will be used to create the linked list.
+        Postconditions: The list holds one (key, value) tuple per dictionary item.
+                        If the input is not a dictionary, raises TypeError.
+        """
+        if not isinstance(input_dict, dict):
+            raise TypeError("Expected a dictionary")
+        for item in input_dict.items():
+            self.push_right(item)
+
+    def convert_str(self, string: str):
+        """
+        Converts a string into a doubly linked list, where each node contains a character.
+
+        Preconditions: True
+        Input: string, a string to be converted into a linked list.
+        Postconditions: The list represents the sequence of characters in the string.
+                        If the input is not a string, raises TypeError.
+        """
+        if not isinstance(string, str):
+            raise TypeError("Expected a string")
+        for char in string:
+            self.push_right(char)
+
+    def create_array(self):
+        """
+        Converts the doubly linked list into an array.
+
+        Preconditions: True
+        Output: An array containing the data from the list nodes, from front to back.
+        """
+        return list(self)
+
+    def clear_all(self, confirm=False):
+        """
+        Clears all elements from the list.
+
+        Preconditions: True
+        Input: confirm, a boolean indicating whether to proceed with clearing the list.
+        Postconditions: If confirm is True, the list is cleared and every old handle is detached;
+                        otherwise, nothing happens.
+        """
+        if confirm:
+            node = self._head.next
+            while node is not self._tail:
+                following = node.next
+                node.prev = None
+                node.next = None
+                node = following
+            self._head.next = self._tail
+            self._tail.prev = self._head
+            self.size = 0
+        else:
+            print("Clear operation cancelled. Set confirm=True to clear the list.")
+
+    def print(self):
+        """
+        Prints the elements of the list.
+
+        Preconditions: True
+        Output: Prints each element of the list followed by an arrow, ending with 'None'.
+        """
+        for data in self:
+            print(data, end=" -> ")
+        print("None")
@@ -0,0 +1,330 @@
+import collections
+import inspect
+import time
+
+from linked_hash import LinkedHash
+from linked_list import LinkedList
+
+# Instrumented subclasses, created on first use, keyed by the class they instrument.
+_INSTRUMENTED_CLASSES = {}
+
+
+class Stats:
+    """
+    Counters collected from a LinkedList or LinkedHash while its stats are enabled.
+
+    A structure is instrumented by switching its class to a generated subclass whose methods update
+    these counters, so a structure with stats disabled runs the original methods with no extra work.
+
+    Attributes:
+        operations (Counter): Calls per public operation. Operations called by other operations are not counted.
+        node_visits (int): Nodes walked by lookups, positional access, scans and iteration.
+        visits_by_operation (Counter): node_visits split by the public operation that caused them.
+        resizes (int): The number of hash table resizes started.
+        resize_seconds (float): Time spent resizing, including incremental migration steps.
+        load_factor_history (list): (operation count, load factor) samples, taken every sample_every operations
+                                    and just before each resize.
+        exporter (callable): Called with a snapshot by export(), or None.
+        sample_every (int): How many operations pass between load-factor samples.
+    """
+
+    def __init__(self, structure, exporter=None, sample_every: int = 1024):
+        """
+        Initialise empty counters for a structure.
+
+        Preconditions: sample_every > 0
+        Postconditions: Every counter is zero.
+        """
+        self._structure = structure
+        self.exporter = exporter
+        self.sample_every = sample_every
+        self.operations = collections.Counter()
+        self.node_visits = 0
+        self.visits_by_operation = collections.Counter()
+        self.resizes = 0
+        self.resize_seconds = 0.0
+        self.load_factor_history = []
+        self._total = 0
+        self._depth = 0
+        self._resizing = False
+
+    def snapshot(self) -> dict:
+        """
+        Returns the counters as plain data, for logging or monitoring.
+
+        Output: A dictionary of operations, node_visits, visits_by_operation and visits_per_operation; for a
+                LinkedHash also entries, capacity, load_factor, chain_lengths (a histogram mapping bucket
+                length to bucket count), resizes, resize_seconds and load_factor_history.
+        """
+        report = {
+            "structure": type(self._structure)._uninstrumented.__name__,
+            "operations": dict(self.operations),
+            "node_visits": self.node_visits,
+            "visits_by_operation": dict(self.visits_by_operation),
+            "visits_per_operation": {name: self.visits_by_operation[name] / count
+                                     for name, count in self.operations.items()},
+        }
+        if isinstance(self._structure, LinkedHash):
+            table = self._structure
+            histogram = collections.Counter()
+            for buckets in (table.hash_linked, table._old_hash or ()):
+                for bucket in buckets:
+                    histogram[0 if bucket is None else bucket.size] += 1
+            report.update({
+                "entries": table.total_elements,
+                "capacity": len(table.hash_linked),
+                "load_factor": table.total_elements / len(table.hash_linked),
+                "chain_lengths": dict(sorted(histogram.items())),
+                "resizes": self.resizes,
+                "resize_seconds": self.resize_seconds,
+                "load_factor_history": list(self.load_factor_history),
+            })
+        return report
+
+    def export(self) -> dict:
+        """
+        Passes a snapshot to the exporter, if there is one.
+
+        Output: The snapshot.
+        """
+        report = self.snapshot()
+        if self.exporter is not None:
+            self.exporter(report)
+        return report
+
+
+def _counted(name: str, method):
+    """
+    Wraps a method so that calls from outside the structure are counted, with the node visits they cause.
+    A lazy operation is counted once when called, and its visits are added as its generator is consumed.
+    """
+    def wrapper(self, *args, **kwargs):
+        stats = self._stats
+        if stats._depth:
+            return method(self, *args, **kwargs)
+        stats._depth = 1
+        visits = stats.node_visits
+        try:
+            result = method(self, *args, **kwargs)
+            if inspect.isgenerator(result):
+                result = _counted_generator(stats, name, result)
+            return result
+        finally:
+            stats._depth = 0
+            stats.operations[name] += 1
+            stats.visits_by_operation[name] += stats.node_visits - visits
+            stats._total += 1
+            if stats._total % stats.sample_every == 0:
+                self._sample_load()
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+def _counted_generator(stats: Stats, name: str, generator):
+    """
+    Runs a lazy operation's generator, adding the node visits of each step to the operation that created it.
+    """
+    while True:
+        if stats._depth:
+            # Consumed inside another counted operation, which is charged for the visits instead.
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+        else:
+            stats._depth = 1
+            visits = stats.node_visits
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                stats._depth = 0
+                stats.visits_by_operation[name] += stats.node_visits - visits
+        yield item
+
+
+class _ListStats:
+    """
+    Overrides for an instrumented LinkedList, counting the nodes each operation walks.
+    """
+
+    COUNTED = ("__iter__", "append", "extend", "__contains__", "cursor", "find_first", "find_last", "find_all",
+               "get_position", "from_array", "from_dict", "convert_str", "create_array", "map", "filter",
+               "take", "chunks", "insert", "insert_after", "insert_array", "delete_item", "replace_position",
+               "replace_all", "sort", "merge", "insert_sorted", "concat", "splice", "split_at", "delete_range",
+               "clear_all", "print")
+
+    def _sample_load(self) -> None:
+        pass
+
+    def _scan_for(self, data):
+        position, node = LinkedList._scan_for(self, data)
+        self._stats.node_visits += position if node is None else position + 1
+        return position, node
+
+    def __iter__(self):
+        stats = self._stats
+        for data in LinkedList.__iter__(self):
+            stats.node_visits += 1
+            yield data
+
+    def _node_at(self, index: int):
+        if index == self.size - 1:
+            steps = 0
+        elif self._finger_node is not None and self._finger_index <= index:
+            steps = index - self._finger_index
+        else:
+            steps = index
+        self._stats.node_visits += steps
+        return LinkedList._node_at(self, index)
+
+    def find_last(self, data):
+        if self._indexed_positions(data) is None:
+            self._stats.node_visits += self.size
+        return LinkedList.find_last(self, data)
+
+    def find_all(self, data):
+        if self._indexed_positions(data) is None:
+            self._stats.node_visits += self.size
+        return LinkedList.find_all(self, data)
+
+    def replace_all(self, old, new):
+        if self._indexed_positions(old) is None:
+            self._stats.node_visits += self.size
+        LinkedList.replace_all(self, old, new)
+
+    def create_array(self):
+        self._stats.node_visits += self.size
+        return LinkedList.create_array(self)
+
+    def take(self, n: int):
+        stats = self._stats
+        for data in LinkedList.take(self, n):
+            stats.node_visits += 1
+            yield data
+
+    def print(self):
+        self._stats.node_visits += self.size
+        LinkedList.print(self)
+
+
+class _HashStats:
+    """
+    Overrides for an instrumented LinkedHash, counting probed nodes and timing resizes.
+    """
+
+    COUNTED = ("__iter__", "associate", "update_many", "reserve", "get", "has", "remove", "pop", "__contains__",
+               "create_index", "drop_index", "find_equal", "find_range", "print")
+
+    def _sample_load(self) -> None:
+        self._stats.load_factor_history.append((self._stats._total, self.total_elements / len(self.hash_linked)))
+
+    def _walk(self, bucket, key: object, key_hash: int):
+        """
+        Walks a bucket's chain once, as LinkedHash does, counting the nodes visited.
+
+        Output: A tuple (previous_node, node) for the node holding the key; node is None if the key is absent.
+        """
+        previous_node = None
+        node = None if bucket is None else bucket.head
+        visits = 0
+        while node is not None:
+            visits += 1
+            entry = node.data
+            if entry.hash == key_hash and (entry.key is key or entry.key == key):
+                break
+            previous_node = node
+            node = node.next
+        self._stats.node_visits += visits
+        return previous_node, node
+
+    def _probe(self, bucket, key: object, key_hash: int):
+        return self._walk(bucket, key, key_hash)[1]
+
+    def _unlink(self, table: list, key: object, key_hash: int):
+        index = key_hash & (len(table) - 1)
+        previous_node, node = self._walk(table[index], key, key_hash)
+        return None if node is None else LinkedHash._detach(table, index, previous_node, node)
+
+    def __iter__(self):
+        stats = self._stats
+        for pair in LinkedHash.__iter__(self):
+            stats.node_visits += 1
+            yield pair
+
+    def _timed(self, method, *args):
+        """
+        Runs resize work, adding its duration to resize_seconds unless it is part of resize work already timed.
+        """
+        stats = self._stats
+        if stats._resizing:
+            return method(self, *args)
+        stats._resizing = True
+        start = time.perf_counter()
+        try:
+            return method(self, *args)
+        finally:
+            stats.resize_seconds += time.perf_counter() - start
+            stats._resizing = False
+
+    def _resize(self, new_capacity: int) -> None:
+        self._stats.resizes += 1
+        self._sample_load()
+        self._timed(LinkedHash._resize, new_capacity)
+
+    def _rehash_some(self, limit: int) -> int:
+        return self._timed(LinkedHash._rehash_some, limit)
+
+
+def enable_stats(structure, exporter=None, sample_every: int = 1024) -> Stats:
+    """
+    Starts collecting stats on a LinkedList or LinkedHash.
+
+    Preconditions: structure is a LinkedList or LinkedHash (or a subclass); sample_every > 0.
+    Input:
+        - structure, the list or hash table to instrument.
+        - exporter, a callable passed a snapshot by Stats.export() and when stats are disabled.
+        - sample_every, how many operations pass between load-factor samples.
+    Output: The Stats collecting the counters. If stats are already enabled, the existing Stats is returned.
+    Postconditions: The structure behaves exactly as before, apart from the counting.
+                    If the structure is of another type, raises TypeError.
+    """
+    existing = structure.__dict__.get("_stats")
+    if existing is not None:
+        return existing
+    base = type(structure)
+    cls = _INSTRUMENTED_CLASSES.get(base)
+    if cls is None:
+        if isinstance(structure, LinkedHash):
+            mixin = _HashStats
+        elif isinstance(structure, LinkedList):
+            mixin = _ListStats
+        else:
+            raise TypeError("Expected a LinkedList or LinkedHash")
+        cls = type(f"Instrumented{base.__name__}", (mixin, base), {"_uninstrumented": base})
+        for name in mixin.COUNTED:
+            setattr(cls, name, _counted(name, getattr(cls, name)))
+        _INSTRUMENTED_CLASSES[base] = cls
+    structure._stats = Stats(structure, exporter, sample_every)
+    structure.__class__ = cls
+    return structure._stats
+
+
+def disable_stats(structure) -> dict:
+    """
+    Stops collecting stats on a structure, exporting a final snapshot.
+
+    Preconditions: True
+    Output: The final snapshot, or None if stats were not enabled.
+    Postconditions: The structure is back to its original class and runs with no instrumentation.
+    """
+    stats = structure.__dict__.get("_stats")
+    if stats is None:
+        return None
+    report = stats.export()
+    structure.__class__ = type(structure)._uninstrumented
+    del structure._stats
+    return report
@@ -1,100 +1,705 @@
-from linked_list import LinkedList
-
-class LinkedHash:
-    def __init__(self):
-        """
-        Initialise a new, empty LinkedHash.
-
-        Preconditions: True
-        Postconditions: An empty LinkedHash is created with a single, empty Linked List.
-        """
-        self.size = 1
-        self.total_elements = 0
-        self.hash_linked = [LinkedList()]
-
-    def associate(self, key: object, value: object) -> None:
-        """
-        Associate a key with a value in the hash table.
-
-        Preconditions: True
-        Input: 
-            - key, the key to associate with the value.
-            - value, the value to be associated with the key.
-        Postconditions: The key-value pair is added to the hash table, replacing the old value if the key already exists.
-        """
-        self.change_size()
-        index = hash(key) % len(self.hash_linked)
-        current_list = self.hash_linked[index]
-        for i, (k, _) in enumerate(current_list.create_array()):
-            if k == key:
-                current_list.replace_position(i, (key, value))
-                return
-        current_list.append((key, value))
-        self.total_elements += 1
-
-    def change_size(self) -> None:
-        """
-        Dynamically grows or shrinks the size of the hash table to maintain efficient operations.
-
-        Postconditions:
-        - If pre-self has a load factor > 0.7, post-self has a larger hash table, reducing the load factor.
-        - If pre-self has a load factor < 0.3, post-self has a smaller hash table, increasing the load factor.
-        """
-        load_factor = self.total_elements / len(self.hash_linked)
-        new_capacity = 0
-
-        if load_factor > 0.7:
-            new_capacity = len(self.hash_linked) * 2
-        elif load_factor < 0.3 and len(self.hash_linked) > 10: 
-            new_capacity = len(self.hash_linked) // 2
-
-        if new_capacity:
-            new_hash = [LinkedList() for _ in range(new_capacity)]
-            for linked_list in self.hash_linked:
-                for (key, value) in linked_list.create_array():
-                    index = hash(key) % new_capacity
-                    new_hash[index].append((key, value))
-            self.hash_linked = new_hash
-            self.size = new_capacity
-
-    def get(self, key: object) -> object:
-        """
-        Retrieves the value associated with a given key, if it exists.
-
-        Preconditions: True 
-        Input: key, the key whose associated value is to be returned.
-        Output: The value associated with the given key, if it exists.
-        Postconditions: Returns the value associated with the given key, if one exists.
-        """
-        index = hash(key) % len(self.hash_linked)
-        current_list = self.hash_linked[index]
-        for k, v in current_list.create_array():
-            if k == key:
-                return v
-        raise KeyError(f"Key '{key}' not found in LinkedHash.")
-
-    def has(self, key: object) -> bool:
-        """
-        Checks if a key is present in the hash table.
-
-        Preconditions: key is hashable
-        Returns: True if the key is in the hash table; False otherwise.
-        """
-        index = hash(key) % len(self.hash_linked)
-        current_list = self.hash_linked[index]
-        for k, _ in current_list.create_array():
-            if k == key:
-                return True
-        return False
-
-    def print(self):
-        """
-        Prints out the elements in each linked list of the hash array.
-
-        Preconditions: True
-        Output: Prints the contents of each slot in the hash table.
-        Postconditions: The contents of the hash table are printed to the console.
-        """
-        for i, linked_list in enumerate(self.hash_linked):
-            print(f"Slot {i}: ", end="")
-            linked_list.print()
\ No newline at end of file
+import bisect
+
+from linked_list import LinkedList
+from open_hash import OpenHash
+
+_MISSING = object()
+
+
+class LinkedHash:
+    # The table grows above GROW_LOAD_FACTOR and shrinks below SHRINK_LOAD_FACTOR. Keeping the two a
+    # factor of four apart means a table just grown (load 0.35) or just shrunk (load < 0.35) must gain
+    # or lose a large share of its entries before it resizes again, so churn around one size cannot
+    # make it flip between growing and shrinking.
+    GROW_LOAD_FACTOR = 0.7
+    SHRINK_LOAD_FACTOR = 0.175
+
+    class Entry:
+        """
+        A key-value pair stored in a bucket, together with the key's hash.
+
+        Attributes:
+            hash (int): The cached hash of the key, used for bucket indexing and to skip most key comparisons.
+            key (object): The key of the entry.
+            value (object): The value associated with the key.
+        """
+
+        __slots__ = ("hash", "key", "value")
+
+        def __init__(self, key_hash: int, key: object, value: object):
+            """
+            Initialise a new entry.
+
+            Preconditions: key_hash == hash(key)
+            Input: key_hash, key and value, as described above.
+            Postconditions: The entry holds the given hash, key and value.
+            """
+            self.hash = key_hash
+            self.key = key
+            self.value = value
+
+        def __iter__(self):
+            """
+            Unpacks the entry as a (key, value) pair.
+            """
+            yield self.key
+            yield self.value
+
+        def __repr__(self):
+            return repr((self.key, self.value))
+
+    class FieldIndex:
+        """
+        A secondary index over one field of record-valued entries, such as the 'Nationality' of a player dict.
+
+        Attributes:
+            field (object): The record field the index covers.
+            keys_by_value (dict): Maps each field value to a dict whose keys are the entry keys holding that value,
+                                  in insertion order (its values are unused).
+            sorted_values (list): The distinct field values in ascending order, or None for a hash index.
+        """
+
+        __slots__ = ("field", "keys_by_value", "sorted_values")
+
+        def __init__(self, field: object, ordered: bool):
+            """
+            Initialise a new, empty index.
+
+            Preconditions: True.
+            Input:
+                - field, the record field to index.
+                - ordered, whether to keep the distinct values sorted so that range queries are possible.
+            Postconditions: The index covers no entries.
+            """
+            self.field = field
+            self.keys_by_value = {}
+            self.sorted_values = [] if ordered else None
+
+        def value_of(self, record: object) -> object:
+            """
+            Reads the indexed field of a record, or _MISSING if the record is _MISSING or lacks the field.
+            """
+            if record is _MISSING:
+                return _MISSING
+            try:
+                return record[self.field]
+            except (KeyError, IndexError, TypeError):
+                return _MISSING
+
+        def check(self, record: object) -> None:
+            """
+            Raises TypeError if a record's field value cannot be indexed, without changing the index.
+
+            Preconditions: True.
+            Input: record, the record about to be indexed.
+            Postconditions: If the value is unhashable, or unorderable against the values of a sorted index,
+                            raises TypeError. The comparisons are the ones move() would make.
+            """
+            value = self.value_of(record)
+            if value is _MISSING:
+                return
+            hash(value)
+            if self.sorted_values is not None and value not in self.keys_by_value:
+                bisect.bisect_right(self.sorted_values, value)
+
+        def move(self, key: object, old_record: object, new_record: object) -> None:
+            """
+            Updates the index for a key whose record changes.
+
+            Preconditions: The key is indexed under old_record's field value, if it has one.
+                           The new field value is hashable, and orderable against the others for a sorted index.
+            Input:
+                - key, the entry key.
+                - old_record, the record the key held, or _MISSING if the key is new.
+                - new_record, the record the key now holds, or _MISSING if the key is being removed.
+            Postconditions: The key is indexed under new_record's field value only. Records without the field
+                            are not indexed.
+            """
+            old_value = self.value_of(old_record)
+            new_value = self.value_of(new_record)
+            if old_value is not _MISSING and new_value is not _MISSING and old_value == new_value:
+                return
+            if new_value is not _MISSING:
+                keys = self.keys_by_value.get(new_value)
+                if keys is None:
+                    if self.sorted_values is not None:
+                        bisect.insort(self.sorted_values, new_value)
+                    keys = self.keys_by_value[new_value] = {}
+                keys[key] = None
+            if old_value is not _MISSING:
+                keys = self.keys_by_value[old_value]
+                del keys[key]
+                if not keys:
+                    del self.keys_by_value[old_value]
+                    if self.sorted_values is not None:
+                        del self.sorted_values[bisect.bisect_left(self.sorted_values, old_value)]
+
+    def __init__(self, incremental: bool = False, rehash_step: int = 8):
+        """
+        Initialise a new, empty LinkedHash.
+
+        Preconditions: rehash_step > 0
+        Input:
+            - incremental, whether resizes migrate the table a few entries per operation instead of all at once.
+            - rehash_step, the most entries an incremental resize moves during a single operation.
+        Postconditions: An empty LinkedHash is created with a single, empty bucket.
+                        The bucket count is always a power of two, so buckets are indexed by masking the hash.
+        """
+        self.size = 1
+        self.total_elements = 0
+        self.hash_linked = [None]
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        self._old_hash = None
+        self._rehash_index = 0
+        self._min_capacity = 1
+        self._indexes = {}
+
+    def __iter__(self):
+        """
+        Iterates over the (key, value) pairs in the hash table, bucket by bucket, without copying them.
+
+        Preconditions: The hash table is not modified while the iteration is in progress.
+        Output: A generator yielding a (key, value) tuple for every entry, in no particular order.
+        """
+        tables = [self.hash_linked]
+        if self._old_hash is not None:
+            tables.append(self._old_hash)
+        for table in tables:
+            for bucket in table:
+                if bucket is not None:
+                    for entry in bucket:
+                        yield entry.key, entry.value
+
+    def __len__(self):
+        """
+        Returns the number of key-value pairs in the hash table.
+        """
+        return self.total_elements
+
+    def __contains__(self, key):
+        """
+        Checks if a key is present in the hash table, as has() does.
+        """
+        return self.has(key)
+
+    @classmethod
+    def from_mapping(cls, mapping, **kwargs):
+        """
+        Creates a LinkedHash holding the key-value pairs of a mapping, sized for them up front.
+
+        Preconditions: True
+        Input:
+            - mapping, a dictionary (or any object with an items() method) whose pairs will be loaded.
+            - kwargs, any keyword arguments accepted by LinkedHash().
+        Output: A new LinkedHash containing every pair of the mapping.
+        Postconditions: The bucket array is allocated at its final capacity once, with no intermediate resizes.
+                        If the input is not a mapping, raises TypeError.
+        """
+        if not hasattr(mapping, "items"):
+            raise TypeError("Expected a mapping")
+        table = cls(**kwargs)
+        table.update_many(mapping.items())
+        return table
+
+    def associate(self, key: object, value: object) -> None:
+        """
+        Associate a key with a value in the hash table.
+
+        Preconditions: True
+        Input: 
+            - key, the key to associate with the value.
+            - value, the value to be associated with the key.
+        Postconditions: The key-value pair is added to the hash table, replacing the old value if the key already exists.
+        """
+        self.change_size()
+        if self._old_hash is not None:
+            self._rehash_some(self.rehash_step)
+        self._put(key, value)
+
+    def update_many(self, pairs) -> None:
+        """
+        Associates every key-value pair of an iterable, growing the table at most once.
+
+        Preconditions: Every key is hashable.
+        Input: pairs, an iterable of (key, value) pairs.
+        Postconditions: Each pair is associated as if by associate(), in order. The bucket array is resized
+                        up front to fit the new pairs, so the load itself triggers no further resizes.
+        """
+        if not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+        self._grow_to(self.total_elements + len(pairs))
+        for key, value in pairs:
+            self._put(key, value)
+
+    def reserve(self, n: int) -> None:
+        """
+        Pre-sizes the table so that it can hold n entries without resizing.
+
+        Preconditions: n >= 0
+        Input: n, the number of entries the table should be able to hold.
+        Postconditions: The bucket array is large enough for n entries at the maximum load factor,
+                        and the table will not shrink below that capacity.
+        """
+        self._min_capacity = max(self._min_capacity, self._capacity_for(n))
+        self._grow_to(n)
+
+    @staticmethod
+    def _capacity_for(n: int) -> int:
+        """
+        Computes the smallest bucket count that holds n entries at a load factor of at most GROW_LOAD_FACTOR.
+
+        Preconditions: n >= 0
+        Output: A power of two.
+        """
+        capacity = 1
+        while n > capacity * LinkedHash.GROW_LOAD_FACTOR:
+            capacity *= 2
+        return capacity
+
+    def _grow_to(self, n: int) -> None:
+        """
+        Resizes the table in one step, if needed, so that it can hold n entries.
+
+        Preconditions: n >= 0
+        Postconditions: The table holds at least _capacity_for(n) buckets and no resize is in progress.
+        """
+        capacity = self._capacity_for(n)
+        if capacity > len(self.hash_linked):
+            self._resize(capacity)
+        self._finish_rehash()
+
+    def _put(self, key: object, value: object) -> None:
+        """
+        Inserts or overwrites a key without checking the load factor.
+
+        Preconditions: key is hashable
+        Input: key and value, as for associate().
+        Postconditions: The key is associated with the value.
+        """
+        key_hash = hash(key)
+        node = self._find(key, key_hash)
+        if node is not None:
+            if self._indexes:
+                self._reindex(key, node.data.value, value)
+            node.data.value = value
+            return
+        if self._indexes:
+            self._reindex(key, _MISSING, value)
+        index = key_hash & (len(self.hash_linked) - 1)
+        current_list = self.hash_linked[index]
+        if current_list is None:
+            current_list = self.hash_linked[index] = LinkedList()
+        current_list.append(self.Entry(key_hash, key, value))
+        self.total_elements += 1
+
+    @staticmethod
+    def _probe(bucket: LinkedList, key: object, key_hash: int):
+        """
+        Walks a bucket's chain once, stopping at the first node holding the key.
+
+        Cached hashes are compared first, so __eq__ only runs on entries whose hash matches.
+
+        Preconditions: bucket holds Entry objects, or is None for a bucket never used. key_hash == hash(key).
+        Input:
+            - bucket, the LinkedList to be searched.
+            - key, the key to look for.
+            - key_hash, the hash of the key.
+        Output: The node whose data holds the key, or None if the key is not in the bucket.
+        Postconditions: The bucket is unchanged and no intermediate list is built.
+        """
+        if bucket is None:
+            return None
+        current_node = bucket.head
+        while current_node is not None:
+            entry = current_node.data
+            if entry.hash == key_hash and (entry.key is key or entry.key == key):
+                return current_node
+            current_node = current_node.next
+        return None
+
+    def _find(self, key: object, key_hash: int):
+        """
+        Finds the node holding a key, looking in the table being migrated from if a resize is in progress.
+
+        Preconditions: key_hash == hash(key)
+        Input:
+            - key, the key to look for.
+            - key_hash, the hash of the key.
+        Output: The node whose data holds the key, or None if the key is not in the hash table.
+        """
+        node = self._probe(self.hash_linked[key_hash & (len(self.hash_linked) - 1)], key, key_hash)
+        if node is None and self._old_hash is not None:
+            node = self._probe(self._old_hash[key_hash & (len(self._old_hash) - 1)], key, key_hash)
+        return node
+
+    @staticmethod
+    def _move_node(node, table: list) -> None:
+        """
+        Relinks an existing node onto the front of its bucket in another table.
+
+        Preconditions: node is detached from any bucket.
+        Input:
+            - node, the node to be moved.
+            - table, the bucket array to move it into.
+        Postconditions: The node heads its bucket in table; no new node is allocated and the key is not rehashed.
+        """
+        index = node.data.hash & (len(table) - 1)
+        bucket = table[index]
+        if bucket is None:
+            bucket = table[index] = LinkedList()
+        node.next = bucket.head
+        bucket.head = node
+        if bucket.tail is None:
+            bucket.tail = node
+        bucket.size += 1
+
+    def _rehash_some(self, limit: int) -> int:
+        """
+        Migrates part of the table being resized into the new table.
+
+        Preconditions: A resize is in progress.
+        Input: limit, the most entries to move; at most 10 * limit empty buckets are skipped as well.
+        Output: The number of entries moved.
+        Postconditions: Once the old table is exhausted, the resize is complete.
+        """
+        old_hash = self._old_hash
+        moved = 0
+        empty_visits = 10 * limit
+        while moved < limit:
+            if self._rehash_index >= len(old_hash):
+                self._old_hash = None
+                self._rehash_index = 0
+                break
+            bucket = old_hash[self._rehash_index]
+            if bucket is None or bucket.head is None:
+                old_hash[self._rehash_index] = None
+                self._rehash_index += 1
+                empty_visits -= 1
+                if empty_visits == 0:
+                    break
+                continue
+            node = bucket.head
+            bucket.head = node.next
+            bucket.size -= 1
+            if bucket.head is None:
+                bucket.tail = None
+            self._move_node(node, self.hash_linked)
+            moved += 1
+        return moved
+
+    def change_size(self) -> None:
+        """
+        Dynamically grows or shrinks the size of the hash table to maintain efficient operations.
+
+        In incremental mode the old and new tables are kept side by side and the entries are moved over
+        a few at a time by later operations. A resize that falls due before the previous one has finished
+        waits for it, so no single operation moves more than rehash_step entries. With a rehash_step of 1
+        the migration can fall behind, and the load factor then overshoots until it catches up.
+
+        Postconditions:
+        - If pre-self has a load factor > GROW_LOAD_FACTOR, post-self has a larger hash table, reducing the load factor.
+        - If pre-self has a load factor < SHRINK_LOAD_FACTOR, post-self has a smaller hash table, increasing the load factor.
+        """
+        if self._old_hash is not None:
+            return
+        load_factor = self.total_elements / len(self.hash_linked)
+        new_capacity = 0
+
+        if load_factor > self.GROW_LOAD_FACTOR:
+            new_capacity = len(self.hash_linked) * 2
+        elif (load_factor < self.SHRINK_LOAD_FACTOR and len(self.hash_linked) > 10
+                and len(self.hash_linked) // 2 >= self._min_capacity):
+            new_capacity = len(self.hash_linked) // 2
+
+        if new_capacity:
+            self._resize(new_capacity)
+
+    def _resize(self, new_capacity: int) -> None:
+        """
+        Starts moving the table into a new bucket array, finishing any earlier resize first.
+
+        Preconditions: new_capacity is a power of two.
+        Input: new_capacity, the number of buckets in the new array.
+        Postconditions: hash_linked has new_capacity buckets. Unless in incremental mode, every entry has been moved.
+        """
+        self._finish_rehash()
+        self._old_hash = self.hash_linked
+        self._rehash_index = 0
+        self.hash_linked = [None] * new_capacity
+        self.size = new_capacity
+        if not self.incremental:
+            self._finish_rehash()
+
+    def _finish_rehash(self) -> None:
+        """
+        Completes any resize in progress in one go.
+
+        Preconditions: True
+        Postconditions: Every entry lives in hash_linked and no old table remains.
+        """
+        while self._old_hash is not None:
+            self._rehash_some(len(self._old_hash) + self.total_elements)
+
+    def get(self, key: object) -> object:
+        """
+        Retrieves the value associated with a given key, if it exists.
+
+        Preconditions: True 
+        Input: key, the key whose associated value is to be returned.
+        Output: The value associated with the given key, if it exists.
+        Postconditions: Returns the value associated with the given key, if one exists.
+        """
+        if self._old_hash is not None:
+            self._rehash_some(self.rehash_step)
+        node = self._find(key, hash(key))
+        if node is not None:
+            return node.data.value
+        raise KeyError(f"Key '{key}' not found in LinkedHash.")
+
+    def remove(self, key: object) -> None:
+        """
+        Removes a key and its value from the hash table.
+
+        Preconditions: key is hashable
+        Input: key, the key to be removed.
+        Postconditions: The key is no longer in the hash table, which may shrink. If the key is absent, raises KeyError.
+        """
+        self.pop(key)
+
+    def pop(self, key: object, default: object = _MISSING) -> object:
+        """
+        Removes a key from the hash table and returns its value.
+
+        Preconditions: key is hashable
+        Input:
+            - key, the key to be removed.
+            - default, the value to return if the key is absent.
+        Output: The value that was associated with the key, or default if the key is absent.
+        Postconditions: The key is no longer in the hash table, which may shrink.
+                        If the key is absent and no default is given, raises KeyError.
+        """
+        if self._old_hash is not None:
+            self._rehash_some(self.rehash_step)
+        key_hash = hash(key)
+        entry = self._unlink(self.hash_linked, key, key_hash)
+        if entry is None and self._old_hash is not None:
+            entry = self._unlink(self._old_hash, key, key_hash)
+        if entry is None:
+            if default is _MISSING:
+                raise KeyError(f"Key '{key}' not found in LinkedHash.")
+            return default
+        self.total_elements -= 1
+        if self._indexes:
+            self._reindex(key, entry.value, _MISSING)
+        self.change_size()
+        return entry.value
+
+    @staticmethod
+    def _unlink(table: list, key: object, key_hash: int):
+        """
+        Unlinks the node holding a key from its bucket in a table.
+
+        Preconditions: key_hash == hash(key)
+        Input:
+            - table, the bucket array to search.
+            - key, the key to be removed.
+            - key_hash, the hash of the key.
+        Output: The Entry that was removed, or None if the key is not in the table.
+        Postconditions: A bucket left empty is released, so its slot goes back to None.
+        """
+        index = key_hash & (len(table) - 1)
+        bucket = table[index]
+        if bucket is None:
+            return None
+        previous_node = None
+        current_node = bucket.head
+        while current_node is not None:
+            entry = current_node.data
+            if entry.hash == key_hash and (entry.key is key or entry.key == key):
+                return LinkedHash._detach(table, index, previous_node, current_node)
+            previous_node = current_node
+            current_node = current_node.next
+        return None
+
+    @staticmethod
+    def _detach(table: list, index: int, previous_node, node):
+        """
+        Unlinks a known node from the bucket at an index of a table.
+
+        Preconditions: node is in table[index], directly after previous_node (or at the head if that is None).
+        Output: The Entry the node held.
+        Postconditions: A bucket left empty is released, so its slot goes back to None.
+        """
+        bucket = table[index]
+        if previous_node is None:
+            bucket.head = node.next
+        else:
+            previous_node.next = node.next
+        if node is bucket.tail:
+            bucket.tail = previous_node
+        bucket.size -= 1
+        if bucket.head is None:
+            table[index] = None
+        return node.data
+
+    def enable_stats(self, exporter=None, sample_every: int = 1024):
+        """
+        Starts collecting operation counts and node visits, chain lengths and resize activity. See instrumentation.Stats.
+
+        Stats are off by default, and a table with stats off runs no instrumentation code at all.
+
+        Preconditions: sample_every > 0
+        Input:
+            - exporter, a callable passed a snapshot dictionary by Stats.export() and by disable_stats().
+            - sample_every, how many operations pass between load-factor samples.
+        Output: The Stats object collecting the counters.
+        """
+        from instrumentation import enable_stats
+        return enable_stats(self, exporter, sample_every)
+
+    def disable_stats(self):
+        """
+        Stops collecting stats, passing a final snapshot to the exporter.
+
+        Output: The final snapshot dictionary, or None if stats were not enabled.
+        """
+        from instrumentation import disable_stats
+        return disable_stats(self)
+
+    def create_index(self, field: object, kind: str = "hash") -> None:
+        """
+        Adds a secondary index on a field of the record values, such as 'Position' or 'Age' of a player dict.
+
+        The index is kept up to date by associate, update_many, remove and pop, including overwrites of an
+        existing key. It does not see records modified in place, so re-associate a record after changing it.
+
+        Preconditions: The field's values are hashable, and mutually orderable for a sorted index.
+        Input:
+            - field, the record field to index.
+            - kind, "hash" for equality lookups with find_equal(), or "sorted" to also allow find_range().
+        Postconditions: Every current entry whose value has the field is indexed, replacing any earlier index on
+                        the field. Entries whose value lacks the field are skipped. If the kind is unknown,
+                        raises ValueError.
+        """
+        if kind not in ("hash", "sorted"):
+            raise ValueError(f"Unknown index kind '{kind}'. Expected 'hash' or 'sorted'.")
+        index = self.FieldIndex(field, ordered=False)
+        for key, value in self:
+            index.move(key, _MISSING, value)
+        if kind == "sorted":
+            index.sorted_values = sorted(index.keys_by_value)
+        self._indexes[field] = index
+
+    def drop_index(self, field: object) -> None:
+        """
+        Removes the secondary index on a field. If there is none, raises KeyError.
+        """
+        self._index_on(field)
+        del self._indexes[field]
+
+    def _index_on(self, field: object):
+        """
+        Returns the secondary index on a field. If there is none, raises KeyError.
+        """
+        index = self._indexes.get(field)
+        if index is None:
+            raise KeyError(f"No index on field '{field}'.")
+        return index
+
+    def _reindex(self, key: object, old_value: object, new_value: object) -> None:
+        """
+        Updates every secondary index for a key whose value changes from old_value to new_value.
+        The new value is checked against every index first, so a value one index rejects changes none of them.
+        """
+        if new_value is not _MISSING:
+            for index in self._indexes.values():
+                index.check(new_value)
+        for index in self._indexes.values():
+            index.move(key, old_value, new_value)
+
+    def find_equal(self, field: object, value: object) -> list:
+        """
+        Finds every key whose record has a field equal to a value, using the index on the field.
+
+        Preconditions: An index exists on the field.
+        Input:
+            - field, the indexed field.
+            - value, the field value to match.
+        Output: A list of the matching keys, in the order they were first indexed under that value.
+                If the field has no index, raises KeyError.
+        """
+        return list(self._index_on(field).keys_by_value.get(value, ()))
+
+    def find_range(self, field: object, low: object = None, high: object = None) -> list:
+        """
+        Finds every key whose record has a field value between two bounds, using a sorted index on the field.
+
+        Preconditions: A sorted index exists on the field.
+        Input:
+            - field, the indexed field.
+            - low, the smallest field value to include, or None for no lower bound.
+            - high, the largest field value to include, or None for no upper bound.
+        Output: A list of the matching keys, in ascending order of field value.
+        Postconditions: If the field has no index, raises KeyError; if its index is not sorted, raises ValueError.
+        """
+        index = self._index_on(field)
+        if index.sorted_values is None:
+            raise ValueError(f"The index on field '{field}' is not sorted.")
+        values = index.sorted_values
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        stop = len(values) if high is None else bisect.bisect_right(values, high)
+        return [key for value in values[start:stop] for key in index.keys_by_value[value]]
+
+    def has(self, key: object) -> bool:
+        """
+        Checks if a key is present in the hash table.
+
+        Preconditions: key is hashable
+        Returns: True if the key is in the hash table; False otherwise.
+        """
+        if self._old_hash is not None:
+            self._rehash_some(self.rehash_step)
+        return self._find(key, hash(key)) is not None
+
+    def print(self):
+        """
+        Prints out the elements in each linked list of the hash array.
+
+        Preconditions: True
+        Output: Prints the contents of each slot in the hash table.
+        Postconditions: The contents of the hash table are printed to the console.
+        """
+        for i, linked_list in enumerate(self.hash_linked):
+            print(f"Slot {i}: ", end="")
+            if linked_list is None:
+                print("None")
+            else:
+                linked_list.print()
+        if self._old_hash is not None:
+            for i in range(self._rehash_index, len(self._old_hash)):
+                linked_list = self._old_hash[i]
+                if linked_list is not None and linked_list.head is not None:
+                    print(f"Resizing from slot {i}: ", end="")
+                    linked_list.print()
+
+
+ENGINES = {
+    "chained": LinkedHash,
+    "open": OpenHash,
+}
+
+
+def create_hash(engine: str = "chained"):
+    """
+    Creates an empty hash table backed by the chosen engine.
+
+    Preconditions: True
+    Input: engine, the name of the backend: "chained" for LinkedHash (separate chaining over LinkedList
+           buckets) or "open" for OpenHash (compact open addressing).
+    Output: A new, empty hash table supporting associate, get and has.
+    Postconditions: If the engine name is unknown, raises ValueError.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown hash engine '{engine}'. Expected one of {sorted(ENGINES)}.")
+    return ENGINES[engine]()
@@ -1,376 +1,1150 @@
-class LinkedList:
-    """
-    A linked list class.
-
-    Attributes:
-        head (Node): The first node in the linked list, or None if the list is empty.
-        size (int): The number of nodes in the linked list.
-    """
-
-    class Node:
-        """
-        A node for use in a linked list.
-
-        Attributes:
-            data (object): The data stored in the node.
-            next (Node): The next node in the linked list, or None if this is the last node.
-        """
-
-        def __init__(self, data: object):
-            """
-            Initialise a new node with data.
-
-            Preconditions: True.
-            Input: data, an object to be stored in the node.
-            Postconditions: The node is created with the given data and no next node.
-            """
-            self.data = data  
-            self.next = None  
-
-    def __init__(self):
-        """
-        Initialise a new, empty linked list.
-
-        Preconditions: True.
-        Postconditions: An empty linked list is created with a head pointing to None and size 0.
-        """
-        self.head = None
-        self.size = 0
-
-    def append(self, data):
-        """
-        Append a node to the end of the list.
-
-        Preconditions: True
-        Input: data, an object to be appended to the list.
-        Postconditions: The list has one additional node at the end containing the given data.
-        """
-        new_node = self.Node(data)
-        if self.head is None:
-            self.head = new_node
-            self.size += 1
-            return
-        current_node = self.head
-        while current_node.next:
-            current_node = current_node.next
-        current_node.next = new_node
-        self.size += 1
-
-    def find_first(self, data):
-        """
-        Finds the first index of the given data. If none, raises ValueError.
-
-        Preconditions: True
-        Input: data, the object to be located in the list.
-        Output: The index (int) of the node containing the data.
-        Postconditions: If the data is found, returns the index of the node containing it.
-                        If the data is not found, raises a ValueError.
-        """
-        current_node = self.head
-        current_position = 0
-        while current_node:
-            if current_node.data == data:
-                return current_position
-            else:
-                current_node = current_node.next
-                current_position += 1
-        raise ValueError(f"{data} not found in the list.")
-
-    def find_last(self, data):
-        """
-        Finds the last index of the given data. If none, raises ValueError.
-
-        Preconditions: True
-        Input: data, the object to be located in the list.
-        Output: The last index (int) of the node containing the data.
-        Postconditions: If the data is found, returns the last index of the node containing it.
-                        If the data is not found, raises a ValueError.
-        """
-        current_node = self.head
-        current_position = 0
-        last_position = -1  # Using -1 to indicate that the data hasn't been found yet.
-        while current_node:
-            if current_node.data == data:
-                last_position = current_position
-            current_node = current_node.next
-            current_position += 1
-
-        if last_position != -1:
-            return last_position
-        else:
-            raise ValueError(f"{data} not found in the list.")
-
-    def find_all(self, data):
-        """
-        Finds every index for the given data, returning a list of indices.
-
-        Preconditions: True
-        Input: data, the object to be located in the list.
-        Output: A list of integers representing indices where the data is found.
-        Postconditions: If the data is found, returns a list of indices. If not found, raises ValueError.
-        """
-        current_node = self.head
-        current_position = 0
-        index_found = []
-        while current_node:
-            if current_node.data == data:
-                index_found.append(current_position)
-            current_node = current_node.next
-            current_position += 1
-        
-        if not index_found:
-            raise ValueError(f"{data} not found in the list.")
-        else:
-            return index_found
-
-    def get_position(self, index: int):
-        """
-        Retrieves the data at the specified index in the list.
-
-        Preconditions: True
-        Input: index, an integer specifying the position in the list.
-        Output: The data object at the specified index.
-        Postconditions: Returns the data at the specified index if it exists, or raises IndexError.
-        """
-        if index < 0 or index >= self.size:
-            raise IndexError("Index outside of list range")
-        current_position = 0
-        current_node = self.head
-        while current_node and current_position < index:
-            current_node = current_node.next
-            current_position += 1
-
-        return current_node.data if current_node else None
-
-    def from_array(self, array):
-        """
-        Converts an array into a linked list.
-
-        Preconditions: True
-        Input: array, a list of objects to be converted into a linked list.
-        Postconditions: The current linked list represents the sequence of elements in the array.
-                        If the array is empty, raises TypeError.
-        """
-        if not isinstance(array, list):
-            raise TypeError("Expected a list")
-        
-        for data in array:
-            self.append(data)
-    
-    def from_dict(self, input_dict):
-        """
-        Creates a linked list from the key-value pairs of a given dictionary.
-
-        Preconditions: True
-        Input: input_dict, a dictionary whose key-value pairs will be used to create the linked list.
-        Postconditions: A linked list is created with nodes containing the key-value pairs from the input dictionary.
-                        If the input is not a dictionary, raises TypeError.
-        """
-        if not isinstance(input_dict, dict):
-            raise TypeError("Expected a dictionary")
-
-        for key, value in input_dict.items():
-            self.append((key, value))
-    
-    def convert_str(self, string: str):
-        """
-        Converts a string into a linked list, where each node contains a character.
-
-        Preconditions: True
-        Input: string, a string to be converted into a linked list.
-        Postconditions: The current linked list represents the sequence of characters in the string.
-                        If the input is not a string, raises TypeError.
-        """
-        if not isinstance(string, str):
-            raise TypeError("Expected a string")
-
-        for char in string:
-            self.append(char)
-
-    def create_array(self):
-        """
-        Converts the linked list into an array.
-
-        Preconditions: True
-        Output: An array containing the data from the linked list nodes.
-        Postconditions: Returns an array representing the sequence of elements in the linked list.
-        """
-        current_node = self.head
-        array = []
-        while current_node:
-            array.append(current_node.data)
-            current_node = current_node.next
-        return array
-
-    def insert(self, index, data):
-        """
-        Inserts data at a specified index in the list.
-
-        Preconditions: True
-        Input: 
-            - index, an integer specifying the position in the list where the data should be inserted.
-            - data, the object to be inserted in the list.
-        Postconditions: The data is inserted at the specified position, or an error is raised if the index is invalid.
-        """
-        if index < 0:
-            raise IndexError("Position < 0")
-        if index > self.size:
-            raise ValueError("Position > size of list")
-        
-        new_node = self.Node(data)  # Updated to self.Node
-        if index == 0:
-            new_node.next = self.head
-            self.head = new_node
-        else:
-            current_node = self.head
-            for _ in range(index - 1):
-                if current_node is None:
-                    raise IndexError("Position exceeds list size")
-                current_node = current_node.next
-            new_node.next = current_node.next
-            current_node.next = new_node
-        self.size += 1
-     
-    def insert_after(self, data, new_data):
-        """
-        Inserts new data immediately after the first occurrence of specified data in the list.
-
-        Preconditions: True
-        Input: 
-            - data, the object after which the new data should be inserted.
-            - new_data, the object to be inserted in the list.
-        Postconditions: The new data is inserted immediately after the first occurrence of specified data,
-                        or does nothing if the specified data is not found.
-        """
-        new_node = self.Node(new_data)
-        current_node = self.head
-
-        while current_node:
-            if current_node.data == data:
-                new_node.next = current_node.next
-                current_node.next = new_node
-                self.size += 1
-                break
-            current_node = current_node.next
-
-    def insert_array(self, index, array):
-        """
-        Inserts an array of data at a specified index in the list.
-
-        Preconditions: True
-        Input: 
-            - index, an integer specifying the position in the list where the array should be inserted.
-            - array, a list of objects to be inserted into the list.
-        Postconditions: The data from the array is inserted at the specified position,
-                        or an error is raised if the index is invalid or input is not an array.
-        """
-        if not isinstance(array, list):
-            raise TypeError("Input is not an array")
-        if index < 0 or index > self.size:
-            raise ValueError("Index outside of list range")
-
-        if index == 0:
-            old_head = self.head
-            for data in array[::-1]:  # Reverse the array to maintain order when inserting at the head
-                new_node = self.Node(data)
-                new_node.next = old_head
-                self.head = new_node
-            self.size += len(array)
-        else:
-            current_node = self.head
-            for _ in range(index - 1):
-                current_node = current_node.next
-            splice_end = current_node.next
-
-            for data in array:
-                new_node = self.Node(data)
-                current_node.next = new_node
-                current_node = new_node
-            current_node.next = splice_end
-            self.size += len(array)
-
-    def delete_item(self, index):
-        """
-        Deletes the item at the specified index from the list.
-
-        Preconditions: True
-        Input: index, an integer indicating the position of the item to be deleted.
-        Postconditions: The item at the specified index is removed from the list,
-                        or an error is raised if the index is invalid.
-        """
-        if index < 0 or index >= self.size:
-            raise IndexError("Index outside of list range")
-        if index == 0:
-            self.head = self.head.next
-        else:
-            current_node = self.head
-            for _ in range(index - 1):
-                current_node = current_node.next
-            current_node.next = current_node.next.next if current_node.next else None
-        self.size -= 1
-
-    def replace_position(self, index: int, data):
-        """
-        Replaces the data at a specified position in the list.
-
-        Preconditions: True
-        Input: 
-            - index, an integer specifying the position in the list.
-            - data, the new data to be placed at the specified position.
-        Postconditions: The data at the specified position is replaced,
-                        or an error is raised if the index is invalid.
-        """
-        if index < 0 or index >= self.size:
-            raise IndexError("Index outside of list range")
-
-        current_node = self.head
-        for _ in range(index):
-            current_node = current_node.next
-
-        current_node.data = data if current_node else None
-
-    def replace_all(self, old, new):
-        """
-        Replaces all occurrences of a specified value with a new value in the list.
-
-        Preconditions: True
-        Input: 
-            - old, the value to be replaced.
-            - new, the value to replace with.
-        Postconditions: All instances of 'old' in the list are replaced with 'new'.
-        """
-        current_node = self.head
-        while current_node:
-            if current_node.data == old:
-                current_node.data = new
-            current_node = current_node.next
-
-    def clear_all(self, confirm=False):
-        """
-        Clears all elements from the linked list.
-
-        Preconditions: True
-        Input: confirm, a boolean indicating whether to proceed with clearing the list.
-        Postconditions: If confirm is True, the list is cleared; otherwise, nothing happens.
-        """
-        if confirm:
-            self.head = None
-            self.size = 0
-        else:
-            print("Clear operation cancelled. Set confirm=True to clear the list.")
-
-    def print(self):
-        """
-        Prints the elements of the linked list.
-
-        Preconditions: True
-        Output: Prints each element of the list followed by an arrow, ending with 'None'.
-        Postconditions: The elements of the list are printed to the console.
-        """
-        current_node = self.head
-        while current_node:
-            print(current_node.data, end=" -> ")
-            current_node = current_node.next
-        print("None")
-
-
+import bisect
+
+
+class LinkedList:
+    """
+    A linked list class.
+
+    Attributes:
+        head (Node): The first node in the linked list, or None if the list is empty.
+        tail (Node): The last node in the linked list, or None if the list is empty.
+        size (int): The number of nodes in the linked list.
+        indexed (bool): Whether the list keeps a value index for find_first, find_last, find_all,
+                        insert_after and replace_all.
+    """
+
+    class Node:
+        """
+        A node for use in a linked list.
+
+        Attributes:
+            data (object): The data stored in the node.
+            next (Node): The next node in the linked list, or None if this is the last node.
+        """
+
+        __slots__ = ("data", "next")
+
+        def __init__(self, data: object):
+            """
+            Initialise a new node with data.
+
+            Preconditions: True.
+            Input: data, an object to be stored in the node.
+            Postconditions: The node is created with the given data and no next node.
+            """
+            self.data = data  
+            self.next = None  
+
+    class Cursor:
+        """
+        A movable position in a linked list, supporting O(1) stepping, insertion and deletion at that position.
+
+        The cursor sits on a node (or past the last node) and remembers the node before it, so it never
+        needs to walk the list again. It stays valid only while the list is modified through this cursor.
+
+        Attributes:
+            index (int): The position of the cursor, from 0 to the size of the list.
+        """
+
+        __slots__ = ("_list", "_previous", "_current", "index")
+
+        def __init__(self, linked_list, index: int = 0):
+            """
+            Initialise a cursor at a position in a list.
+
+            Preconditions: True
+            Input:
+                - linked_list, the LinkedList to move through.
+                - index, the starting position, from 0 to the size of the list.
+            Postconditions: The cursor sits at the given position, or IndexError is raised if it is invalid.
+            """
+            if index < 0 or index > linked_list.size:
+                raise IndexError("Index outside of list range")
+            self._list = linked_list
+            self._previous = None if index == 0 else linked_list._node_at(index - 1)
+            self._current = linked_list.head if self._previous is None else self._previous.next
+            self.index = index
+
+        @property
+        def data(self):
+            """
+            The data of the node under the cursor. Raises IndexError if the cursor is past the end.
+            """
+            if self._current is None:
+                raise IndexError("Cursor is past the end of the list")
+            return self._current.data
+
+        def at_end(self) -> bool:
+            """
+            Checks whether the cursor is past the last node.
+
+            Preconditions: True
+            Output: True if there is no node under the cursor; otherwise, False.
+            """
+            return self._current is None
+
+        def next(self):
+            """
+            Moves the cursor to the next node.
+
+            Preconditions: The cursor is not past the end.
+            Postconditions: The cursor sits one position further on, or IndexError is raised if it was past the end.
+            """
+            if self._current is None:
+                raise IndexError("Cursor is past the end of the list")
+            self._previous = self._current
+            self._current = self._current.next
+            self.index += 1
+
+        def insert(self, data):
+            """
+            Inserts data in front of the node under the cursor.
+
+            Preconditions: True
+            Input: data, the object to be inserted.
+            Postconditions: The new node sits at the old cursor position and the cursor stays on the same node,
+                            one position further on, so repeated inserts keep their order.
+            """
+            new_node = self._list.Node(data)
+            self._list._link_after(self._previous, new_node)
+            self._previous = new_node
+            self.index += 1
+            self._list._set_finger(self.index - 1, new_node)
+
+        def delete(self):
+            """
+            Deletes the node under the cursor.
+
+            Preconditions: The cursor is not past the end.
+            Output: The data of the deleted node.
+            Postconditions: The cursor sits on the node that followed the deleted one, or IndexError is raised
+                            if it was past the end.
+            """
+            if self._current is None:
+                raise IndexError("Cursor is past the end of the list")
+            data = self._current.data
+            self._list._unlink_after(self._previous)
+            self._current = self._current.next
+            self._list._set_finger(self.index - 1, self._previous)
+            return data
+
+    def __init__(self, indexed: bool = False):
+        """
+        Initialise a new, empty linked list.
+
+        Preconditions: True.
+        Input: indexed, whether to keep a value index mapping each hashable value to the positions holding it.
+               Appends, tail insertions and deletions, and replacements keep the index current; other
+               structural changes mark it stale, and it is rebuilt in one pass by the next lookup.
+        Postconditions: An empty linked list is created with a head and tail pointing to None and size 0.
+        """
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self._finger_index = 0
+        self._finger_node = None
+        self.indexed = indexed
+        self._value_index = {} if indexed else None
+        self._index_stale = False
+        self._index_unhashable = 0
+
+    def __iter__(self):
+        """
+        Iterates over the data in the list, from head to tail, without copying it.
+
+        Preconditions: The list is not modified while the iteration is in progress.
+        Output: A generator yielding the data of each node in order.
+        """
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next
+
+    def __len__(self):
+        """
+        Returns the number of nodes in the list.
+        """
+        return self.size
+
+    def __contains__(self, data):
+        """
+        Checks whether any node in the list holds the given data.
+
+        Preconditions: True
+        Output: True if the data is found; otherwise, False.
+        """
+        for item in self:
+            if item == data:
+                return True
+        return False
+
+    def append(self, data):
+        """
+        Append a node to the end of the list.
+
+        Preconditions: True
+        Input: data, an object to be appended to the list.
+        Postconditions: The list has one additional node at the end containing the given data.
+        """
+        new_node = self.Node(data)
+        if self.head is None:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+        if self._value_index is not None and not self._index_stale:
+            self._index_add(data, self.size - 1)
+
+    def extend(self, iterable):
+        """
+        Appends every item of an iterable to the end of the list in a single pass.
+
+        Preconditions: True
+        Input: iterable, any iterable of objects to be appended to the list.
+        Postconditions: The list has one additional node per item, in iteration order, at the end.
+        """
+        first, last, count = self._build_chain(iterable)
+        if first is None:
+            return
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self._index_add_chain(first, self.size)
+        self.size += count
+
+    def _build_chain(self, iterable):
+        """
+        Builds an unattached chain of nodes from an iterable.
+
+        Preconditions: True
+        Input: iterable, any iterable of objects.
+        Output: A tuple (first, last, count) describing the chain, or (None, None, 0) if the iterable is empty.
+        """
+        iterator = iter(iterable)
+        for data in iterator:
+            first = last = self.Node(data)
+            break
+        else:
+            return None, None, 0
+        count = 1
+        node_class = self.Node
+        for data in iterator:
+            new_node = node_class(data)
+            last.next = new_node
+            last = new_node
+            count += 1
+        return first, last, count
+
+    def _set_finger(self, index: int, node) -> None:
+        """
+        Caches a known (index, node) position for later positional walks.
+
+        Preconditions: node is the node at index, or None to drop the cache.
+        """
+        self._finger_index = index
+        self._finger_node = node
+
+    def _node_at(self, index: int):
+        """
+        Walks to the node at a given position, starting from the cached finger when it is at or before the index.
+
+        Preconditions: 0 <= index < size
+        Input: index, the position to walk to.
+        Output: The node at that position.
+        Postconditions: The finger is moved to the returned node.
+        """
+        if index == self.size - 1:
+            current_node = self.tail
+        else:
+            if self._finger_node is not None and self._finger_index <= index:
+                current_position, current_node = self._finger_index, self._finger_node
+            else:
+                current_position, current_node = 0, self.head
+            for _ in range(index - current_position):
+                current_node = current_node.next
+        self._finger_index = index
+        self._finger_node = current_node
+        return current_node
+
+    def _index_add(self, data, position: int) -> None:
+        """
+        Records a value at a position in the value index.
+
+        Preconditions: The index is enabled and current.
+        Postconditions: position is appended to the value's positions, or the value is counted as unhashable.
+        """
+        try:
+            self._value_index.setdefault(data, []).append(position)
+        except TypeError:
+            self._index_unhashable += 1
+
+    def _index_add_chain(self, first, position: int) -> None:
+        """
+        Records a chain of nodes appended at the end of the list in the value index, if it is current.
+
+        Preconditions: first starts a chain running to the end of the list, and position is first's position.
+        """
+        if self._value_index is None or self._index_stale:
+            return
+        current_node = first
+        while current_node is not None:
+            self._index_add(current_node.data, position)
+            current_node = current_node.next
+            position += 1
+
+    def _index_replace(self, position: int, old, new) -> None:
+        """
+        Moves a position from one value's entry in the value index to another's, if the index is current.
+
+        Preconditions: The data at position has just changed from old to new.
+        Postconditions: The position is listed under new only, keeping each value's positions ascending.
+        """
+        if self._value_index is None or self._index_stale:
+            return
+        self._index_discard(old, position)
+        try:
+            bisect.insort(self._value_index.setdefault(new, []), position)
+        except TypeError:
+            self._index_unhashable += 1
+
+    def _index_discard(self, data, position: int) -> None:
+        """
+        Removes a value's position from the value index.
+
+        Preconditions: The index is enabled and current, and lists position under data.
+        Postconditions: The position is no longer listed, or the unhashable count drops if data is unhashable.
+        """
+        try:
+            positions = self._value_index[data]
+        except TypeError:
+            self._index_unhashable -= 1
+            return
+        del positions[bisect.bisect_left(positions, position)]
+        if not positions:
+            del self._value_index[data]
+
+    def _rebuild_index(self) -> None:
+        """
+        Rebuilds the value index from the list in one pass.
+
+        Preconditions: The index is enabled.
+        Postconditions: The index maps each hashable value to its ascending positions and is no longer stale.
+        """
+        self._value_index = {}
+        self._index_unhashable = 0
+        self._index_stale = False
+        for position, data in enumerate(self):
+            self._index_add(data, position)
+
+    def _indexed_positions(self, data):
+        """
+        Looks a value up in the value index.
+
+        Preconditions: True
+        Input: data, the value to look up.
+        Output: The ascending list of positions holding the value, or None if the index cannot answer
+                (it is disabled, the value is unhashable, or the list holds unhashable values that a scan must compare).
+        """
+        if self._value_index is None:
+            return None
+        if self._index_stale:
+            self._rebuild_index()
+        if self._index_unhashable:
+            return None
+        try:
+            return self._value_index.get(data, [])
+        except TypeError:
+            return None
+
+    def _link_after(self, previous_node, new_node) -> None:
+        """
+        Links a new node in after another node, or at the head.
+
+        Preconditions: new_node is not in any list. previous_node is in this list, or None for the head.
+        Postconditions: new_node follows previous_node, and tail and size are updated.
+                        The caller is responsible for the finger.
+        """
+        if previous_node is None:
+            new_node.next = self.head
+            self.head = new_node
+        else:
+            new_node.next = previous_node.next
+            previous_node.next = new_node
+        self.size += 1
+        if new_node.next is None:
+            self.tail = new_node
+            if self._value_index is not None and not self._index_stale:
+                self._index_add(new_node.data, self.size - 1)
+        else:
+            self._index_stale = True
+
+    def _unlink_after(self, previous_node):
+        """
+        Unlinks the node following another node, or the head.
+
+        Preconditions: previous_node is in this list (or None for the head) and is followed by a node.
+        Output: The node that was unlinked.
+        Postconditions: head, tail and size are updated. The caller is responsible for the finger.
+        """
+        if previous_node is None:
+            removed_node = self.head
+            self.head = removed_node.next
+        else:
+            removed_node = previous_node.next
+            previous_node.next = removed_node.next
+        self.size -= 1
+        if removed_node is self.tail:
+            self.tail = previous_node
+            if self._value_index is not None and not self._index_stale:
+                self._index_discard(removed_node.data, self.size)
+        else:
+            self._index_stale = True
+        return removed_node
+
+    def enable_stats(self, exporter=None, sample_every: int = 1024):
+        """
+        Starts collecting operation counts and node visits. See instrumentation.Stats.
+
+        Stats are off by default, and a list with stats off runs no instrumentation code at all.
+
+        Preconditions: sample_every > 0
+        Input:
+            - exporter, a callable passed a snapshot dictionary by Stats.export() and by disable_stats().
+            - sample_every, how many operations pass between load-factor samples.
+        Output: The Stats object collecting the counters.
+        """
+        from instrumentation import enable_stats
+        return enable_stats(self, exporter, sample_every)
+
+    def disable_stats(self):
+        """
+        Stops collecting stats, passing a final snapshot to the exporter.
+
+        Output: The final snapshot dictionary, or None if stats were not enabled.
+        """
+        from instrumentation import disable_stats
+        return disable_stats(self)
+
+    def cursor(self, index: int = 0):
+        """
+        Creates a cursor at a position in the list.
+
+        Preconditions: True
+        Input: index, the starting position, from 0 to the size of the list.
+        Output: A LinkedList.Cursor sitting at that position.
+        """
+        return self.Cursor(self, index)
+
+    def find_first(self, data):
+        """
+        Finds the first index of the given data. If none, raises ValueError.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: The index (int) of the node containing the data.
+        Postconditions: If the data is found, returns the index of the node containing it.
+                        If the data is not found, raises a ValueError.
+        """
+        positions = self._indexed_positions(data)
+        if positions is not None:
+            if not positions:
+                raise ValueError(f"{data} not found in the list.")
+            return positions[0]
+        position, node = self._scan_for(data)
+        if node is None:
+            raise ValueError(f"{data} not found in the list.")
+        return position
+
+    def _scan_for(self, data):
+        """
+        Walks from the head to the first node holding data.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: A tuple (position, node) for the first match, or (size, None) if the data is absent.
+        """
+        current_node = self.head
+        current_position = 0
+        while current_node:
+            if current_node.data == data:
+                return current_position, current_node
+            current_node = current_node.next
+            current_position += 1
+        return current_position, None
+
+    def find_last(self, data):
+        """
+        Finds the last index of the given data. If none, raises ValueError.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: The last index (int) of the node containing the data.
+        Postconditions: If the data is found, returns the last index of the node containing it.
+                        If the data is not found, raises a ValueError.
+        """
+        positions = self._indexed_positions(data)
+        if positions is not None:
+            if not positions:
+                raise ValueError(f"{data} not found in the list.")
+            return positions[-1]
+        current_node = self.head
+        current_position = 0
+        last_position = -1  # Using -1 to indicate that the data hasn't been found yet.
+        while current_node:
+            if current_node.data == data:
+                last_position = current_position
+            current_node = current_node.next
+            current_position += 1
+
+        if last_position != -1:
+            return last_position
+        else:
+            raise ValueError(f"{data} not found in the list.")
+
+    def find_all(self, data):
+        """
+        Finds every index for the given data, returning a list of indices.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: A list of integers representing indices where the data is found.
+        Postconditions: If the data is found, returns a list of indices. If not found, raises ValueError.
+        """
+        positions = self._indexed_positions(data)
+        if positions is not None:
+            if not positions:
+                raise ValueError(f"{data} not found in the list.")
+            return list(positions)
+        current_node = self.head
+        current_position = 0
+        index_found = []
+        while current_node:
+            if current_node.data == data:
+                index_found.append(current_position)
+            current_node = current_node.next
+            current_position += 1
+        
+        if not index_found:
+            raise ValueError(f"{data} not found in the list.")
+        else:
+            return index_found
+
+    def get_position(self, index: int):
+        """
+        Retrieves the data at the specified index in the list.
+
+        Preconditions: True
+        Input: index, an integer specifying the position in the list.
+        Output: The data object at the specified index.
+        Postconditions: Returns the data at the specified index if it exists, or raises IndexError.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        return self._node_at(index).data
+
+    def from_array(self, array):
+        """
+        Converts an array into a linked list.
+
+        Preconditions: True
+        Input: array, a list of objects to be converted into a linked list.
+        Postconditions: The current linked list represents the sequence of elements in the array.
+                        If the array is empty, raises TypeError.
+        """
+        if not isinstance(array, list):
+            raise TypeError("Expected a list")
+
+        self.extend(array)
+    
+    def from_dict(self, input_dict):
+        """
+        Creates a linked list from the key-value pairs of a given dictionary.
+
+        Preconditions: True
+        Input: input_dict, a dictionary whose key-value pairs will be used to create the linked list.
+        Postconditions: A linked list is created with nodes containing the key-value pairs from the input dictionary.
+                        If the input is not a dictionary, raises TypeError.
+        """
+        if not isinstance(input_dict, dict):
+            raise TypeError("Expected a dictionary")
+
+        self.extend(input_dict.items())
+    
+    def convert_str(self, string: str):
+        """
+        Converts a string into a linked list, where each node contains a character.
+
+        Preconditions: True
+        Input: string, a string to be converted into a linked list.
+        Postconditions: The current linked list represents the sequence of characters in the string.
+                        If the input is not a string, raises TypeError.
+        """
+        if not isinstance(string, str):
+            raise TypeError("Expected a string")
+
+        self.extend(string)
+
+    def create_array(self):
+        """
+        Converts the linked list into an array.
+
+        Preconditions: True
+        Output: An array containing the data from the linked list nodes.
+        Postconditions: Returns an array representing the sequence of elements in the linked list.
+        """
+        current_node = self.head
+        array = []
+        while current_node:
+            array.append(current_node.data)
+            current_node = current_node.next
+        return array
+
+    def map(self, function):
+        """
+        Lazily applies a function to the data in the list.
+
+        Preconditions: The list is not modified while the result is being consumed.
+        Input: function, a callable taking one data item.
+        Output: A generator yielding function(data) for each node in order.
+        """
+        for data in self:
+            yield function(data)
+
+    def filter(self, predicate):
+        """
+        Lazily selects the data in the list that satisfies a predicate.
+
+        Preconditions: The list is not modified while the result is being consumed.
+        Input: predicate, a callable taking one data item and returning a truth value.
+        Output: A generator yielding, in order, the data for which predicate(data) is true.
+        """
+        for data in self:
+            if predicate(data):
+                yield data
+
+    def take(self, n: int):
+        """
+        Lazily yields the data of the first n nodes.
+
+        Preconditions: n >= 0
+        Input: n, the maximum number of items to yield.
+        Output: A generator yielding the data of at most n nodes, from the head.
+        """
+        current_node = self.head
+        while current_node is not None and n > 0:
+            yield current_node.data
+            current_node = current_node.next
+            n -= 1
+
+    def chunks(self, size: int):
+        """
+        Lazily groups the data in the list into consecutive chunks.
+
+        Preconditions: size > 0
+        Input: size, the number of items per chunk.
+        Output: A generator yielding lists of size items, the last of which may be shorter.
+                Only one chunk is held in memory at a time.
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+        chunk = []
+        for data in self:
+            chunk.append(data)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def insert(self, index, data):
+        """
+        Inserts data at a specified index in the list.
+
+        Preconditions: True
+        Input: 
+            - index, an integer specifying the position in the list where the data should be inserted.
+            - data, the object to be inserted in the list.
+        Postconditions: The data is inserted at the specified position, or an error is raised if the index is invalid.
+        """
+        if index < 0:
+            raise IndexError("Position < 0")
+        if index > self.size:
+            raise ValueError("Position > size of list")
+        
+        new_node = self.Node(data)  # Updated to self.Node
+        if index == 0:
+            self._finger_index += 1
+            self._link_after(None, new_node)
+        else:
+            self._link_after(self._node_at(index - 1), new_node)
+     
+    def insert_after(self, data, new_data):
+        """
+        Inserts new data immediately after the first occurrence of specified data in the list.
+
+        Preconditions: True
+        Input: 
+            - data, the object after which the new data should be inserted.
+            - new_data, the object to be inserted in the list.
+        Postconditions: The new data is inserted immediately after the first occurrence of specified data,
+                        or does nothing if the specified data is not found.
+        """
+        new_node = self.Node(new_data)
+        positions = self._indexed_positions(data)
+        if positions is not None:
+            if positions:
+                self._link_after(self._node_at(positions[0]), new_node)
+            return
+        _, current_node = self._scan_for(data)
+        if current_node is not None:
+            self._link_after(current_node, new_node)
+            self._finger_node = None
+
+    def insert_array(self, index, array):
+        """
+        Inserts an array of data at a specified index in the list.
+
+        Preconditions: True
+        Input: 
+            - index, an integer specifying the position in the list where the array should be inserted.
+            - array, a list of objects to be inserted into the list.
+        Postconditions: The data from the array is inserted at the specified position,
+                        or an error is raised if the index is invalid or input is not an array.
+        """
+        if not isinstance(array, list):
+            raise TypeError("Input is not an array")
+        if index < 0 or index > self.size:
+            raise ValueError("Index outside of list range")
+
+        first, last, count = self._build_chain(array)
+        if first is None:
+            return
+        if index == 0:
+            last.next = self.head
+            self.head = first
+            if self.tail is None:
+                self.tail = last
+            self._finger_index += count
+        elif index == self.size:
+            self.tail.next = first
+            self.tail = last
+            self._index_add_chain(first, index)
+            self.size += count
+            return
+        else:
+            current_node = self._node_at(index - 1)
+            last.next = current_node.next
+            current_node.next = first
+        self.size += count
+        self._index_stale = True
+
+    def delete_item(self, index):
+        """
+        Deletes the item at the specified index from the list.
+
+        Preconditions: True
+        Input: index, an integer indicating the position of the item to be deleted.
+        Postconditions: The item at the specified index is removed from the list,
+                        or an error is raised if the index is invalid.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        if index == 0:
+            if self._finger_node is self.head:
+                self._finger_node = None
+            self._finger_index -= 1
+            self._unlink_after(None)
+        else:
+            self._unlink_after(self._node_at(index - 1))
+
+    def _take_chain(self, other):
+        """
+        Detaches every node of another list, leaving it empty.
+
+        Preconditions: True
+        Input: other, the LinkedList whose nodes are taken.
+        Output: A tuple (first, last, count) describing the detached chain; first and last are None if other was empty.
+        Postconditions: other is empty. If other is not a LinkedList or is this list, raises TypeError or ValueError.
+        """
+        if not isinstance(other, LinkedList):
+            raise TypeError("Expected a LinkedList")
+        if other is self:
+            raise ValueError("Cannot take the nodes of a list into itself")
+        chain = (other.head, other.tail, other.size)
+        other.head = None
+        other.tail = None
+        other.size = 0
+        other._finger_node = None
+        if other._value_index is not None:
+            other._value_index = {}
+            other._index_stale = False
+            other._index_unhashable = 0
+        return chain
+
+    def concat(self, other):
+        """
+        Moves every node of another list onto the end of this one in O(1), without copying.
+
+        Preconditions: other is a different LinkedList.
+        Input: other, the list whose nodes are appended.
+        Postconditions: This list ends with other's items, in order, and other is empty.
+                        If other is not a LinkedList, raises TypeError; if it is this list, raises ValueError.
+        """
+        first, last, count = self._take_chain(other)
+        if first is None:
+            return
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+        self._index_stale = True
+
+    def splice(self, index: int, other):
+        """
+        Moves every node of another list into this one at a given position, without copying.
+
+        Preconditions: other is a different LinkedList.
+        Input:
+            - index, the position at which other's first item should end up, from 0 to the size of the list.
+            - other, the list whose nodes are inserted.
+        Postconditions: other's items sit at positions index onwards, in order, and other is empty. At most one
+                        walk, to the node before index, is made. If the index is invalid, raises IndexError.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index outside of list range")
+        if index == self.size:
+            self.concat(other)
+            return
+        first, last, count = self._take_chain(other)
+        if first is None:
+            return
+        if index == 0:
+            last.next = self.head
+            self.head = first
+            self._finger_index += count
+        else:
+            previous_node = self._node_at(index - 1)
+            last.next = previous_node.next
+            previous_node.next = first
+        self.size += count
+        self._index_stale = True
+
+    def split_at(self, index: int):
+        """
+        Splits the list in two at a given position, in a single walk.
+
+        Preconditions: True
+        Input: index, the position of the first item to move into the new list, from 0 to the size of the list.
+        Output: A new LinkedList (indexed if this one is) holding the items from index onwards, in order.
+        Postconditions: This list keeps the items before index. The nodes are moved, not copied.
+                        If the index is invalid, raises IndexError.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index outside of list range")
+        tail_list = LinkedList(indexed=self.indexed)
+        if index == self.size:
+            return tail_list
+        if index == 0:
+            first = self.head
+            self.head = None
+            self._finger_node = None
+        else:
+            previous_node = self._node_at(index - 1)
+            first = previous_node.next
+            previous_node.next = None
+        tail_list.head = first
+        tail_list.tail = self.tail
+        tail_list.size = self.size - index
+        tail_list._index_stale = True
+        self.tail = None if index == 0 else previous_node
+        self.size = index
+        self._index_stale = True
+        return tail_list
+
+    def delete_range(self, start: int, stop: int):
+        """
+        Deletes the items at positions start to stop - 1, in a single walk.
+
+        Preconditions: True
+        Input:
+            - start, the position of the first item to delete.
+            - stop, the position after the last item to delete.
+        Postconditions: The items in [start, stop) are removed and the rest keep their order. An empty range
+                        changes nothing. If 0 <= start <= stop <= size does not hold, raises IndexError.
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError("Index outside of list range")
+        if start == stop:
+            return
+        if start == 0:
+            previous_node = None
+            current_node = self.head
+            self._finger_node = None
+        else:
+            previous_node = self._node_at(start - 1)
+            current_node = previous_node.next
+        for _ in range(stop - start):
+            current_node = current_node.next
+        if previous_node is None:
+            self.head = current_node
+        else:
+            previous_node.next = current_node
+        if current_node is None:
+            self.tail = previous_node
+        self.size -= stop - start
+        self._index_stale = True
+
+    def replace_position(self, index: int, data):
+        """
+        Replaces the data at a specified position in the list.
+
+        Preconditions: True
+        Input: 
+            - index, an integer specifying the position in the list.
+            - data, the new data to be placed at the specified position.
+        Postconditions: The data at the specified position is replaced,
+                        or an error is raised if the index is invalid.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+
+        current_node = self._node_at(index)
+        old = current_node.data
+        current_node.data = data
+        self._index_replace(index, old, data)
+
+    def replace_all(self, old, new):
+        """
+        Replaces all occurrences of a specified value with a new value in the list.
+
+        Preconditions: True
+        Input: 
+            - old, the value to be replaced.
+            - new, the value to replace with.
+        Postconditions: All instances of 'old' in the list are replaced with 'new'.
+        """
+        positions = self._indexed_positions(old)
+        if positions is not None:
+            if not positions or old is new:
+                return
+            for position in positions:
+                self._node_at(position).data = new
+            del self._value_index[old]
+            try:
+                self._value_index[new] = sorted(self._value_index.get(new, []) + positions)
+            except TypeError:
+                self._index_stale = True
+            return
+        current_node = self.head
+        position = 0
+        while current_node:
+            if current_node.data == old:
+                replaced = current_node.data
+                current_node.data = new
+                self._index_replace(position, replaced, new)
+            current_node = current_node.next
+            position += 1
+
+    @staticmethod
+    def _merge_chains(left, right, key, reverse: bool):
+        """
+        Merges two sorted, None-terminated chains of nodes by relinking them.
+
+        Preconditions: Both chains are non-empty and sorted by key (descending if reverse).
+        Input:
+            - left, the head of the chain whose nodes come first among equals.
+            - right, the head of the other chain.
+            - key, a function extracting the comparison key from a node's data, or None to compare the data itself.
+            - reverse, whether the chains are sorted in descending order.
+        Output: The head of the merged chain. Equal elements keep left before right, so the merge is stable.
+        """
+        if key is None and not reverse:
+            # Plain ascending merge, the common case, without key calls or direction checks.
+            if right.data < left.data:
+                head = tail = right
+                right = right.next
+            else:
+                head = tail = left
+                left = left.next
+            while left is not None and right is not None:
+                if right.data < left.data:
+                    tail.next = tail = right
+                    right = right.next
+                else:
+                    tail.next = tail = left
+                    left = left.next
+            tail.next = left if left is not None else right
+            return head
+        if key is None:
+            key = LinkedList._identity
+        head = tail = None
+        left_key = key(left.data)
+        right_key = key(right.data)
+        while True:
+            if (left_key < right_key) if reverse else (right_key < left_key):
+                node = right
+                right = right.next
+                if right is not None:
+                    right_key = key(right.data)
+            else:
+                node = left
+                left = left.next
+                if left is not None:
+                    left_key = key(left.data)
+            if head is None:
+                head = tail = node
+            else:
+                tail.next = tail = node
+            if left is None or right is None:
+                tail.next = left if left is not None else right
+                return head
+
+    @staticmethod
+    def _identity(data):
+        return data
+
+    def sort(self, key=None, reverse: bool = False):
+        """
+        Sorts the list in place with a stable bottom-up merge sort, relinking the existing nodes.
+
+        Nodes are detached one at a time and merged into runs of 1, 2, 4, ... nodes, kept in a list of
+        O(log n) run heads, so no node is allocated and no data is copied.
+
+        Preconditions: The data (or their keys) can be compared with <.
+        Input:
+            - key, a function extracting a comparison key from each item, or None to compare the items themselves.
+            - reverse, whether to sort in descending order.
+        Postconditions: The list is sorted in O(n log n) comparisons. Equal items keep their relative order,
+                        as with sorted().
+        """
+        if self.size < 2:
+            return
+        runs = []
+        current_node = self.head
+        while current_node is not None:
+            following = current_node.next
+            current_node.next = None
+            run = current_node
+            level = 0
+            while level < len(runs) and runs[level] is not None:
+                run = self._merge_chains(runs[level], run, key, reverse)
+                runs[level] = None
+                level += 1
+            if level == len(runs):
+                runs.append(run)
+            else:
+                runs[level] = run
+            current_node = following
+        head = None
+        for run in runs:
+            if run is not None:
+                head = run if head is None else self._merge_chains(run, head, key, reverse)
+        tail = head
+        while tail.next is not None:
+            tail = tail.next
+        self.head = head
+        self.tail = tail
+        self._finger_node = None
+        self._index_stale = True
+
+    def merge(self, other, key=None, reverse: bool = False):
+        """
+        Merges another sorted list into this one in a single pass, taking over its nodes.
+
+        Preconditions: Both lists are sorted by the same key and direction.
+        Input:
+            - other, a LinkedList sorted like this one.
+            - key, the key function the lists are sorted by, or None.
+            - reverse, whether the lists are sorted in descending order.
+        Postconditions: This list holds every item of both lists in sorted order, with items of this list
+                        before equal items of other. other is left empty. If other is not a LinkedList,
+                        raises TypeError.
+        """
+        if not isinstance(other, LinkedList):
+            raise TypeError("Expected a LinkedList")
+        if other is self or other.head is None:
+            return
+        if self.head is None:
+            self.head, self.tail = other.head, other.tail
+        else:
+            self.head = self._merge_chains(self.head, other.head, key, reverse)
+            if self.tail.next is not None:
+                self.tail = other.tail
+        self.size += other.size
+        self._finger_node = None
+        self._index_stale = True
+        other.clear_all(confirm=True)
+
+    def insert_sorted(self, data, key=None, reverse: bool = False):
+        """
+        Inserts data at its sorted position, keeping a sorted list sorted.
+
+        Preconditions: The list is sorted by key (descending if reverse).
+        Input:
+            - data, the object to be inserted.
+            - key, the key function the list is sorted by, or None.
+            - reverse, whether the list is sorted in descending order.
+        Postconditions: The data follows every item that does not sort after it, so equal items stay in insertion
+                        order. Data sorting at or after the tail is appended in O(1); otherwise the list is walked
+                        from the head.
+        """
+        data_key = data if key is None else key(data)
+
+        def goes_before(node):
+            node_key = node.data if key is None else key(node.data)
+            return (node_key < data_key) if reverse else (data_key < node_key)
+
+        if self.tail is None or not goes_before(self.tail):
+            self.append(data)
+            return
+        previous_node = None
+        current_node = self.head
+        position = 0
+        while not goes_before(current_node):
+            previous_node = current_node
+            current_node = current_node.next
+            position += 1
+        new_node = self.Node(data)
+        self._link_after(previous_node, new_node)
+        self._set_finger(position, new_node)
+
+    def clear_all(self, confirm=False):
+        """
+        Clears all elements from the linked list.
+
+        Preconditions: True
+        Input: confirm, a boolean indicating whether to proceed with clearing the list.
+        Postconditions: If confirm is True, the list is cleared; otherwise, nothing happens.
+        """
+        if confirm:
+            self.head = None
+            self.tail = None
+            self.size = 0
+            self._finger_node = None
+            if self._value_index is not None:
+                self._value_index = {}
+                self._index_stale = False
+                self._index_unhashable = 0
+        else:
+            print("Clear operation cancelled. Set confirm=True to clear the list.")
+
+    def print(self):
+        """
+        Prints the elements of the linked list.
+
+        Preconditions: True
+        Output: Prints each element of the list followed by an arrow, ending with 'None'.
+        Postconditions: The elements of the list are printed to the console.
+        """
+        current_node = self.head
+        while current_node:
+            print(current_node.data, end=" -> ")
+            current_node = current_node.next
+        print("None")
+
+
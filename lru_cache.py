@@ -0,0 +1,234 @@
+import functools
+import sys
+import time
+
+from doubly_linked_list import DoublyLinkedList
+from linked_hash import LinkedHash
+
+_MISSING = object()
+# Separates positional from keyword arguments in memoize keys, so the two can never be confused.
+_KWARGS_MARK = object()
+
+
+class LRUCache:
+    """
+    A bounded cache evicting the least recently used entry, with optional per-entry time to live.
+
+    A LinkedHash maps each key to its node in a DoublyLinkedList kept in recency order (most recent at
+    the front), so get, put and eviction are all O(1). The cache can be bounded by entry count, by an
+    estimated byte budget, or both.
+
+    Attributes:
+        max_entries (int): The most entries the cache holds, or None for no count limit.
+        max_bytes (int): The most bytes (as measured by sizeof) the cache holds, or None for no byte limit.
+        ttl (float): The default time to live of an entry in seconds, or None for entries that never expire.
+        hits (int): The number of lookups that found a live entry.
+        misses (int): The number of lookups that found no entry, or an expired one.
+        evictions (int): The number of entries removed to respect max_entries or max_bytes.
+        expirations (int): The number of entries dropped because their time to live had passed.
+        current_bytes (int): The bytes currently held, as measured by sizeof.
+    """
+
+    class Entry:
+        """
+        A cached value with its bookkeeping.
+
+        Attributes:
+            key (object): The key of the entry.
+            value (object): The cached value.
+            expires (float): The clock reading after which the entry is stale, or None if it never expires.
+            nbytes (int): The size of the entry as measured by the cache's sizeof.
+        """
+
+        __slots__ = ("key", "value", "expires", "nbytes")
+
+        def __init__(self, key, value, expires, nbytes):
+            """
+            Initialise a new entry.
+
+            Preconditions: True.
+            Postconditions: The entry holds the given key, value, expiry and size.
+            """
+            self.key = key
+            self.value = value
+            self.expires = expires
+            self.nbytes = nbytes
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = None, ttl: float = None,
+                 sizeof=sys.getsizeof, clock=time.monotonic):
+        """
+        Initialise a new, empty LRUCache.
+
+        Preconditions: max_entries and max_bytes are positive or None.
+        Input:
+            - max_entries, the most entries to hold, or None for no count limit.
+            - max_bytes, the most bytes to hold, or None for no byte limit.
+            - ttl, the default time to live of an entry in seconds, or None for no expiry.
+            - sizeof, a callable estimating the size in bytes of a cached value; only used with max_bytes.
+            - clock, a callable returning the current time in seconds.
+        Postconditions: An empty cache is created with all counters at 0.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._table = LinkedHash()
+        self._order = DoublyLinkedList()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.current_bytes = 0
+
+    def __len__(self):
+        """
+        Returns the number of entries in the cache, including any expired ones not yet dropped.
+        """
+        return self._order.size
+
+    def __contains__(self, key):
+        """
+        Checks whether a live entry exists for a key, without updating recency or counters.
+        """
+        try:
+            node = self._table.get(key)
+        except KeyError:
+            return False
+        expires = node.data.expires
+        return expires is None or expires > self._clock()
+
+    def _drop(self, node) -> None:
+        """
+        Removes an entry's node from both the recency list and the key table.
+
+        Preconditions: node is in the cache.
+        Postconditions: The entry is gone and current_bytes is updated.
+        """
+        entry = self._order.remove(node)
+        self._table.remove(entry.key)
+        self.current_bytes -= entry.nbytes
+
+    def get(self, key, default=_MISSING):
+        """
+        Retrieves the value cached for a key and marks it as most recently used.
+
+        Preconditions: key is hashable
+        Input:
+            - key, the key whose value is to be returned.
+            - default, the value to return on a miss.
+        Output: The cached value, or default on a miss.
+        Postconditions: A hit moves the entry to the front; an expired entry is dropped and counts as a miss.
+                        On a miss with no default, raises KeyError.
+        """
+        try:
+            node = self._table.get(key)
+        except KeyError:
+            node = None
+        if node is not None:
+            entry = node.data
+            if entry.expires is None or entry.expires > self._clock():
+                self._order.move_to_front(node)
+                self.hits += 1
+                return entry.value
+            self._drop(node)
+            self.expirations += 1
+        self.misses += 1
+        if default is _MISSING:
+            raise KeyError(f"Key '{key}' not found in LRUCache.")
+        return default
+
+    def put(self, key, value, ttl: float = None) -> None:
+        """
+        Caches a value for a key as the most recently used entry, evicting as needed.
+
+        Preconditions: key is hashable
+        Input:
+            - key, the key to cache the value under.
+            - value, the value to be cached.
+            - ttl, the time to live of this entry in seconds, overriding the cache default.
+        Postconditions: The key maps to the value, and least recently used entries are evicted until the cache
+                        is within max_entries and max_bytes. A value larger than max_bytes on its own is not cached.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else self._clock() + ttl
+        nbytes = self._sizeof(value) if self.max_bytes is not None else 0
+        try:
+            self._drop(self._table.get(key))
+        except KeyError:
+            pass
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        node = self._order.push_left(self.Entry(key, value, expires, nbytes))
+        self._table.associate(key, node)
+        self.current_bytes += nbytes
+        while ((self.max_entries is not None and self._order.size > self.max_entries)
+               or (self.max_bytes is not None and self.current_bytes > self.max_bytes)):
+            self._drop(self._order.last())
+            self.evictions += 1
+
+    def invalidate(self, key) -> bool:
+        """
+        Removes a key from the cache, if present.
+
+        Preconditions: key is hashable
+        Output: True if an entry was removed; otherwise, False.
+        """
+        try:
+            node = self._table.get(key)
+        except KeyError:
+            return False
+        self._drop(node)
+        return True
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache. The counters are kept.
+        """
+        self._table = LinkedHash()
+        self._order.clear_all(confirm=True)
+        self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters, for sizing the cache or exporting to monitoring.
+
+        Output: A dictionary of hits, misses, evictions, expirations, hit_rate, entries and bytes.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": self._order.size,
+            "bytes": self.current_bytes,
+        }
+
+
+def memoize(max_entries: int = 128, max_bytes: int = None, ttl: float = None, **cache_options):
+    """
+    Decorates a function so that its results are cached in an LRUCache.
+
+    Preconditions: The decorated function's arguments are hashable.
+    Input: max_entries, max_bytes, ttl and any other LRUCache options.
+    Output: A decorator. The wrapped function exposes its cache as the .cache attribute.
+    """
+    def decorator(function):
+        cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, **cache_options)
+        not_cached = object()
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            value = cache.get(key, not_cached)
+            if value is not_cached:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,228 @@
+from array import array
+
+_EMPTY = -1
+_DUMMY = -2
+_MIN_CAPACITY = 8
+_PERTURB_SHIFT = 5
+_DELETED = object()
+
+
+class OpenHash:
+    """
+    A hash table using compact open addressing, in the style of CPython's dict.
+
+    Entries are appended to dense parallel arrays of hashes, keys and values, so they stay
+    in insertion order and cost no per-entry object. A sparse index array of slot numbers
+    maps each hash to its entry; collisions are resolved by perturbed probing over that
+    index array rather than by chaining. Removed entries leave a dummy index slot and a
+    hole in the dense arrays until the next resize compacts them away.
+
+    Attributes:
+        size (int): The number of slots in the sparse index array (always a power of two).
+        total_elements (int): The number of key-value pairs stored in the table.
+    """
+
+    def __init__(self):
+        """
+        Initialise a new, empty OpenHash.
+
+        Preconditions: True
+        Postconditions: An empty OpenHash is created with the minimum index capacity and no entries.
+        """
+        self.size = _MIN_CAPACITY
+        self.total_elements = 0
+        self._indices = array("q", [_EMPTY]) * _MIN_CAPACITY
+        self._hashes = []
+        self._keys = []
+        self._values = []
+
+    def __iter__(self):
+        """
+        Iterates over the (key, value) pairs in the hash table, in insertion order, without copying them.
+
+        Preconditions: The hash table is not modified while the iteration is in progress.
+        Output: A generator yielding a (key, value) tuple for every entry.
+        """
+        for key, value in zip(self._keys, self._values):
+            if key is not _DELETED:
+                yield key, value
+
+    def __len__(self):
+        """
+        Returns the number of key-value pairs in the hash table.
+        """
+        return self.total_elements
+
+    def __contains__(self, key):
+        """
+        Checks if a key is present in the hash table, as has() does.
+        """
+        return self.has(key)
+
+    def _lookup(self, key: object, key_hash: int):
+        """
+        Probes the index array for a key.
+
+        Preconditions: key_hash == hash(key)
+        Input:
+            - key, the key to look for.
+            - key_hash, the hash of the key.
+        Output: A tuple (entry, slot). entry is the position of the key in the dense arrays, or -1 if
+                the key is absent, in which case slot is the first empty or dummy index slot on its probe
+                path. Reusing dummy slots stops repeated insert/remove cycles lengthening the path.
+        """
+        indices = self._indices
+        hashes = self._hashes
+        keys = self._keys
+        mask = self.size - 1
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        slot = key_hash & mask
+        free_slot = -1
+        while True:
+            entry = indices[slot]
+            if entry == _EMPTY:
+                return -1, slot if free_slot < 0 else free_slot
+            if entry == _DUMMY:
+                if free_slot < 0:
+                    free_slot = slot
+            elif hashes[entry] == key_hash:
+                candidate = keys[entry]
+                if candidate is key or candidate == key:
+                    return entry, slot
+            perturb >>= _PERTURB_SHIFT
+            slot = (slot * 5 + perturb + 1) & mask
+
+    @staticmethod
+    def _capacity_for(n: int) -> int:
+        """
+        Computes the index capacity that leaves room for n entries plus as many again after a resize.
+
+        Preconditions: n >= 0
+        Output: A power of two, at least the minimum capacity.
+        """
+        capacity = _MIN_CAPACITY
+        while capacity * 2 // 3 <= n * 2:
+            capacity *= 2
+        return capacity
+
+    def _resize(self, new_capacity: int) -> None:
+        """
+        Compacts the dense arrays and rebuilds the index array at a new capacity.
+
+        Preconditions: new_capacity is a power of two larger than total_elements.
+        Input: new_capacity, the number of slots for the new index array.
+        Postconditions: Every live entry is reachable from the new index array and no removed entries remain.
+        """
+        if len(self._hashes) != self.total_elements:
+            live = [i for i, key in enumerate(self._keys) if key is not _DELETED]
+            self._hashes = [self._hashes[i] for i in live]
+            self._keys = [self._keys[i] for i in live]
+            self._values = [self._values[i] for i in live]
+        indices = array("q", [_EMPTY]) * new_capacity
+        mask = new_capacity - 1
+        for entry, key_hash in enumerate(self._hashes):
+            perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+            slot = key_hash & mask
+            while indices[slot] != _EMPTY:
+                perturb >>= _PERTURB_SHIFT
+                slot = (slot * 5 + perturb + 1) & mask
+            indices[slot] = entry
+        self._indices = indices
+        self.size = new_capacity
+
+    def associate(self, key: object, value: object) -> None:
+        """
+        Associate a key with a value in the hash table.
+
+        Preconditions: key is hashable
+        Input:
+            - key, the key to associate with the value.
+            - value, the value to be associated with the key.
+        Postconditions: The key-value pair is added to the hash table, replacing the old value if the key already exists.
+        """
+        key_hash = hash(key)
+        entry, slot = self._lookup(key, key_hash)
+        if entry >= 0:
+            self._values[entry] = value
+            return
+        if len(self._hashes) >= self.size * 2 // 3:
+            self._resize(self._capacity_for(self.total_elements))
+            _, slot = self._lookup(key, key_hash)
+        self._indices[slot] = len(self._hashes)
+        self._hashes.append(key_hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self.total_elements += 1
+
+    def get(self, key: object) -> object:
+        """
+        Retrieves the value associated with a given key, if it exists.
+
+        Preconditions: key is hashable
+        Input: key, the key whose associated value is to be returned.
+        Output: The value associated with the given key. If the key is absent, raises KeyError.
+        """
+        entry, _ = self._lookup(key, hash(key))
+        if entry >= 0:
+            return self._values[entry]
+        raise KeyError(f"Key '{key}' not found in OpenHash.")
+
+    def remove(self, key: object) -> None:
+        """
+        Removes a key and its value from the hash table.
+
+        Preconditions: key is hashable
+        Input: key, the key to be removed.
+        Postconditions: The key is no longer in the hash table, which may shrink. If the key is absent, raises KeyError.
+        """
+        self.pop(key)
+
+    def pop(self, key: object, default: object = _DELETED) -> object:
+        """
+        Removes a key from the hash table and returns its value.
+
+        Preconditions: key is hashable
+        Input:
+            - key, the key to be removed.
+            - default, the value to return if the key is absent.
+        Output: The value that was associated with the key, or default if the key is absent.
+        Postconditions: The key is no longer in the hash table. Once fewer than one slot in eight is live,
+                        the table shrinks to leave room for as many entries again as it holds.
+                        If the key is absent and no default is given, raises KeyError.
+        """
+        entry, slot = self._lookup(key, hash(key))
+        if entry < 0:
+            if default is _DELETED:
+                raise KeyError(f"Key '{key}' not found in OpenHash.")
+            return default
+        value = self._values[entry]
+        self._indices[slot] = _DUMMY
+        self._keys[entry] = _DELETED
+        self._values[entry] = None
+        self.total_elements -= 1
+        if self.size > _MIN_CAPACITY and self.total_elements * 8 < self.size:
+            self._resize(self._capacity_for(self.total_elements))
+        return value
+
+    def has(self, key: object) -> bool:
+        """
+        Checks if a key is present in the hash table.
+
+        Preconditions: key is hashable
+        Returns: True if the key is in the hash table; False otherwise.
+        """
+        return self._lookup(key, hash(key))[0] >= 0
+
+    def print(self):
+        """
+        Prints out the entry held by each slot of the index array.
+
+        Preconditions: True
+        Output: Prints the contents of each slot in the hash table.
+        Postconditions: The contents of the hash table are printed to the console.
+        """
+        for i, entry in enumerate(self._indices):
+            if entry >= 0:
+                print(f"Slot {i}: {(self._keys[entry], self._values[entry])}")
+            else:
+                print(f"Slot {i}: None")
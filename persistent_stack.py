@@ -0,0 +1,135 @@
+class PersistentStack:
+    """
+    An immutable stack (a cons list) whose push and pop return new versions sharing structure with the old.
+
+    A version is a pointer to its top node, and every node points at the node below it, so push allocates
+    one node that links onto the existing ones and pop simply steps down a node. Neither touches the
+    original version, so keeping a snapshot is O(1) and many versions cost only the nodes pushed since
+    they diverged.
+    """
+
+    __slots__ = ("_top",)
+
+    class Node:
+        """
+        A node of a persistent stack. Nodes are never modified once created.
+
+        Attributes:
+            data (object): The data stored in the node.
+            below (Node): The node beneath this one, or None at the bottom of the stack.
+            size (int): The number of nodes from this one down to the bottom, inclusive.
+        """
+
+        __slots__ = ("data", "below", "size")
+
+        def __init__(self, data: object, below):
+            """
+            Initialise a new node on top of another.
+
+            Preconditions: True.
+            Input: data, the object to be stored; below, the node beneath, or None.
+            Postconditions: The node is created with its size one more than below's.
+            """
+            self.data = data
+            self.below = below
+            self.size = 1 if below is None else below.size + 1
+
+    def __init__(self, iterable=()):
+        """
+        Initialise a new PersistentStack.
+
+        Preconditions: True
+        Input: iterable, items to push in order, so the last one ends up on top.
+        Postconditions: The stack holds the items; an empty stack is created if none are given.
+        """
+        top = None
+        for data in iterable:
+            top = self.Node(data, top)
+        self._top = top
+
+    @classmethod
+    def _from_node(cls, top):
+        """
+        Creates a version whose top is an existing node.
+        """
+        stack = cls.__new__(cls)
+        stack._top = top
+        return stack
+
+    def __iter__(self):
+        """
+        Iterates over the items in the stack from top to bottom.
+
+        Preconditions: True
+        Output: A generator yielding each item, starting with the top of the stack.
+        """
+        node = self._top
+        while node is not None:
+            yield node.data
+            node = node.below
+
+    def __len__(self):
+        """
+        Returns the number of items in the stack.
+        """
+        return 0 if self._top is None else self._top.size
+
+    def push(self, data):
+        """
+        Returns a new version with a data item on top of this one.
+
+        Preconditions: True
+        Input: data, the data to be pushed onto the stack.
+        Output: A new PersistentStack sharing all of this stack's nodes.
+        Postconditions: This version is unchanged.
+        """
+        return self._from_node(self.Node(data, self._top))
+
+    def pop(self):
+        """
+        Returns the version below this one, without its top item.
+
+        Preconditions: The stack is not empty.
+        Output: A new PersistentStack sharing every node but the top. Use peek() first to read the item.
+        Postconditions: This version is unchanged. If the stack is empty, raises IndexError.
+        """
+        if self._top is None:
+            raise IndexError("Pop from empty stack")
+        return self._from_node(self._top.below)
+
+    def peek(self):
+        """
+        Returns the top item from the stack.
+
+        Preconditions: The stack is not empty.
+        Output: The data that is at the top of the stack. If the stack is empty, raises IndexError.
+        """
+        if self._top is None:
+            raise IndexError("Peek from empty stack")
+        return self._top.data
+
+    def is_empty(self):
+        """
+        Checks whether the stack is empty.
+
+        Preconditions: True
+        Output: Returns True if the stack is empty; otherwise, False.
+        """
+        return self._top is None
+
+    def size(self):
+        """
+        Returns the number of items in the stack, in O(1).
+        """
+        return len(self)
+
+    def print_stack(self):
+        """
+        Prints the items in the stack from top to bottom.
+
+        Preconditions: True
+        Output: Each item followed by an arrow, ending with 'None'.
+        """
+        for data in self:
+            print(data, end=" -> ")
+        print("None")
@@ -0,0 +1,418 @@
+from array import array
+
+
+class PooledLinkedList:
+    """
+    A linked list whose nodes live in a pool of parallel arrays instead of separate objects.
+
+    Node i is represented by data[i] and next[i]. Links are integer slot numbers, with -1
+    standing in for None. Slots freed by deletions are threaded onto a free list through the
+    next array and reused by later insertions, so the pool only grows when it is full.
+
+    Attributes:
+        head (int): The slot of the first node in the list, or -1 if the list is empty.
+        tail (int): The slot of the last node in the list, or -1 if the list is empty.
+        size (int): The number of nodes in the linked list.
+    """
+
+    NIL = -1
+
+    def __init__(self):
+        """
+        Initialise a new, empty pooled linked list.
+
+        Preconditions: True.
+        Postconditions: An empty list is created with an empty pool, no free slots and size 0.
+        """
+        self._data = []
+        self._next = array("q")
+        self._free = self.NIL
+        self.head = self.NIL
+        self.tail = self.NIL
+        self.size = 0
+
+    def __iter__(self):
+        """
+        Iterates over the data in the list, from head to tail, without copying it.
+
+        Preconditions: The list is not modified while the iteration is in progress.
+        Output: A generator yielding the data of each node in order.
+        """
+        data, nxt = self._data, self._next
+        slot = self.head
+        while slot != self.NIL:
+            yield data[slot]
+            slot = nxt[slot]
+
+    def __len__(self):
+        """
+        Returns the number of nodes in the list.
+        """
+        return self.size
+
+    def __contains__(self, data):
+        """
+        Checks whether any node in the list holds the given data.
+
+        Preconditions: True
+        Output: True if the data is found; otherwise, False.
+        """
+        for item in self:
+            if item == data:
+                return True
+        return False
+
+    def _allocate(self, data):
+        """
+        Takes a slot from the free list, or grows the pool if no slot is free.
+
+        Preconditions: True
+        Input: data, the object to be stored in the slot.
+        Output: The slot number (int) of the new, unlinked node.
+        """
+        slot = self._free
+        if slot != self.NIL:
+            self._free = self._next[slot]
+            self._data[slot] = data
+            self._next[slot] = self.NIL
+        else:
+            slot = len(self._data)
+            self._data.append(data)
+            self._next.append(self.NIL)
+        return slot
+
+    def _release(self, slot):
+        """
+        Returns a slot to the free list.
+
+        Preconditions: slot is not linked into the list.
+        Input: slot, the slot number to be freed.
+        Postconditions: The slot's data reference is dropped and the slot heads the free list.
+        """
+        self._data[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _slot_at(self, index):
+        """
+        Walks to the slot at a given position.
+
+        Preconditions: 0 <= index < size
+        Input: index, the position to walk to.
+        Output: The slot number (int) at that position.
+        """
+        if index == self.size - 1:
+            return self.tail
+        nxt = self._next
+        slot = self.head
+        for _ in range(index):
+            slot = nxt[slot]
+        return slot
+
+    def append(self, data):
+        """
+        Append a node to the end of the list.
+
+        Preconditions: True
+        Input: data, an object to be appended to the list.
+        Postconditions: The list has one additional node at the end containing the given data.
+        """
+        slot = self._allocate(data)
+        if self.head == self.NIL:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Appends every item of an iterable to the end of the list.
+
+        Preconditions: True
+        Input: iterable, any iterable of objects to be appended to the list.
+        Postconditions: The list has one additional node per item, in iteration order, at the end.
+        """
+        for data in iterable:
+            self.append(data)
+
+    def find_first(self, data):
+        """
+        Finds the first index of the given data. If none, raises ValueError.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: The index (int) of the node containing the data.
+        """
+        slot = self.head
+        position = 0
+        while slot != self.NIL:
+            if self._data[slot] == data:
+                return position
+            slot = self._next[slot]
+            position += 1
+        raise ValueError(f"{data} not found in the list.")
+
+    def find_last(self, data):
+        """
+        Finds the last index of the given data. If none, raises ValueError.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: The last index (int) of the node containing the data.
+        """
+        found = self.find_all(data)
+        return found[-1]
+
+    def find_all(self, data):
+        """
+        Finds every index for the given data, returning a list of indices.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: A list of integers representing indices where the data is found.
+        Postconditions: If the data is not found, raises ValueError.
+        """
+        slot = self.head
+        position = 0
+        index_found = []
+        while slot != self.NIL:
+            if self._data[slot] == data:
+                index_found.append(position)
+            slot = self._next[slot]
+            position += 1
+        if not index_found:
+            raise ValueError(f"{data} not found in the list.")
+        return index_found
+
+    def get_position(self, index: int):
+        """
+        Retrieves the data at the specified index in the list.
+
+        Preconditions: True
+        Input: index, an integer specifying the position in the list.
+        Output: The data object at the specified index.
+        Postconditions: Returns the data at the specified index if it exists, or raises IndexError.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        return self._data[self._slot_at(index)]
+
+    def from_array(self, array):
+        """
+        Converts an array into a linked list.
+
+        Preconditions: True
+        Input: array, a list of objects to be converted into a linked list.
+        Postconditions: The list represents the sequence of elements in the array.
+                        If the input is not a list, raises TypeError.
+        """
+        if not isinstance(array, list):
+            raise TypeError("Expected a list")
+        self.extend(array)
+
+    def from_dict(self, input_dict):
+        """
+        Creates a linked list from the key-value pairs of a given dictionary.
+
+        Preconditions: True
+        Input: input_dict, a dictionary whose key-value pairs will be used to create the linked list.
+        Postconditions: The list holds one (key, value) tuple per dictionary item.
+                        If the input is not a dictionary, raises TypeError.
+        """
+        if not isinstance(input_dict, dict):
+            raise TypeError("Expected a dictionary")
+        self.extend(input_dict.items())
+
+    def convert_str(self, string: str):
+        """
+        Converts a string into a linked list, where each node contains a character.
+
+        Preconditions: True
+        Input: string, a string to be converted into a linked list.
+        Postconditions: The list represents the sequence of characters in the string.
+                        If the input is not a string, raises TypeError.
+        """
+        if not isinstance(string, str):
+            raise TypeError("Expected a string")
+        self.extend(string)
+
+    def create_array(self):
+        """
+        Converts the linked list into an array.
+
+        Preconditions: True
+        Output: An array containing the data from the linked list nodes, in order.
+        """
+        return list(self)
+
+    def insert(self, index, data):
+        """
+        Inserts data at a specified index in the list.
+
+        Preconditions: True
+        Input:
+            - index, an integer specifying the position in the list where the data should be inserted.
+            - data, the object to be inserted in the list.
+        Postconditions: The data is inserted at the specified position, or an error is raised if the index is invalid.
+        """
+        if index < 0:
+            raise IndexError("Position < 0")
+        if index > self.size:
+            raise ValueError("Position > size of list")
+        if index == self.size:
+            self.append(data)
+            return
+        slot = self._allocate(data)
+        if index == 0:
+            self._next[slot] = self.head
+            self.head = slot
+        else:
+            previous = self._slot_at(index - 1)
+            self._next[slot] = self._next[previous]
+            self._next[previous] = slot
+        self.size += 1
+
+    def insert_after(self, data, new_data):
+        """
+        Inserts new data immediately after the first occurrence of specified data in the list.
+
+        Preconditions: True
+        Input:
+            - data, the object after which the new data should be inserted.
+            - new_data, the object to be inserted in the list.
+        Postconditions: The new data is inserted after the first occurrence of data, or nothing happens if it is absent.
+        """
+        slot = self.head
+        while slot != self.NIL:
+            if self._data[slot] == data:
+                new_slot = self._allocate(new_data)
+                self._next[new_slot] = self._next[slot]
+                self._next[slot] = new_slot
+                if slot == self.tail:
+                    self.tail = new_slot
+                self.size += 1
+                return
+            slot = self._next[slot]
+
+    def insert_array(self, index, array):
+        """
+        Inserts an array of data at a specified index in the list.
+
+        Preconditions: True
+        Input:
+            - index, an integer specifying the position in the list where the array should be inserted.
+            - array, a list of objects to be inserted into the list.
+        Postconditions: The data from the array is inserted at the specified position,
+                        or an error is raised if the index is invalid or input is not an array.
+        """
+        if not isinstance(array, list):
+            raise TypeError("Input is not an array")
+        if index < 0 or index > self.size:
+            raise ValueError("Index outside of list range")
+        if not array:
+            return
+        nxt = self._next
+        previous = self.NIL if index == 0 else self._slot_at(index - 1)
+        following = self.head if previous == self.NIL else nxt[previous]
+        first = last = self._allocate(array[0])
+        for data in array[1:]:
+            slot = self._allocate(data)
+            nxt[last] = slot
+            last = slot
+        nxt[last] = following
+        if previous == self.NIL:
+            self.head = first
+        else:
+            nxt[previous] = first
+        if following == self.NIL:
+            self.tail = last
+        self.size += len(array)
+
+    def delete_item(self, index):
+        """
+        Deletes the item at the specified index from the list and frees its slot.
+
+        Preconditions: True
+        Input: index, an integer indicating the position of the item to be deleted.
+        Postconditions: The item at the specified index is removed from the list,
+                        or an error is raised if the index is invalid.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        nxt = self._next
+        if index == 0:
+            slot = self.head
+            self.head = nxt[slot]
+            if self.head == self.NIL:
+                self.tail = self.NIL
+        else:
+            previous = self._slot_at(index - 1)
+            slot = nxt[previous]
+            nxt[previous] = nxt[slot]
+            if slot == self.tail:
+                self.tail = previous
+        self._release(slot)
+        self.size -= 1
+
+    def replace_position(self, index: int, data):
+        """
+        Replaces the data at a specified position in the list.
+
+        Preconditions: True
+        Input:
+            - index, an integer specifying the position in the list.
+            - data, the new data to be placed at the specified position.
+        Postconditions: The data at the specified position is replaced,
+                        or an error is raised if the index is invalid.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        self._data[self._slot_at(index)] = data
+
+    def replace_all(self, old, new):
+        """
+        Replaces all occurrences of a specified value with a new value in the list.
+
+        Preconditions: True
+        Input:
+            - old, the value to be replaced.
+            - new, the value to replace with.
+        Postconditions: All instances of 'old' in the list are replaced with 'new'.
+        """
+        slot = self.head
+        while slot != self.NIL:
+            if self._data[slot] == old:
+                self._data[slot] = new
+            slot = self._next[slot]
+
+    def clear_all(self, confirm=False):
+        """
+        Clears all elements from the list and releases the pool.
+
+        Preconditions: True
+        Input: confirm, a boolean indicating whether to proceed with clearing the list.
+        Postconditions: If confirm is True, the list and its pool are emptied; otherwise, nothing happens.
+        """
+        if confirm:
+            self._data = []
+            self._next = array("q")
+            self._free = self.NIL
+            self.head = self.NIL
+            self.tail = self.NIL
+            self.size = 0
+        else:
+            print("Clear operation cancelled. Set confirm=True to clear the list.")
+
+    def print(self):
+        """
+        Prints the elements of the linked list.
+
+        Preconditions: True
+        Output: Prints each element of the list followed by an arrow, ending with 'None'.
+        """
+        slot = self.head
+        while slot != self.NIL:
+            print(self._data[slot], end=" -> ")
+            slot = self._next[slot]
+        print("None")
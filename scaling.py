@@ -0,0 +1,500 @@
+import argparse
+import bisect
+import collections
+import gc
+import itertools
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from linked_hash import LinkedHash
+from linked_list import LinkedList
+from linked_stack import LinkedStack
+
+# Each case times one public operation against its built-in equivalent. A case is
+#   (structure, operation, build, run, baseline_build, baseline_run, make_args, kind)
+# where build(n) and baseline_build(n) create a structure of n elements, run(state, args) and
+# baseline_run(state, args) perform one operation per item of args, and make_args(n, count, rng) draws the
+# arguments. kind is "steady" when the operations leave the size unchanged, "grows" when each one adds
+# elements, or "fresh" when the operation consumes its structure, which is then rebuilt for every call.
+# print() and print_stack() only write to the console and are not timed.
+_FRESH_KEYS = itertools.count(-1, -1)
+
+
+def _linked_list(n: int) -> LinkedList:
+    linked_list = LinkedList()
+    linked_list.extend(range(n))
+    return linked_list
+
+
+def _linked_stack(n: int) -> LinkedStack:
+    stack = LinkedStack()
+    for data in range(n):
+        stack.push(data)
+    return stack
+
+
+def _linked_hash(n: int) -> LinkedHash:
+    return LinkedHash.from_mapping({key: key for key in range(n)})
+
+
+def _list(n: int) -> list:
+    return list(range(n))
+
+
+def _deque(n: int) -> collections.deque:
+    return collections.deque(range(n))
+
+
+def _shuffled_linked_list(n: int) -> LinkedList:
+    linked_list = LinkedList()
+    linked_list.extend(random.Random(n).sample(range(n), n))
+    return linked_list
+
+
+def _shuffled_list(n: int) -> list:
+    return random.Random(n).sample(range(n), n)
+
+
+def _sorted_halves(n: int) -> tuple:
+    left, right = LinkedList(), LinkedList()
+    left.extend(range(0, n, 2))
+    right.extend(range(1, n, 2))
+    return left, right
+
+
+def _sorted_list_halves(n: int) -> tuple:
+    return list(range(0, n, 2)), list(range(1, n, 2))
+
+
+def _dict(n: int) -> dict:
+    return {key: key for key in range(n)}
+
+
+def _record_hash(n: int) -> LinkedHash:
+    table = LinkedHash.from_mapping({key: (key % 50,) for key in range(n)})
+    table.create_index(0, "sorted")
+    return table
+
+
+def _record_dict(n: int) -> dict:
+    return {key: (key % 50,) for key in range(n)}
+
+
+def _positions(n, count, rng):
+    return [rng.randrange(n) for _ in range(count)]
+
+
+def _values(n, count, rng):
+    return [rng.randrange(n) for _ in range(count)]
+
+
+def _nothing(n, count, rng):
+    return [None] * count
+
+
+def _inputs(kind):
+    """
+    Makes an argument factory that passes the same bulk input of size n to every call.
+    """
+    def make_args(n, count, rng):
+        data = {"array": list(range(n)), "dict": {key: key for key in range(n)}, "str": "x" * n}[kind]
+        return [data] * count
+    return make_args
+
+
+def _small_lists(n, count, rng):
+    lists = []
+    for _ in range(count):
+        linked_list = LinkedList()
+        linked_list.extend(_SMALL_ARRAY)
+        lists.append(linked_list)
+    return lists
+
+
+def _splice_args(n, count, rng):
+    return [(rng.randrange(n), linked_list) for linked_list in _small_lists(n, count, rng)]
+
+
+def _range_starts(n, count, rng):
+    return [rng.randrange(max(1, n - 10)) for _ in range(count)]
+
+
+def _fresh_keys(n, count, rng):
+    return [next(_FRESH_KEYS) for _ in range(count)]
+
+
+def _each(call):
+    """
+    Makes a run function applying call(state, arg) to every argument.
+    """
+    def run(state, args):
+        for arg in args:
+            call(state, arg)
+    return run
+
+
+def _delete_refill(state, index):
+    state.delete_item(index)
+    state.append(index)
+
+
+def _list_delete_refill(state, index):
+    del state[index]
+    state.append(index)
+
+
+def _linked_list_replace_all(state, value):
+    state.replace_all(value, value)
+
+
+def _list_replace_all(state, value):
+    for i, data in enumerate(state):
+        if data == value:
+            state[i] = value
+
+
+def _find_last(state, value):
+    return len(state) - 1 - state[::-1].index(value)
+
+
+def _insert_after(state, value):
+    state.insert(state.index(value) + 1, value)
+
+
+def _list_insert_array(state, index):
+    state[index:index] = _SMALL_ARRAY
+
+
+def _split_rejoin(state, index):
+    state.concat(state.split_at(index))
+
+
+def _list_split_rejoin(state, index):
+    rest = state[index:]
+    del state[index:]
+    state.extend(rest)
+
+
+def _delete_range_refill(state, start):
+    state.delete_range(start, min(start + 10, state.size))
+    state.extend(_SMALL_ARRAY)
+
+
+def _list_delete_range_refill(state, start):
+    del state[start:start + 10]
+    state.extend(_SMALL_ARRAY)
+
+
+def _merge_halves(state, arg):
+    state[0].merge(state[1])
+
+
+def _hash_remove_refill(state, key):
+    state.remove(key)
+    state.associate(key, key)
+
+
+def _hash_pop_refill(state, key):
+    state.associate(key, state.pop(key))
+
+
+def _dict_remove_refill(state, key):
+    del state[key]
+    state[key] = key
+
+
+def _dict_pop_refill(state, key):
+    state[key] = state.pop(key)
+
+
+def _consume(iterable):
+    for _ in iterable:
+        pass
+
+
+_SMALL_ARRAY = list(range(10))
+
+CASES = [
+    ("LinkedList", "append", _linked_list, _each(LinkedList.append),
+     _list, _each(list.append), _values, "grows"),
+    ("LinkedList", "extend", _linked_list, _each(lambda s, a: s.extend(_SMALL_ARRAY)),
+     _list, _each(lambda s, a: s.extend(_SMALL_ARRAY)), _nothing, "grows"),
+    ("LinkedList", "__iter__", _linked_list, _each(lambda s, a: _consume(s)),
+     _list, _each(lambda s, a: _consume(s)), _nothing, "steady"),
+    ("LinkedList", "__len__", _linked_list, _each(lambda s, a: len(s)),
+     _list, _each(lambda s, a: len(s)), _nothing, "steady"),
+    ("LinkedList", "__contains__", _linked_list, _each(lambda s, a: a in s),
+     _list, _each(lambda s, a: a in s), _values, "steady"),
+    ("LinkedList", "cursor", _linked_list, _each(LinkedList.cursor),
+     _list, _each(lambda s, a: iter(s[a:a + 1])), _positions, "steady"),
+    ("LinkedList", "find_first", _linked_list, _each(LinkedList.find_first),
+     _list, _each(list.index), _values, "steady"),
+    ("LinkedList", "find_last", _linked_list, _each(LinkedList.find_last),
+     _list, _each(_find_last), _values, "steady"),
+    ("LinkedList", "find_all", _linked_list, _each(LinkedList.find_all),
+     _list, _each(lambda s, a: [i for i, data in enumerate(s) if data == a]), _values, "steady"),
+    ("LinkedList", "get_position", _linked_list, _each(LinkedList.get_position),
+     _list, _each(list.__getitem__), _positions, "steady"),
+    ("LinkedList", "from_array", lambda n: None, _each(lambda s, a: LinkedList().from_array(a)),
+     lambda n: None, _each(lambda s, a: list(a)), _inputs("array"), "steady"),
+    ("LinkedList", "from_dict", lambda n: None, _each(lambda s, a: LinkedList().from_dict(a)),
+     lambda n: None, _each(lambda s, a: list(a.items())), _inputs("dict"), "steady"),
+    ("LinkedList", "convert_str", lambda n: None, _each(lambda s, a: LinkedList().convert_str(a)),
+     lambda n: None, _each(lambda s, a: list(a)), _inputs("str"), "steady"),
+    ("LinkedList", "create_array", _linked_list, _each(lambda s, a: s.create_array()),
+     _list, _each(lambda s, a: s.copy()), _nothing, "steady"),
+    ("LinkedList", "map", _linked_list, _each(lambda s, a: _consume(s.map(abs))),
+     _list, _each(lambda s, a: _consume(map(abs, s))), _nothing, "steady"),
+    ("LinkedList", "filter", _linked_list, _each(lambda s, a: _consume(s.filter(bool))),
+     _list, _each(lambda s, a: _consume(filter(bool, s))), _nothing, "steady"),
+    ("LinkedList", "take", _linked_list, _each(lambda s, a: _consume(s.take(10))),
+     _list, _each(lambda s, a: _consume(s[:10])), _nothing, "steady"),
+    ("LinkedList", "chunks", _linked_list, _each(lambda s, a: _consume(s.chunks(64))),
+     _list, _each(lambda s, a: _consume(s[i:i + 64] for i in range(0, len(s), 64))), _nothing, "steady"),
+    ("LinkedList", "insert", _linked_list, _each(lambda s, a: s.insert(a, a)),
+     _list, _each(lambda s, a: s.insert(a, a)), _positions, "grows"),
+    ("LinkedList", "insert_after", _linked_list, _each(lambda s, a: s.insert_after(a, a)),
+     _list, _each(_insert_after), _values, "grows"),
+    ("LinkedList", "insert_array", _linked_list, _each(lambda s, a: s.insert_array(a, _SMALL_ARRAY)),
+     _list, _each(_list_insert_array), _positions, "grows"),
+    ("LinkedList", "delete_item+append", _linked_list, _each(_delete_refill),
+     _list, _each(_list_delete_refill), _positions, "steady"),
+    ("LinkedList", "replace_position", _linked_list, _each(lambda s, a: s.replace_position(a, a)),
+     _list, _each(lambda s, a: s.__setitem__(a, a)), _positions, "steady"),
+    ("LinkedList", "replace_all", _linked_list, _each(_linked_list_replace_all),
+     _list, _each(_list_replace_all), _values, "steady"),
+    ("LinkedList", "sort", _shuffled_linked_list, _each(lambda s, a: s.sort()),
+     _shuffled_list, _each(lambda s, a: s.sort()), _nothing, "fresh"),
+    ("LinkedList", "merge", _sorted_halves, _each(_merge_halves),
+     _sorted_list_halves, _each(lambda s, a: sorted(s[0] + s[1])), _nothing, "fresh"),
+    ("LinkedList", "insert_sorted", _linked_list, _each(LinkedList.insert_sorted),
+     _list, _each(bisect.insort), _values, "grows"),
+    ("LinkedList", "concat", _linked_list, _each(LinkedList.concat),
+     _list, _each(lambda s, a: s.extend(_SMALL_ARRAY)), _small_lists, "grows"),
+    ("LinkedList", "splice", _linked_list, _each(lambda s, a: s.splice(*a)),
+     _list, _each(lambda s, a: s.__setitem__(slice(a[0], a[0]), _SMALL_ARRAY)), _splice_args, "grows"),
+    ("LinkedList", "split_at+concat", _linked_list, _each(_split_rejoin),
+     _list, _each(_list_split_rejoin), _positions, "steady"),
+    ("LinkedList", "delete_range+extend", _linked_list, _each(_delete_range_refill),
+     _list, _each(_list_delete_range_refill), _range_starts, "steady"),
+    ("LinkedList", "clear_all", _linked_list, _each(lambda s, a: s.clear_all(confirm=True)),
+     _list, _each(lambda s, a: s.clear()), _nothing, "fresh"),
+    ("LinkedStack", "push", _linked_stack, _each(LinkedStack.push),
+     _deque, _each(collections.deque.append), _values, "grows"),
+    ("LinkedStack", "pop+push", _linked_stack, _each(lambda s, a: s.push(s.pop())),
+     _deque, _each(lambda s, a: s.append(s.pop())), _nothing, "steady"),
+    ("LinkedStack", "peek", _linked_stack, _each(lambda s, a: s.peek()),
+     _deque, _each(lambda s, a: s[-1]), _nothing, "steady"),
+    ("LinkedStack", "is_empty", _linked_stack, _each(lambda s, a: s.is_empty()),
+     _deque, _each(lambda s, a: not s), _nothing, "steady"),
+    ("LinkedStack", "size", _linked_stack, _each(lambda s, a: s.size()),
+     _deque, _each(lambda s, a: len(s)), _nothing, "steady"),
+    ("LinkedStack", "__len__", _linked_stack, _each(lambda s, a: len(s)),
+     _deque, _each(lambda s, a: len(s)), _nothing, "steady"),
+    ("LinkedStack", "__iter__", _linked_stack, _each(lambda s, a: _consume(s)),
+     _deque, _each(lambda s, a: _consume(reversed(s))), _nothing, "steady"),
+    ("LinkedHash", "associate", _linked_hash, _each(lambda s, a: s.associate(a, a)),
+     _dict, _each(lambda s, a: s.__setitem__(a, a)), _fresh_keys, "grows"),
+    ("LinkedHash", "associate-overwrite", _linked_hash, _each(lambda s, a: s.associate(a, a)),
+     _dict, _each(lambda s, a: s.__setitem__(a, a)), _values, "steady"),
+    ("LinkedHash", "update_many", _linked_hash, _each(lambda s, a: s.update_many([(a, a)] * 10)),
+     _dict, _each(lambda s, a: s.update([(a, a)] * 10)), _fresh_keys, "grows"),
+    ("LinkedHash", "reserve", _linked_hash, _each(lambda s, a: s.reserve(4 * len(s))),
+     _dict, None, _nothing, "fresh"),
+    ("LinkedHash", "get", _linked_hash, _each(LinkedHash.get),
+     _dict, _each(dict.__getitem__), _values, "steady"),
+    ("LinkedHash", "has", _linked_hash, _each(LinkedHash.has),
+     _dict, _each(dict.__contains__), _values, "steady"),
+    ("LinkedHash", "__contains__", _linked_hash, _each(lambda s, a: a in s),
+     _dict, _each(lambda s, a: a in s), _values, "steady"),
+    ("LinkedHash", "__len__", _linked_hash, _each(lambda s, a: len(s)),
+     _dict, _each(lambda s, a: len(s)), _nothing, "steady"),
+    ("LinkedHash", "__iter__", _linked_hash, _each(lambda s, a: _consume(s)),
+     _dict, _each(lambda s, a: _consume(s.items())), _nothing, "steady"),
+    ("LinkedHash", "remove+associate", _linked_hash, _each(_hash_remove_refill),
+     _dict, _each(_dict_remove_refill), _values, "steady"),
+    ("LinkedHash", "pop+associate", _linked_hash, _each(_hash_pop_refill),
+     _dict, _each(_dict_pop_refill), _values, "steady"),
+    ("LinkedHash", "change_size", _linked_hash, _each(lambda s, a: s.change_size()),
+     _dict, None, _nothing, "steady"),
+    ("LinkedHash", "from_mapping", lambda n: None, _each(lambda s, a: LinkedHash.from_mapping(a)),
+     lambda n: None, _each(lambda s, a: dict(a)), _inputs("dict"), "steady"),
+    ("LinkedHash", "create_index", _record_hash, _each(lambda s, a: s.create_index(0, "sorted")),
+     _record_dict, _each(lambda s, a: sorted(s, key=s.__getitem__)), _nothing, "steady"),
+    ("LinkedHash", "find_equal", _record_hash, _each(lambda s, a: s.find_equal(0, a % 50)),
+     _record_dict, _each(lambda s, a: [key for key, value in s.items() if value[0] == a % 50]), _values, "steady"),
+    ("LinkedHash", "find_range", _record_hash, _each(lambda s, a: s.find_range(0, a % 50, a % 50 + 1)),
+     _record_dict, _each(lambda s, a: [key for key, value in s.items() if a % 50 <= value[0] <= a % 50 + 1]),
+     _values, "steady"),
+    ("LinkedHash", "drop_index", _record_hash, _each(lambda s, a: s.drop_index(0)),
+     _record_dict, None, _nothing, "fresh"),
+]
+
+
+def measure(build, run, make_args, kind: str, n: int, budget: float, rng) -> float:
+    """
+    Times one operation on a structure of n elements.
+
+    Preconditions: n > 0 and budget > 0
+    Input:
+        - build, run, make_args and kind, as described for CASES.
+        - n, the size of the structure.
+        - budget, the total time, in seconds, to spend running the operation.
+        - rng, a random.Random drawing the arguments.
+    Output: The mean cost of one operation in nanoseconds. Batches of doubling size run until budget is spent.
+            A growing structure is rebuilt (untimed) once it has gained n // 30 elements, so that it stays
+            within a few percent of size n; a fresh one is rebuilt before every call.
+    """
+    cap = 1 if kind == "fresh" else max(1, n // 30) if kind == "grows" else 1 << 20
+    state = build(n)
+    grown = 0
+    count = 1
+    total = 0.0
+    operations = 0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while total < budget:
+            if kind != "steady" and grown + count > cap:
+                state = build(n)
+                grown = 0
+            args = make_args(n, count, rng)
+            start = time.perf_counter()
+            run(state, args)
+            total += time.perf_counter() - start
+            operations += count
+            grown += count
+            count = min(count * 2, cap)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return total * 1e9 / operations
+
+
+def fit_exponent(sizes: list, costs: list) -> float:
+    """
+    Fits cost = c * n**k to measurements by least squares on a log-log scale.
+
+    Preconditions: len(sizes) == len(costs) >= 2 and every value is positive.
+    Output: The exponent k: about 0 for a constant-time operation, 1 for linear and 2 for quadratic.
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(cost, 1e-3)) for cost in costs]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def complexity(exponent: float) -> str:
+    """
+    Names the complexity class nearest to a fitted exponent, e.g. "O(n)", or "O(n^1.4)" between classes.
+    """
+    if exponent < 0.3:
+        return "O(1)"
+    for k, name in ((1, "O(n)"), (2, "O(n^2)")):
+        if abs(exponent - k) < 0.3:
+            return name
+    return f"O(n^{exponent:.1f})"
+
+
+def run_suite(min_exp: int, max_exp: int, structures: list, budget: float = 0.05) -> dict:
+    """
+    Times every case for the chosen structures at sizes 10**min_exp .. 10**max_exp and fits their scaling.
+
+    Preconditions: 1 <= min_exp < max_exp
+    Output: A results dictionary with "meta", "results" (one entry per case and size) and "fits" (one entry
+            per case), ready to be written as JSON. Progress is printed as each case finishes.
+    """
+    sizes = [10 ** exp for exp in range(min_exp, max_exp + 1)]
+    rng = random.Random(0)
+    results = []
+    fits = []
+    print(f"{'operation':<34} {'ours':>8} {'built-in':>9} {'per op':>8} {'flag'}")
+    for structure, operation, build, run, baseline_build, baseline_run, make_args, kind in CASES:
+        if structure not in structures:
+            continue
+        ours = [measure(build, run, make_args, kind, n, budget, rng) for n in sizes]
+        theirs = [measure(baseline_build, baseline_run, make_args, kind, n, budget, rng) if baseline_run else None
+                  for n in sizes]
+        for n, cost, baseline in zip(sizes, ours, theirs):
+            results.append({"structure": structure, "operation": operation, "n": n,
+                            "ns_per_op": cost, "baseline_ns_per_op": baseline})
+        exponent = fit_exponent(sizes, ours)
+        baseline_exponent = fit_exponent(sizes, theirs) if baseline_run else None
+        flag = ""
+        if baseline_exponent is not None and exponent - baseline_exponent >= 0.5:
+            flag = "scales worse than built-in"
+        fits.append({"structure": structure, "operation": operation, "exponent": exponent,
+                     "complexity": complexity(exponent), "baseline_exponent": baseline_exponent,
+                     "baseline_complexity": complexity(baseline_exponent) if baseline_run else None,
+                     "flag": flag})
+        baseline_name = complexity(baseline_exponent) if baseline_run else "-"
+        print(f"{structure + '.' + operation:<34} {complexity(exponent):>8} {baseline_name:>9} "
+              f"{ours[-1]:>6.0f}ns {flag}")
+    return {
+        "meta": {"python": sys.version.split()[0], "platform": platform.platform(),
+                 "sizes": sizes, "budget": budget},
+        "results": results,
+        "fits": fits,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Finds regressions between two result sets written by run_suite.
+
+    Preconditions: tolerance >= 1
+    Input:
+        - current, the new results.
+        - baseline, the results to compare against.
+        - tolerance, the largest acceptable ratio of new to old cost for one case and size.
+    Output: A list of messages, one per case and size that got slower by more than tolerance and one per case
+            whose fitted exponent rose by 0.5 or more. Cases missing from either set are ignored.
+    """
+    regressions = []
+    old_costs = {(row["structure"], row["operation"], row["n"]): row["ns_per_op"] for row in baseline["results"]}
+    for row in current["results"]:
+        old = old_costs.get((row["structure"], row["operation"], row["n"]))
+        if old is not None and row["ns_per_op"] > old * tolerance:
+            regressions.append(f"{row['structure']}.{row['operation']} at n={row['n']}: "
+                               f"{old:.0f} ns -> {row['ns_per_op']:.0f} ns")
+    old_fits = {(fit["structure"], fit["operation"]): fit for fit in baseline["fits"]}
+    for fit in current["fits"]:
+        old = old_fits.get((fit["structure"], fit["operation"]))
+        if old is not None and fit["exponent"] - old["exponent"] >= 0.5:
+            regressions.append(f"{fit['structure']}.{fit['operation']}: scaling went from "
+                               f"{old['complexity']} to {fit['complexity']}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time every public operation of LinkedList, LinkedStack and LinkedHash against list, "
+                    "deque and dict, and fit how each one scales.")
+    parser.add_argument("--min-exp", type=int, default=2, help="smallest size, as a power of ten")
+    parser.add_argument("--max-exp", type=int, default=6, help="largest size, as a power of ten")
+    parser.add_argument("--structure", action="append", choices=["LinkedList", "LinkedStack", "LinkedHash"],
+                        help="only time this structure (repeatable)")
+    parser.add_argument("--budget", type=float, default=0.05,
+                        help="time spent on each operation at each size, in seconds")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results from an earlier --output run")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="slowdown ratio against --baseline that counts as a regression")
+    args = parser.parse_args()
+    report = run_suite(args.min_exp, args.max_exp,
+                       args.structure or ["LinkedList", "LinkedStack", "LinkedHash"], args.budget)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=1)
+    if args.baseline:
+        with open(args.baseline) as file:
+            found = compare(report, json.load(file), args.tolerance)
+        for message in found:
+            print(f"REGRESSION {message}")
+        sys.exit(1 if found else 0)
@@ -0,0 +1,249 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from linked_hash import LinkedHash
+
+_MISSING = object()
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+_FIBONACCI = 0x9E3779B97F4A7C15
+
+# Shards owned by this process when it runs as a ShardedHash worker, keyed by shard index.
+_WORKER_SHARDS = {}
+
+
+def _shard_update(index: int, pairs: list) -> int:
+    """
+    Loads pairs into a shard held by the current worker process.
+
+    Preconditions: Runs in a ShardedHash worker process.
+    Output: The number of entries in the shard afterwards.
+    """
+    shard = _WORKER_SHARDS.get(index)
+    if shard is None:
+        shard = _WORKER_SHARDS[index] = LinkedHash()
+    shard.update_many(pairs)
+    return shard.total_elements
+
+
+def _shard_get_many(index: int, keys: list, has_default: bool, default: object) -> list:
+    """
+    Looks up a batch of keys in a shard held by the current worker process.
+
+    Preconditions: Runs in a ShardedHash worker process.
+    Output: The values of the keys, in order. A missing key gives default, or raises KeyError if has_default is False.
+    """
+    return _get_many(_WORKER_SHARDS.setdefault(index, LinkedHash()), keys, has_default, default)
+
+
+def _shard_call(index: int, method: str, args: tuple):
+    """
+    Calls a LinkedHash method on a shard held by the current worker process.
+
+    Preconditions: Runs in a ShardedHash worker process.
+    Output: The result of the method; iterating methods are returned as a list.
+    """
+    result = getattr(_WORKER_SHARDS.setdefault(index, LinkedHash()), method)(*args)
+    return list(result) if method == "__iter__" else result
+
+
+def _get_many(shard: LinkedHash, keys: list, has_default: bool, default: object) -> list:
+    """
+    Looks up a batch of keys in one shard.
+
+    Output: The values of the keys, in order. A missing key gives default, or raises KeyError if has_default is False.
+    """
+    if has_default:
+        values = []
+        for key in keys:
+            try:
+                values.append(shard.get(key))
+            except KeyError:
+                values.append(default)
+        return values
+    return [shard.get(key) for key in keys]
+
+
+class ShardedHash:
+    """
+    A hash map partitioned by key hash into several LinkedHash shards, optionally held by worker processes.
+
+    With workers=0 the shards live in this process. With workers > 0 each shard lives in one of that many
+    resident worker processes (shard i in worker i % workers), so bulk builds and batched lookups run on
+    several cores at once: build and get_many split their input by shard and send each worker its batches.
+    Single-key operations are forwarded to the owning worker, which costs a round trip each.
+
+    Attributes:
+        shard_count (int): The number of shards.
+        workers (int): The number of worker processes, or 0 if the shards are held in this process.
+    """
+
+    def __init__(self, shards: int = 8, workers: int = 0):
+        """
+        Initialise a new, empty ShardedHash.
+
+        Preconditions: shards > 0 and workers >= 0
+        Input:
+            - shards, the number of LinkedHash shards to partition keys into.
+            - workers, the number of worker processes to hold the shards, or 0 to hold them in this process.
+        Postconditions: An empty map is created. With workers > 0, the worker processes are started by the first
+                        operation that reaches them and run until close() is called.
+        """
+        if shards <= 0:
+            raise ValueError("Shard count must be positive")
+        if workers < 0:
+            raise ValueError("Worker count cannot be negative")
+        self.shard_count = shards
+        self.workers = workers
+        self._local = [LinkedHash() for _ in range(shards)] if workers == 0 else None
+        self._executors = [ProcessPoolExecutor(max_workers=1) for _ in range(workers)]
+
+    @classmethod
+    def build(cls, pairs, workers: int = 0, shards: int = None):
+        """
+        Creates a ShardedHash from key-value pairs, building the shards in parallel worker processes.
+
+        Preconditions: Every key is hashable and picklable.
+        Input:
+            - pairs, an iterable of (key, value) pairs.
+            - workers, the number of worker processes, or 0 to build in this process.
+            - shards, the number of shards; defaults to 8, or to workers if that is larger.
+        Output: A new ShardedHash holding every pair, later pairs overwriting earlier ones with the same key.
+        """
+        table = cls(shards=shards or max(8, workers), workers=workers)
+        table.update_many(pairs)
+        return table
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops the worker processes. Their shards are discarded.
+
+        Preconditions: True
+        Postconditions: No worker processes remain. The map must not be used afterwards if it had workers.
+        """
+        for executor in self._executors:
+            executor.shutdown()
+        self._executors = []
+
+    def _shard_of(self, key_hash: int) -> int:
+        """
+        Picks the shard for a hash from its high bits, so that the low bits used by each shard's own bucket
+        indexing stay evenly spread within the shard.
+        """
+        return (((key_hash * _FIBONACCI) & _MASK_64) >> 32) % self.shard_count
+
+    def _partition(self, keys) -> list:
+        """
+        Splits items by shard.
+
+        Input: keys, an iterable of (key, item) pairs.
+        Output: A list with one list of items per shard.
+        """
+        batches = [[] for _ in range(self.shard_count)]
+        shard_of = self._shard_of
+        for key, item in keys:
+            batches[shard_of(hash(key))].append(item)
+        return batches
+
+    def _call(self, index: int, method: str, *args):
+        """
+        Calls a LinkedHash method on one shard, wherever it is held.
+        """
+        if self._local is not None:
+            return getattr(self._local[index], method)(*args)
+        executor = self._executors[index % self.workers]
+        return executor.submit(_shard_call, index, method, args).result()
+
+    def update_many(self, pairs) -> None:
+        """
+        Associates every key-value pair of an iterable, loading all shards in parallel.
+
+        Preconditions: Every key is hashable, and picklable if the map has workers.
+        Input: pairs, an iterable of (key, value) pairs.
+        Postconditions: Each pair is associated as if by associate(), in order.
+        """
+        batches = self._partition((pair[0], pair) for pair in pairs)
+        if self._local is not None:
+            for shard, batch in zip(self._local, batches):
+                shard.update_many(batch)
+            return
+        futures = [self._executors[index % self.workers].submit(_shard_update, index, batch)
+                   for index, batch in enumerate(batches) if batch]
+        for future in futures:
+            future.result()
+
+    def get_many(self, keys, default: object = _MISSING) -> list:
+        """
+        Looks up a batch of keys, fanning the lookups out to every shard at once.
+
+        Preconditions: Every key is hashable, and picklable if the map has workers.
+        Input:
+            - keys, an iterable of keys.
+            - default, the value to return for missing keys; if omitted, a missing key raises KeyError.
+        Output: A list of the values of the keys, in the order the keys were given.
+        """
+        keys = list(keys)
+        has_default = default is not _MISSING
+        positions = self._partition((key, position) for position, key in enumerate(keys))
+        batches = [[keys[position] for position in batch] for batch in positions]
+        if self._local is not None:
+            results = [_get_many(shard, batch, has_default, default) for shard, batch in zip(self._local, batches)]
+        else:
+            futures = [self._executors[index % self.workers].submit(_shard_get_many, index, batch, has_default, default)
+                       if batch else None for index, batch in enumerate(batches)]
+            results = [future.result() if future is not None else [] for future in futures]
+        values = [None] * len(keys)
+        for batch, batch_values in zip(positions, results):
+            for position, value in zip(batch, batch_values):
+                values[position] = value
+        return values
+
+    def associate(self, key: object, value: object) -> None:
+        """
+        Associate a key with a value in its shard.
+
+        Preconditions: key is hashable
+        Postconditions: The key-value pair is added, replacing the old value if the key already exists.
+        """
+        self._call(self._shard_of(hash(key)), "associate", key, value)
+
+    def get(self, key: object) -> object:
+        """
+        Retrieves the value associated with a given key. If the key is absent, raises KeyError.
+        """
+        return self._call(self._shard_of(hash(key)), "get", key)
+
+    def has(self, key: object) -> bool:
+        """
+        Checks if a key is present in its shard.
+        """
+        return self._call(self._shard_of(hash(key)), "has", key)
+
+    def remove(self, key: object) -> None:
+        """
+        Removes a key and its value. If the key is absent, raises KeyError.
+        """
+        self._call(self._shard_of(hash(key)), "remove", key)
+
+    def __contains__(self, key):
+        return self.has(key)
+
+    def __len__(self):
+        """
+        Returns the number of key-value pairs across all shards.
+        """
+        return sum(self._call(index, "__len__") for index in range(self.shard_count))
+
+    def __iter__(self):
+        """
+        Iterates over the (key, value) pairs of every shard, one shard at a time.
+        """
+        for index in range(self.shard_count):
+            if self._local is not None:
+                yield from self._local[index]
+            else:
+                yield from self._call(index, "__iter__")
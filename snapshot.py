@@ -0,0 +1,322 @@
+import io
+import mmap
+import pickle
+import struct
+import sys
+import zlib
+from array import array
+
+from linked_hash import LinkedHash
+from linked_list import LinkedList
+
+# File layout, all integers little-endian:
+#   header   magic, kind, record count, offset of the record index, hash slot count (0 for lists)
+#   records  per record: key length (u32), value length (u32), pickled key (without the memo), pickled value
+#   index    one u64 file offset per record, in order
+#   slots    hash snapshots only: an open-addressing table of u64 record numbers + 1 (0 = empty slot),
+#            probed linearly from crc32(pickled key), so a key is found without decoding any other record
+_MAGIC = b"LLSNAP02"
+_HEADER = struct.Struct("<8sB7xQQQ")
+_RECORD = struct.Struct("<II")
+_KIND_LIST = 0
+_KIND_HASH = 1
+_MISSING = object()
+
+
+def _encode(obj: object) -> bytes:
+    return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _encode_key(key: object) -> bytes:
+    """
+    Pickles a key without the memo, which would otherwise encode equal keys differently depending on
+    whether their parts are the same object, e.g. a tuple holding one string twice.
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(key)
+    return buffer.getvalue()
+
+
+def _u64_array(values) -> array:
+    """
+    Packs integers into a little-endian array of unsigned 64-bit integers.
+    """
+    packed = array("Q", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed
+
+
+def dump(structure, path: str) -> None:
+    """
+    Writes a snapshot of a list or hash structure to a binary file.
+
+    Preconditions: Every element, key and value is picklable. For hash structures, equal keys pickle to the
+                   same bytes, as str, bytes, int and tuples of them do.
+    Input:
+        - structure, a LinkedHash or dict (or anything with associate() that iterates as (key, value) pairs),
+          which is written as a hash snapshot; any other iterable, such as a LinkedList, is written as a list.
+        - path, the file to write.
+    Postconditions: The file holds every element (or pair) in iteration order, readable with load().
+    """
+    if isinstance(structure, dict):
+        kind, records = _KIND_HASH, structure.items()
+    elif hasattr(structure, "associate"):
+        kind, records = _KIND_HASH, structure
+    else:
+        kind, records = _KIND_LIST, ((None, data) for data in structure)
+    offsets = []
+    slot_hashes = []
+    with open(path, "wb") as file:
+        file.write(bytes(_HEADER.size))
+        position = _HEADER.size
+        for key, value in records:
+            key_bytes = _encode_key(key) if kind == _KIND_HASH else b""
+            value_bytes = _encode(value)
+            offsets.append(position)
+            if kind == _KIND_HASH:
+                slot_hashes.append(zlib.crc32(key_bytes))
+            file.write(_RECORD.pack(len(key_bytes), len(value_bytes)))
+            file.write(key_bytes)
+            file.write(value_bytes)
+            position += _RECORD.size + len(key_bytes) + len(value_bytes)
+        index_offset = position
+        _u64_array(offsets).tofile(file)
+        capacity = 0
+        if kind == _KIND_HASH:
+            capacity = 8
+            while capacity < 2 * len(offsets):
+                capacity *= 2
+            mask = capacity - 1
+            slots = [0] * capacity
+            for number, key_crc in enumerate(slot_hashes):
+                slot = key_crc & mask
+                while slots[slot]:
+                    slot = (slot + 1) & mask
+                slots[slot] = number + 1
+            _u64_array(slots).tofile(file)
+        file.seek(0)
+        file.write(_HEADER.pack(_MAGIC, kind, len(offsets), index_offset, capacity))
+
+
+def load(path: str):
+    """
+    Opens a snapshot written by dump() without decoding it.
+
+    Preconditions: path was written by dump().
+    Input: path, the snapshot file.
+    Output: A SnapshotList or SnapshotHash over the memory-mapped file. Records are decoded only when accessed,
+            so opening costs the same regardless of the snapshot's size.
+    Postconditions: If the file is not a snapshot, raises ValueError.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(buffer) < _HEADER.size:
+        buffer.close()
+        raise ValueError(f"{path} is not a snapshot file")
+    magic, kind, count, index_offset, capacity = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC:
+        buffer.close()
+        raise ValueError(f"{path} is not a snapshot file")
+    if kind == _KIND_HASH:
+        return SnapshotHash(buffer, count, index_offset, capacity)
+    return SnapshotList(buffer, count, index_offset)
+
+
+class SnapshotList:
+    """
+    A read-only, lazily decoded view of a list snapshot.
+
+    Attributes:
+        size (int): The number of elements in the snapshot.
+    """
+
+    def __init__(self, buffer, count: int, index_offset: int):
+        """
+        Initialise a view over a memory-mapped snapshot. Use load() rather than calling this directly.
+
+        Preconditions: buffer holds a snapshot with count records whose index starts at index_offset.
+        Postconditions: The view is open; no record has been decoded.
+        """
+        self._buffer = buffer
+        self.size = count
+        self._offsets = self._u64_view(index_offset, count)
+
+    def _u64_view(self, offset: int, count: int):
+        """
+        Returns the count u64 values stored at offset, without copying them where the byte order allows.
+        """
+        view = memoryview(self._buffer)[offset:offset + 8 * count]
+        if sys.byteorder == "little":
+            return view.cast("Q")
+        values = array("Q", view)
+        view.release()
+        values.byteswap()
+        return values
+
+    def _record(self, number: int):
+        """
+        Locates a record's key and value bytes.
+
+        Preconditions: 0 <= number < size
+        Output: A tuple (key_start, value_start, value_end) of offsets into the file.
+        """
+        offset = self._offsets[number]
+        key_length, value_length = _RECORD.unpack_from(self._buffer, offset)
+        key_start = offset + _RECORD.size
+        value_start = key_start + key_length
+        return key_start, value_start, value_start + value_length
+
+    def _value(self, number: int):
+        _, value_start, value_end = self._record(number)
+        return pickle.loads(self._buffer[value_start:value_end])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps the file. Values already decoded remain valid.
+        """
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._buffer.close()
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index: int):
+        return self.get_position(index)
+
+    def __iter__(self):
+        """
+        Iterates over the elements of the snapshot, decoding each one as it is reached.
+        """
+        for number in range(self.size):
+            yield self._value(number)
+
+    def get_position(self, index: int):
+        """
+        Decodes the element at the specified index.
+
+        Preconditions: True
+        Input: index, an integer specifying the position in the list.
+        Output: The element at the specified index, or raises IndexError.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        return self._value(index)
+
+    def create_array(self):
+        """
+        Decodes every element into an array.
+        """
+        return list(self)
+
+    def to_linked_list(self) -> LinkedList:
+        """
+        Decodes every element into a new LinkedList.
+        """
+        linked_list = LinkedList()
+        linked_list.extend(self)
+        return linked_list
+
+
+class SnapshotHash(SnapshotList):
+    """
+    A read-only, lazily decoded view of a hash snapshot, with key lookup through the on-disk slot table.
+
+    Attributes:
+        size (int): The number of key-value pairs in the snapshot.
+    """
+
+    def __init__(self, buffer, count: int, index_offset: int, capacity: int):
+        """
+        Initialise a view over a memory-mapped snapshot. Use load() rather than calling this directly.
+
+        Preconditions: buffer holds a hash snapshot as described at the top of this module.
+        Postconditions: The view is open; no record has been decoded.
+        """
+        super().__init__(buffer, count, index_offset)
+        self._slots = self._u64_view(index_offset + 8 * count, capacity)
+        self._mask = capacity - 1
+
+    def close(self) -> None:
+        if isinstance(self._slots, memoryview):
+            self._slots.release()
+        super().close()
+
+    def _find(self, key: object):
+        """
+        Finds the record holding a key, decoding nothing but the key bytes it compares.
+
+        Output: A tuple (value_start, value_end) of the record's value bytes, or None if the key is absent.
+        """
+        key_bytes = _encode_key(key)
+        buffer = self._buffer
+        slot = zlib.crc32(key_bytes) & self._mask
+        number = self._slots[slot]
+        while number:
+            key_start, value_start, value_end = self._record(number - 1)
+            if buffer[key_start:value_start] == key_bytes:
+                return value_start, value_end
+            slot = (slot + 1) & self._mask
+            number = self._slots[slot]
+        return None
+
+    def __iter__(self):
+        """
+        Iterates over the (key, value) pairs of the snapshot, decoding each one as it is reached.
+        """
+        buffer = self._buffer
+        for number in range(self.size):
+            key_start, value_start, value_end = self._record(number)
+            yield pickle.loads(buffer[key_start:value_start]), pickle.loads(buffer[value_start:value_end])
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def get(self, key: object, default: object = _MISSING) -> object:
+        """
+        Decodes the value stored for a key.
+
+        Preconditions: key pickles to the same bytes as the key that was dumped.
+        Input:
+            - key, the key whose value is to be returned.
+            - default, the value to return if the key is absent.
+        Output: The value for the key, or default. If the key is absent and no default is given, raises KeyError.
+        """
+        found = self._find(key)
+        if found is None:
+            if default is _MISSING:
+                raise KeyError(f"Key '{key}' not found in snapshot.")
+            return default
+        return pickle.loads(self._buffer[found[0]:found[1]])
+
+    def has(self, key: object) -> bool:
+        """
+        Checks if a key is present in the snapshot.
+        """
+        return self._find(key) is not None
+
+    def get_position(self, index: int):
+        """
+        Decodes the (key, value) pair at the specified position in dump order, or raises IndexError.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        key_start, value_start, value_end = self._record(index)
+        return pickle.loads(self._buffer[key_start:value_start]), pickle.loads(self._buffer[value_start:value_end])
+
+    def to_linked_hash(self) -> LinkedHash:
+        """
+        Decodes every pair into a new LinkedHash.
+        """
+        table = LinkedHash()
+        table.update_many(self)
+        return table
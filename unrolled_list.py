@@ -0,0 +1,472 @@
+class UnrolledLinkedList:
+    """
+    An unrolled linked list: a linked list of blocks, each holding up to block_size elements.
+
+    Positional operations skip whole blocks at a time, so with a block size near the square root of the
+    expected length they cost O(sqrt(n)) rather than O(n), and storage is one small array per block
+    instead of one object per element. Blocks split when they overflow and merge with (or borrow from)
+    their successor when they fall below half full.
+
+    Attributes:
+        head (Block): The first block in the list, or None if the list is empty.
+        tail (Block): The last block in the list, or None if the list is empty.
+        size (int): The number of elements in the list.
+        block_size (int): The maximum number of elements per block.
+    """
+
+    class Block:
+        """
+        A block of consecutive elements in an unrolled linked list.
+
+        Attributes:
+            items (list): The elements stored in the block, in order.
+            next (Block): The next block in the list, or None if this is the last block.
+        """
+
+        __slots__ = ("items", "next")
+
+        def __init__(self, items: list):
+            """
+            Initialise a new block holding the given elements.
+
+            Preconditions: True.
+            Input: items, the list of elements the block takes ownership of.
+            Postconditions: The block is created with the given items and no next block.
+            """
+            self.items = items
+            self.next = None
+
+    def __init__(self, block_size: int = 64):
+        """
+        Initialise a new, empty unrolled linked list.
+
+        Preconditions: block_size >= 2
+        Input: block_size, the maximum number of elements per block.
+        Postconditions: An empty list is created with no blocks and size 0.
+        """
+        if block_size < 2:
+            raise ValueError("Block size must be at least 2")
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def __iter__(self):
+        """
+        Iterates over the elements in the list, in order, without copying them.
+
+        Preconditions: The list is not modified while the iteration is in progress.
+        Output: A generator yielding every element in order.
+        """
+        block = self.head
+        while block is not None:
+            yield from block.items
+            block = block.next
+
+    def __len__(self):
+        """
+        Returns the number of elements in the list.
+        """
+        return self.size
+
+    def __contains__(self, data):
+        """
+        Checks whether any element of the list equals the given data.
+
+        Preconditions: True
+        Output: True if the data is found; otherwise, False.
+        """
+        block = self.head
+        while block is not None:
+            if data in block.items:
+                return True
+            block = block.next
+        return False
+
+    def _locate(self, index: int):
+        """
+        Finds the block holding a position.
+
+        Preconditions: 0 <= index < size
+        Input: index, the position to find.
+        Output: A tuple (previous, block, offset): the block holding the position, the block before it
+                (or None), and the position within the block.
+        """
+        previous = None
+        block = self.head
+        while index >= len(block.items):
+            index -= len(block.items)
+            previous = block
+            block = block.next
+        return previous, block, index
+
+    def _link_blocks(self, previous, first, last) -> None:
+        """
+        Links a chain of blocks in after another block, or at the front.
+
+        Preconditions: first..last is a chain of blocks not in the list.
+        Postconditions: The chain follows previous (or heads the list), and tail is updated.
+        """
+        if previous is None:
+            last.next = self.head
+            self.head = first
+        else:
+            last.next = previous.next
+            previous.next = first
+        if last.next is None:
+            self.tail = last
+
+    def _blocks_from(self, items: list, spread: bool = False):
+        """
+        Packs elements into a chain of blocks.
+
+        Preconditions: items is not empty.
+        Input:
+            - items, the elements to pack, in order.
+            - spread, whether to share the elements evenly over as few blocks as will hold them instead of
+              filling every block but the last. Spread blocks are all at least half full.
+        Output: A tuple (first, last) describing the chain.
+        """
+        count = -(-len(items) // self.block_size)
+        if not spread:
+            bounds = [min(number * self.block_size, len(items)) for number in range(count + 1)]
+        else:
+            bounds = [number * len(items) // count for number in range(count + 1)]
+        first = last = self.Block(items[:bounds[1]])
+        for number in range(1, count):
+            block = self.Block(items[bounds[number]:bounds[number + 1]])
+            last.next = block
+            last = block
+        return first, last
+
+    def _split(self, block) -> None:
+        """
+        Splits an overflowing block into two halves.
+
+        Preconditions: len(block.items) > block_size
+        Postconditions: The block keeps its first half and a new block holding the second half follows it.
+        """
+        middle = len(block.items) // 2
+        new_block = self.Block(block.items[middle:])
+        del block.items[middle:]
+        self._link_blocks(block, new_block, new_block)
+
+    def _rebalance(self, previous, block) -> None:
+        """
+        Restores the half-full invariant after a block has shrunk.
+
+        Preconditions: previous is the block before block, or None.
+        Postconditions: An empty block is unlinked. A block below half full is merged with its successor,
+                        or borrows elements from it if the two together would overflow.
+        """
+        if not block.items:
+            if previous is None:
+                self.head = block.next
+            else:
+                previous.next = block.next
+            if block is self.tail:
+                self.tail = previous
+            return
+        following = block.next
+        if len(block.items) >= self.block_size // 2 or following is None:
+            return
+        if len(block.items) + len(following.items) <= self.block_size:
+            block.items.extend(following.items)
+            block.next = following.next
+            if following is self.tail:
+                self.tail = block
+        else:
+            moved = (len(following.items) - len(block.items)) // 2
+            block.items.extend(following.items[:moved])
+            del following.items[:moved]
+
+    def append(self, data):
+        """
+        Append an element to the end of the list.
+
+        Preconditions: True
+        Input: data, an object to be appended to the list.
+        Postconditions: The list has one additional element at the end.
+        """
+        if self.tail is None or len(self.tail.items) >= self.block_size:
+            block = self.Block([data])
+            self._link_blocks(self.tail, block, block)
+        else:
+            self.tail.items.append(data)
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Appends every item of an iterable to the end of the list, a block at a time.
+
+        Preconditions: True
+        Input: iterable, any iterable of objects to be appended to the list.
+        Postconditions: The list has one additional element per item, in iteration order, at the end.
+        """
+        items = list(iterable)
+        if not items:
+            return
+        if self.tail is not None:
+            room = self.block_size - len(self.tail.items)
+            self.tail.items.extend(items[:room])
+            self.size += min(room, len(items))
+            items = items[room:]
+            if not items:
+                return
+        first, last = self._blocks_from(items)
+        self._link_blocks(self.tail, first, last)
+        self.size += len(items)
+
+    def find_first(self, data):
+        """
+        Finds the first index of the given data. If none, raises ValueError.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: The index (int) of the first element equal to the data.
+        """
+        position = 0
+        block = self.head
+        while block is not None:
+            if data in block.items:
+                return position + block.items.index(data)
+            position += len(block.items)
+            block = block.next
+        raise ValueError(f"{data} not found in the list.")
+
+    def find_last(self, data):
+        """
+        Finds the last index of the given data. If none, raises ValueError.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: The last index (int) of an element equal to the data.
+        """
+        return self.find_all(data)[-1]
+
+    def find_all(self, data):
+        """
+        Finds every index for the given data, returning a list of indices.
+
+        Preconditions: True
+        Input: data, the object to be located in the list.
+        Output: A list of integers representing indices where the data is found.
+        Postconditions: If the data is not found, raises ValueError.
+        """
+        index_found = [position for position, item in enumerate(self) if item == data]
+        if not index_found:
+            raise ValueError(f"{data} not found in the list.")
+        return index_found
+
+    def get_position(self, index: int):
+        """
+        Retrieves the data at the specified index in the list.
+
+        Preconditions: True
+        Input: index, an integer specifying the position in the list.
+        Output: The data object at the specified index.
+        Postconditions: Returns the data at the specified index if it exists, or raises IndexError.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        _, block, offset = self._locate(index)
+        return block.items[offset]
+
+    def from_array(self, array):
+        """
+        Converts an array into an unrolled linked list.
+
+        Preconditions: True
+        Input: array, a list of objects to be converted into a linked list.
+        Postconditions: The list represents the sequence of elements in the array.
+                        If the input is not a list, raises TypeError.
+        """
+        if not isinstance(array, list):
+            raise TypeError("Expected a list")
+        self.extend(array)
+
+    def from_dict(self, input_dict):
+        """
+        Creates an unrolled linked list from the key-value pairs of a given dictionary.
+
+        Preconditions: True
+        Input: input_dict, a dictionary whose key-value pairs will be used to create the linked list.
+        Postconditions: The list holds one (key, value) tuple per dictionary item.
+                        If the input is not a dictionary, raises TypeError.
+        """
+        if not isinstance(input_dict, dict):
+            raise TypeError("Expected a dictionary")
+        self.extend(input_dict.items())
+
+    def convert_str(self, string: str):
+        """
+        Converts a string into an unrolled linked list, where each element is a character.
+
+        Preconditions: True
+        Input: string, a string to be converted into a linked list.
+        Postconditions: The list represents the sequence of characters in the string.
+                        If the input is not a string, raises TypeError.
+        """
+        if not isinstance(string, str):
+            raise TypeError("Expected a string")
+        self.extend(string)
+
+    def create_array(self):
+        """
+        Converts the unrolled linked list into an array.
+
+        Preconditions: True
+        Output: An array containing the elements of the list, in order.
+        """
+        array = []
+        block = self.head
+        while block is not None:
+            array.extend(block.items)
+            block = block.next
+        return array
+
+    def insert(self, index, data):
+        """
+        Inserts data at a specified index in the list.
+
+        Preconditions: True
+        Input:
+            - index, an integer specifying the position in the list where the data should be inserted.
+            - data, the object to be inserted in the list.
+        Postconditions: The data is inserted at the specified position, or an error is raised if the index is invalid.
+        """
+        if index < 0:
+            raise IndexError("Position < 0")
+        if index > self.size:
+            raise ValueError("Position > size of list")
+        if index == self.size:
+            self.append(data)
+            return
+        _, block, offset = self._locate(index)
+        block.items.insert(offset, data)
+        if len(block.items) > self.block_size:
+            self._split(block)
+        self.size += 1
+
+    def insert_after(self, data, new_data):
+        """
+        Inserts new data immediately after the first occurrence of specified data in the list.
+
+        Preconditions: True
+        Input:
+            - data, the object after which the new data should be inserted.
+            - new_data, the object to be inserted in the list.
+        Postconditions: The new data is inserted after the first occurrence of data, or nothing happens if it is absent.
+        """
+        try:
+            position = self.find_first(data)
+        except ValueError:
+            return
+        self.insert(position + 1, new_data)
+
+    def insert_array(self, index, array):
+        """
+        Inserts an array of data at a specified index in the list.
+
+        Preconditions: True
+        Input:
+            - index, an integer specifying the position in the list where the array should be inserted.
+            - array, a list of objects to be inserted into the list.
+        Postconditions: The data from the array is inserted at the specified position,
+                        or an error is raised if the index is invalid or input is not an array.
+        """
+        if not isinstance(array, list):
+            raise TypeError("Input is not an array")
+        if index < 0 or index > self.size:
+            raise ValueError("Index outside of list range")
+        if not array:
+            return
+        if index == self.size:
+            self.extend(array)
+            return
+        previous, block, offset = self._locate(index)
+        first, last = self._blocks_from(block.items[:offset] + array + block.items[offset:], spread=True)
+        last.next = block.next
+        if previous is None:
+            self.head = first
+        else:
+            previous.next = first
+        if block is self.tail:
+            self.tail = last
+        self.size += len(array)
+
+    def delete_item(self, index):
+        """
+        Deletes the item at the specified index from the list.
+
+        Preconditions: True
+        Input: index, an integer indicating the position of the item to be deleted.
+        Postconditions: The item at the specified index is removed from the list,
+                        or an error is raised if the index is invalid.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        previous, block, offset = self._locate(index)
+        del block.items[offset]
+        self._rebalance(previous, block)
+        self.size -= 1
+
+    def replace_position(self, index: int, data):
+        """
+        Replaces the data at a specified position in the list.
+
+        Preconditions: True
+        Input:
+            - index, an integer specifying the position in the list.
+            - data, the new data to be placed at the specified position.
+        Postconditions: The data at the specified position is replaced,
+                        or an error is raised if the index is invalid.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError("Index outside of list range")
+        _, block, offset = self._locate(index)
+        block.items[offset] = data
+
+    def replace_all(self, old, new):
+        """
+        Replaces all occurrences of a specified value with a new value in the list.
+
+        Preconditions: True
+        Input:
+            - old, the value to be replaced.
+            - new, the value to replace with.
+        Postconditions: All instances of 'old' in the list are replaced with 'new'.
+        """
+        block = self.head
+        while block is not None:
+            items = block.items
+            for i, item in enumerate(items):
+                if item == old:
+                    items[i] = new
+            block = block.next
+
+    def clear_all(self, confirm=False):
+        """
+        Clears all elements from the list.
+
+        Preconditions: True
+        Input: confirm, a boolean indicating whether to proceed with clearing the list.
+        Postconditions: If confirm is True, the list is cleared; otherwise, nothing happens.
+        """
+        if confirm:
+            self.head = None
+            self.tail = None
+            self.size = 0
+        else:
+            print("Clear operation cancelled. Set confirm=True to clear the list.")
+
+    def print(self):
+        """
+        Prints the elements of the list.
+
+        Preconditions: True
+        Output: Prints each element of the list followed by an arrow, ending with 'None'.
+        """
+        for data in self:
+            print(data, end=" -> ")
+        print("None")